@@ -0,0 +1,319 @@
+import sys
+import json
+import sqlite3
+import threading
+
+from article_store import ArticleStore, published_ts_of, day_of, day_start
+
+# ✅ 기사 카탈로그(SQLite) 설정
+CATALOG_FILE = "news_catalog.db"
+FTS_MIN_QUERY = 3  # trigram FTS는 3글자 이상 검색어만 색인 검색 가능 (짧으면 LIKE로 대체)
+ITER_BATCH = 1000  # 전체 기사를 읽을 때 한 번에 가져오는 행 수 (가져오는 동안만 잠금을 잡음)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    url TEXT,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    source TEXT NOT NULL,
+    category TEXT NOT NULL,
+    date TEXT,
+    keywords TEXT NOT NULL DEFAULT '[]',
+    collected_at REAL,
+    canonical_id TEXT,
+    published_ts REAL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category);
+CREATE INDEX IF NOT EXISTS idx_articles_date ON articles(date);
+
+CREATE TABLE IF NOT EXISTS article_keywords (
+    keyword TEXT NOT NULL,
+    article_rowid INTEGER NOT NULL REFERENCES articles(rowid) ON DELETE CASCADE,
+    PRIMARY KEY (keyword, article_rowid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_article_keywords_rowid ON article_keywords(article_rowid);
+
+-- 수집기가 한 번의 실행을 모두 반영한 뒤 올리는 버전 (앱은 이 값이 바뀌면 색인을 다시 구성)
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, content, content='articles', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, content) VALUES ('delete', old.rowid, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, content) VALUES ('delete', old.rowid, old.title, old.content);
+    INSERT INTO articles_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+"""
+
+ARTICLE_COLUMNS = "id, url, title, content, source, category, date, keywords, collected_at, canonical_id, published_ts"
+
+# 이전 버전 카탈로그에 없는 열 (열 이름, 정의)
+MIGRATIONS = [("canonical_id", "TEXT"), ("published_ts", "REAL")]
+
+# 최신순 정렬/기간 조회용 색인 (이전 카탈로그는 열을 추가한 뒤에 만들어야 하므로 SCHEMA와 분리)
+POST_MIGRATION_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_ts);
+"""
+
+# 최신순 (게시 시각이 같으면 나중에 들어온 기사가 먼저)
+NEWEST_FIRST = "ORDER BY a.published_ts DESC, a.rowid DESC"
+
+
+def _row_to_article(row):
+    article = dict(row)
+    article["keywords"] = json.loads(article["keywords"])
+    return article
+
+
+# ✅ SQLite 기반 기사 카탈로그
+# - 언론사/카테고리/날짜/키워드 B-tree 색인 + 제목/본문 FTS5(trigram) 색인
+# - 필터/검색을 색인 질의(LIMIT/OFFSET)로 처리해 전체 JSON을 매번 읽지 않음
+# - 앱의 공유 메모리 색인(article_index.py)은 이 카탈로그를 최신순으로 읽어 만들고,
+#   본문은 메모리에 두지 않고 화면에 펼칠 때 rowid로 한 건씩 읽음
+# - 여러 Streamlit 스레드가 연결 하나를 공유하므로 질의는 잠금으로 직렬화
+class ArticleCatalog:
+    def __init__(self, path=CATALOG_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA foreign_keys=ON")
+            tables = {row[0] for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            self.conn.executescript(SCHEMA)
+            self._rebuild_missing_indexes(tables)
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(articles)")}
+            for column, definition in MIGRATIONS:
+                if column not in columns:
+                    self.conn.execute(f"ALTER TABLE articles ADD COLUMN {column} {definition}")
+            self.conn.executescript(POST_MIGRATION_SCHEMA)
+            backfilled = self._backfill_published_ts()
+        if backfilled:
+            self.bump_version()
+
+    # 질의용 색인 테이블 없이 만들어진 카탈로그는 기존 기사로 키워드/FTS 색인을 채움
+    def _rebuild_missing_indexes(self, tables):
+        if "articles" not in tables:
+            return
+        if "article_keywords" not in tables:
+            self.conn.execute(
+                """INSERT OR IGNORE INTO article_keywords (keyword, article_rowid)
+                SELECT k.value, a.rowid FROM articles a, json_each(a.keywords) k"""
+            )
+        if "articles_fts" not in tables:
+            self.conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+
+    # ✅ 게시 시각이 없는 이전 기사: date 문자열(잘린 RFC 822 포함)에서 복구하고 date도 "2025-05-12" 형식으로 정리
+    def _backfill_published_ts(self):
+        rows = self.conn.execute(
+            "SELECT rowid, date, collected_at FROM articles WHERE published_ts IS NULL"
+        ).fetchall()
+        updates = []
+        for row in rows:
+            published_ts = published_ts_of({"date": row["date"], "collected_at": row["collected_at"]})
+            updates.append((published_ts, day_of(published_ts), row["rowid"]))
+        self.conn.executemany("UPDATE articles SET published_ts = ?, date = ? WHERE rowid = ?", updates)
+        return len(updates)
+
+    def close(self):
+        self.conn.close()
+
+    # ✅ 기사 추가/갱신 (ID 기준)
+    def upsert_articles(self, articles):
+        rows = []
+        for a in articles:
+            published_ts = published_ts_of(a)
+            rows.append((
+                a["id"], a.get("url"), a["title"], a["content"], a["source"], a["category"],
+                day_of(published_ts), json.dumps(a.get("keywords", []), ensure_ascii=False),
+                a.get("collected_at"), a.get("canonical_id"), published_ts,
+            ))
+        with self._lock, self.conn:
+            self.conn.executemany(
+                f"""INSERT INTO articles ({ARTICLE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    url=excluded.url, title=excluded.title, content=excluded.content,
+                    source=excluded.source, category=excluded.category, date=excluded.date,
+                    keywords=excluded.keywords, collected_at=excluded.collected_at,
+                    canonical_id=excluded.canonical_id, published_ts=excluded.published_ts""",
+                rows,
+            )
+            # 키워드 색인: 이번 기사들의 이전 키워드를 지우고 다시 넣음 (rowid는 ID로 찾음)
+            self.conn.executemany(
+                "DELETE FROM article_keywords WHERE article_rowid = (SELECT rowid FROM articles WHERE id = ?)",
+                [(a["id"],) for a in articles],
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO article_keywords (keyword, article_rowid) SELECT ?, rowid FROM articles WHERE id = ?",
+                [(kw, a["id"]) for a in articles for kw in a.get("keywords", [])],
+            )
+
+    def update_canonical_ids(self, pairs):
+        with self._lock, self.conn:
+            self.conn.executemany("UPDATE articles SET canonical_id = ? WHERE id = ?", [(c, i) for i, c in pairs])
+
+    def remove_articles(self, ids):
+        with self._lock, self.conn:
+            self.conn.executemany("DELETE FROM articles WHERE id = ?", [(article_id,) for article_id in ids])
+
+    # ✅ 보존 기간 정책: 경계 시각보다 먼저 게시된 기사 삭제 (게시 시각 색인 범위 삭제), 삭제한 ID 반환
+    # keep에 있는 기사(사용자가 스크랩/요약한 기사)는 경계보다 오래돼도 남김
+    def remove_before(self, cutoff, keep=()):
+        with self._lock, self.conn:
+            rows = self.conn.execute(
+                "DELETE FROM articles WHERE published_ts < ? AND id NOT IN (SELECT value FROM json_each(?)) RETURNING id",
+                (cutoff, json.dumps(list(keep))),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # 기사 ID 또는 그룹 대표 ID 목록 → 해당 기사와 같은 그룹(유사 중복) 기사 ID 전체
+    # (스크랩/요약은 그룹 대표 ID로 저장되므로 대표 기사가 없어도 그룹의 다른 기사가 남아야 함)
+    def group_members(self, ids):
+        ids = json.dumps(list(ids))
+        with self._lock:
+            rows = self.conn.execute(
+                """SELECT id FROM articles WHERE id IN (SELECT value FROM json_each(?))
+                OR canonical_id IN (SELECT value FROM json_each(?))""",
+                (ids, ids),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    # ✅ 카탈로그 버전 (기사 추가/삭제를 모두 마친 뒤 한 번 올림)
+    def version(self):
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM catalog_meta WHERE key = 'version'").fetchone()
+        return row[0] if row else 0
+
+    def bump_version(self):
+        with self._lock, self.conn:
+            self.conn.execute(
+                """INSERT INTO catalog_meta (key, value) VALUES ('version', 1)
+                ON CONFLICT(key) DO UPDATE SET value = value + 1"""
+            )
+
+    # ✅ 필터 조건 → WHERE 절 (비어 있는 조건은 적용하지 않음, 기간은 "2025-05-12" 형식이고 양 끝 포함)
+    def _where(self, categories=None, sources=None, keyword=None, search=None, date_from=None, date_to=None):
+        clauses, params = [], []
+        if date_from:
+            clauses.append("a.published_ts >= ?")
+            params.append(day_start(date_from))
+        if date_to:
+            clauses.append("a.published_ts < ?")
+            params.append(day_start(date_to) + 86400)
+        if categories:
+            clauses.append(f"a.category IN ({','.join('?' * len(categories))})")
+            params.extend(categories)
+        if sources:
+            clauses.append(f"a.source IN ({','.join('?' * len(sources))})")
+            params.extend(sources)
+        if keyword:
+            clauses.append("a.rowid IN (SELECT article_rowid FROM article_keywords WHERE keyword = ?)")
+            params.append(keyword)
+        if search:
+            if len(search) >= FTS_MIN_QUERY:
+                clauses.append("a.rowid IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+                params.append('"' + search.replace('"', '""') + '"')
+            else:
+                pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                clauses.append("(a.title LIKE ? ESCAPE '\\' OR a.content LIKE ? ESCAPE '\\')")
+                params.extend([pattern, pattern])
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+    # ✅ 필터/검색 결과 (최신순, LIMIT/OFFSET 지원)
+    def query(self, categories=None, sources=None, keyword=None, search=None, date_from=None, date_to=None,
+              limit=None, offset=0):
+        where, params = self._where(categories, sources, keyword, search, date_from, date_to)
+        sql = f"SELECT {ARTICLE_COLUMNS} FROM articles a{where} {NEWEST_FIRST}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        with self._lock:
+            return [_row_to_article(row) for row in self.conn.execute(sql, params)]
+
+    def count(self, categories=None, sources=None, keyword=None, search=None, date_from=None, date_to=None):
+        where, params = self._where(categories, sources, keyword, search, date_from, date_to)
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM articles a{where}", params).fetchone()[0]
+
+    def get_articles(self, ids):
+        ids = list(ids)
+        if not ids:
+            return []
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT {ARTICLE_COLUMNS} FROM articles WHERE id IN ({','.join('?' * len(ids))}) ORDER BY rowid",
+                ids,
+            ).fetchall()
+        return [_row_to_article(row) for row in rows]
+
+    # 본문만 따로 조회 (메모리 색인은 본문을 들고 있지 않음)
+    def get_content(self, rowid):
+        with self._lock:
+            row = self.conn.execute("SELECT content FROM articles WHERE rowid = ?", (rowid,)).fetchone()
+        return row[0] if row else ""
+
+    # 전체 기사를 최신순으로 하나씩 읽기 (메모리 색인 구성용, 게시 시각 색인을 따라 읽으므로 정렬 비용 없음)
+    # ITER_BATCH개씩 가져온 뒤 잠금을 놓고 넘겨주므로 읽는 동안에도 다른 세션의 조회가 막히지 않음
+    # 다음 묶음은 마지막으로 읽은 (게시 시각, rowid) 다음부터 이어서 읽음
+    def iter_articles(self):
+        sql = f"SELECT a.rowid, {ARTICLE_COLUMNS} FROM articles a"
+        after = ""
+        params = []
+        while True:
+            with self._lock:
+                rows = self.conn.execute(f"{sql}{after} {NEWEST_FIRST} LIMIT ?", params + [ITER_BATCH]).fetchall()
+            for row in rows:
+                yield _row_to_article(row)
+            if len(rows) < ITER_BATCH:
+                return
+            last = rows[-1]
+            after = " WHERE (a.published_ts, a.rowid) < (?, ?)"
+            params = [last["published_ts"], last["rowid"]]
+
+    # ✅ 사이드바 선택지 (색인에서 바로 조회)
+    def categories(self):
+        return self._distinct("SELECT DISTINCT category FROM articles ORDER BY category")
+
+    def sources(self):
+        return self._distinct("SELECT DISTINCT source FROM articles ORDER BY source")
+
+    def keywords(self):
+        return self._distinct("SELECT DISTINCT keyword FROM article_keywords ORDER BY keyword")
+
+    def _distinct(self, sql):
+        with self._lock:
+            return [row[0] for row in self.conn.execute(sql)]
+
+    # ✅ 기사 저장소(날짜별 파일) 일괄 가져오기
+    def import_store(self, store):
+        articles = store.load()
+        self.upsert_articles(articles)
+        self.bump_version()
+        return len(articles)
+
+
+# ✅ 1회성 가져오기: python scripts/article_catalog.py [news_articles.json]
+# 저장소(news_partitions)가 비어 있으면 이전 버전 스냅샷 파일을 먼저 날짜별 파일로 옮긴 뒤 가져옴
+if __name__ == "__main__":
+    snapshot_file = sys.argv[1] if len(sys.argv) > 1 else "news_articles.json"
+    store = ArticleStore(legacy_snapshot=snapshot_file)
+    if not store.partitions():
+        print(f"❌ 뉴스 파일 {snapshot_file}이 존재하지 않습니다.")
+        sys.exit(1)
+    catalog = ArticleCatalog()
+    imported = catalog.import_store(store)
+    print(f"✅ {imported}개 기사를 {catalog.path}에 가져왔습니다.")
@@ -0,0 +1,191 @@
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from article_store import day_of
+
+
+# ✅ 모든 세션이 공유하는 읽기 전용 기사 색인 (열 단위 배열 + 역색인)
+# - 기사 한 건을 dict로 들고 있지 않고 열(column)별 리스트/배열로 보관
+# - 언론사/카테고리는 정수 코드 배열, 소문자 검색 문자열은 구성 시 한 번만 계산
+# - 카테고리/언론사/키워드/게시 날짜 → 기사 위치 역색인으로 필터 후보를 바로 구함
+# - 기사는 최신순으로 받아 위치 순서 자체가 최신순 (필터 결과를 매번 다시 정렬하지 않음)
+# - 본문은 들고 있지 않고 필요할 때 카탈로그에서 rowid로 읽음
+class ArticleIndex:
+    __slots__ = (
+        "ids", "rowids", "titles", "dates", "keywords", "search_text",
+        "source_codes", "category_codes", "source_names", "category_names",
+        "by_source", "by_category", "by_keyword", "by_day", "days", "positions", "keyword_names",
+        "canonical_ids", "groups",
+    )
+
+    def __init__(self):
+        self.ids = []
+        self.rowids = array("q")
+        self.titles = []
+        self.dates = []
+        self.keywords = []
+        self.search_text = []
+        self.source_codes = array("H")
+        self.category_codes = array("H")
+        self.source_names = []
+        self.category_names = []
+        self.by_source = {}
+        self.by_category = {}
+        self.by_keyword = {}
+        self.by_day = {}     # 게시 날짜("2025-05-12") → 기사 위치 목록
+        self.days = []       # 기사가 있는 날짜 (오래된 날짜부터)
+        self.positions = {}
+        self.keyword_names = []
+        self.canonical_ids = []
+        self.groups = {}  # 대표 기사 ID → 같은 기사(유사 중복) 위치 목록
+
+    # articles는 최신순이어야 함 (카탈로그 iter_articles 순서)
+    @classmethod
+    def from_articles(cls, articles):
+        index = cls()
+        source_lookup, category_lookup = {}, {}
+        for position, a in enumerate(articles):
+            index.ids.append(a["id"])
+            index.rowids.append(a.get("rowid", position))
+            index.titles.append(sys.intern(a["title"]))
+            day = sys.intern(day_of(a["published_ts"]) if a.get("published_ts") is not None else a.get("date") or "")
+            index.dates.append(day)
+            keywords = tuple(sys.intern(kw) for kw in a.get("keywords", []))
+            index.keywords.append(keywords)
+            index.search_text.append((a["title"] + a["content"]).lower())
+            index.source_codes.append(cls._code(a["source"], source_lookup, index.source_names))
+            index.category_codes.append(cls._code(a["category"], category_lookup, index.category_names))
+            index.positions[a["id"]] = position
+            canonical_id = sys.intern(a.get("canonical_id") or a["id"])
+            index.canonical_ids.append(canonical_id)
+            index.groups.setdefault(canonical_id, array("I")).append(position)
+
+            index.by_source.setdefault(a["source"], array("I")).append(position)
+            index.by_category.setdefault(a["category"], array("I")).append(position)
+            index.by_day.setdefault(day, array("I")).append(position)
+            for kw in set(keywords):
+                index.by_keyword.setdefault(kw, array("I")).append(position)
+        index.keyword_names = sorted(index.by_keyword)
+        index.days = sorted(index.by_day)
+        return index
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        return cls.from_articles(catalog.iter_articles())
+
+    @staticmethod
+    def _code(name, lookup, names):
+        if name not in lookup:
+            lookup[name] = len(names)
+            names.append(sys.intern(name))
+        return lookup[name]
+
+    def __len__(self):
+        return len(self.ids)
+
+    # ✅ 사이드바 선택지
+    def categories(self):
+        return sorted(self.category_names)
+
+    def sources(self):
+        return sorted(self.source_names)
+
+    def all_keywords(self):
+        return self.keyword_names
+
+    # 기간에 걸친 날짜 목록 (날짜는 "2025-05-12" 형식, 양 끝 포함, None이면 제한 없음)
+    def days_between(self, date_from=None, date_to=None):
+        start = bisect_left(self.days, date_from) if date_from else 0
+        end = bisect_right(self.days, date_to) if date_to else len(self.days)
+        return self.days[start:end]
+
+    def _union(self, postings, names):
+        positions = set()
+        for name in names:
+            positions.update(postings.get(name, ()))
+        return positions
+
+    # ✅ 필터 적용 → 조건에 맞는 기사 위치 목록 (최신순)
+    # 기간은 해당 날짜의 위치 목록만 합치고, 전체 날짜를 덮는 기간이면 조건을 적용하지 않음
+    def filter(self, categories=None, sources=None, keyword=None, search=None, date_from=None, date_to=None):
+        candidates = None
+        days = self.days_between(date_from, date_to)
+        if len(days) < len(self.days):
+            candidates = self._union(self.by_day, days)
+        for postings, names in ((self.by_category, categories), (self.by_source, sources)):
+            if names:
+                matched = self._union(postings, names)
+                candidates = matched if candidates is None else candidates & matched
+        if keyword:
+            matched = set(self.by_keyword.get(keyword, ()))
+            candidates = matched if candidates is None else candidates & matched
+
+        positions = range(len(self.ids)) if candidates is None else sorted(candidates)
+        if search:
+            needle = search.lower()
+            search_text = self.search_text
+            positions = [i for i in positions if needle in search_text[i]]
+        return list(positions)
+
+    # ✅ 검색 순위: 검색어가 들어 있거나 유사도 점수가 0보다 큰 기사만 남기고 점수 내림차순 (같으면 수집 순서)
+    # scores는 positions와 같은 순서의 검색어 유사도 (similarity_index.SimilarityIndex.scores)
+    # 점수가 0인 기사만 부분 문자열을 확인하므로 검색어와 관련된 기사가 많을수록 빨라짐
+    def rank(self, positions, search, scores):
+        positions = np.asarray(positions, dtype=np.int64)
+        scores = np.asarray(scores)
+        keep = scores > 0
+        needle = search.lower()
+        search_text = self.search_text
+        for i in np.flatnonzero(~keep).tolist():
+            keep[i] = needle in search_text[positions[i]]
+        positions, scores = positions[keep], scores[keep]
+        return positions[np.argsort(-scores, kind="stable")].tolist()
+
+    # ✅ 같은 그룹(유사 중복)의 기사는 필터 결과에서 처음 나온 하나만 남김
+    def collapse(self, positions):
+        seen = set()
+        collapsed = []
+        for position in positions:
+            canonical_id = self.canonical_ids[position]
+            if canonical_id not in seen:
+                seen.add(canonical_id)
+                collapsed.append(position)
+        return collapsed
+
+    # 그룹 대표 기사 ID (스크랩/요약 키, 대표 기사가 보존 기간으로 삭제돼도 그룹 이름으로 그대로 유지)
+    def group_id(self, position):
+        return self.canonical_ids[position]
+
+    # 기사 ID 또는 그룹 대표 ID → 위치
+    # 대표 기사가 삭제된 그룹은 남은 기사 중 가장 먼저 게시된 기사, 어느 쪽도 없으면 None
+    def position_of(self, article_id):
+        position = self.positions.get(article_id)
+        if position is None and article_id in self.groups:
+            position = self.groups[article_id][-1]
+        return position
+
+    # ✅ 위치 → 화면 표시용 기사 정보 (본문 제외)
+    def article(self, position):
+        group = self.groups.get(self.canonical_ids[position], ())
+        return {
+            "id": self.ids[position],
+            "rowid": self.rowids[position],
+            "group_id": self.group_id(position),
+            "group_rowid": self.rowids[self.position_of(self.group_id(position))],
+            "also_in": sorted({self.source_names[self.source_codes[p]] for p in group if p != position}),
+            "title": self.titles[position],
+            "source": self.source_names[self.source_codes[position]],
+            "category": self.category_names[self.category_codes[position]],
+            "date": self.dates[position],
+            "keywords": list(self.keywords[position]),
+        }
+
+    def articles(self, positions):
+        return [self.article(position) for position in positions]
+
+    # 스크랩/요약 목록의 ID(기사 또는 그룹 대표 ID) → 기사 정보 (최신순, 같은 기사는 한 번만)
+    def lookup(self, ids):
+        return self.articles(sorted({p for p in map(self.position_of, ids) if p is not None}))
@@ -0,0 +1,254 @@
+import os
+import json
+import time
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# ✅ 기사 저장소 설정
+PARTITION_DIR = "news_partitions"      # 게시 날짜별 기사 파일 (news_partitions/2025-05-12.json)
+SNAPSHOT_FILE = "news_articles.json"   # 이전 버전의 전체 기사 스냅샷 (처음 한 번 날짜별 파일로 옮김)
+DELTA_DIR = "news_deltas"              # 이전 버전의 수집 실행별 새 기사 폴더
+MIGRATED_MARKER = ".migrated"          # 이전 버전 저장소를 옮긴 뒤 날짜 폴더에 남기는 표시 파일
+MANIFEST_FILE = ".manifest.json"       # 기사 ID → 날짜 목록 (수집할 때마다 저장소 전체를 읽지 않도록)
+RETENTION_DAYS = 30                    # 게시 후 이 기간이 지난 날짜 파일은 통째로 삭제 (사용자가 스크랩/요약한 기사는 남김)
+RECOVERY_MONTHS = 12 * 12              # 잘린 날짜 복구 시 거슬러 올라가는 개월 수 (같은 요일·일·월 조합이 다시 나오는 주기 이상)
+
+# ✅ 날짜 구분 기준 시간대 (한국 시간, 사이드바 기간 필터와 날짜 파일이 같은 날짜 경계를 씀)
+LOCAL_TZ = timezone(timedelta(hours=9))
+
+# URL에서 제거할 추적용 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "from", "rss", "rssfeed"}
+
+
+# ✅ 정규화된 URL (같은 기사가 매번 같은 ID를 갖도록)
+def canonical_url(url):
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "http"
+    host = parts.hostname.lower() if parts.hostname else ""
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+# ✅ 기사 ID = 정규화된 URL의 해시 (실행마다 바뀌지 않음)
+def article_id(url):
+    return hashlib.sha1(canonical_url(url).encode("utf-8")).hexdigest()[:16]
+
+
+# ✅ 게시 시각 문자열 → UTC epoch 초 (RFC 822 "Mon, 12 May 2025 09:00:00 +0900" 또는 ISO 8601)
+# 시간대가 없으면 한국 시간으로 보고, 해석할 수 없으면 None
+def parse_timestamp(text):
+    text = (text or "").strip()
+    if not text:
+        return None
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=LOCAL_TZ)
+    return parsed.timestamp()
+
+
+# ✅ 이전 버전이 앞 10글자만 저장한 RFC 822 날짜("Mon, 12 Ma") 복구
+# 요일이 맞는 달 중에서 기준 시각(수집 시각) 이전의 가장 가까운 날짜를 고름 (연도/월 이름이 잘려 있으므로)
+def recover_truncated_date(text, reference):
+    parts = (text or "").replace(",", " ").split()
+    if len(parts) != 3 or not parts[1].isdigit():
+        return None
+    weekday, day, month_prefix = parts[0][:3].lower(), int(parts[1]), parts[2].lower()
+    reference_day = datetime.fromtimestamp(reference, LOCAL_TZ).date()
+    for months_back in range(RECOVERY_MONTHS):
+        year, month = divmod(reference_day.year * 12 + reference_day.month - 1 - months_back, 12)
+        try:
+            candidate = datetime(year, month + 1, day, tzinfo=LOCAL_TZ)
+        except ValueError:
+            continue
+        if (candidate.date() <= reference_day and candidate.strftime("%b").lower().startswith(month_prefix)
+                and candidate.strftime("%a").lower() == weekday):
+            return candidate.timestamp()
+    return None
+
+
+# 기사의 게시 시각 (이전 기사는 date 문자열에서 복구하고, 그래도 없으면 수집 시각)
+def published_ts_of(article, now=None):
+    if article.get("published_ts") is not None:
+        return article["published_ts"]
+    fallback = article.get("collected_at") or (time.time() if now is None else now)
+    date = article.get("date")
+    return parse_timestamp(date) or recover_truncated_date(date, fallback) or fallback
+
+
+# ✅ epoch 초 → 날짜 파일 이름/화면 표시용 날짜 (한국 시간 기준 "2025-05-12")
+def day_of(timestamp):
+    return datetime.fromtimestamp(timestamp, LOCAL_TZ).strftime("%Y-%m-%d")
+
+
+def day_start(day):
+    return datetime.strptime(day, "%Y-%m-%d").replace(tzinfo=LOCAL_TZ).timestamp()
+
+
+# ✅ 보존 기간 경계: 이 날짜(한국 시간 자정)보다 먼저 게시된 기사는 삭제 대상
+def retention_cutoff(retention_days=RETENTION_DAYS, now=None):
+    now = time.time() if now is None else now
+    return day_start(day_of(now - retention_days * 86400))
+
+
+def _write_json_atomic(path, data, indent=None):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+    os.replace(tmp_path, path)
+
+
+# ✅ 게시 날짜별로 나눈 기사 저장소
+# - 기사는 게시 날짜(한국 시간) 파일 news_partitions/<날짜>.json 에 저장 (원자적 교체)
+# - 새 기사가 들어오면 해당 날짜 파일만 다시 씀 (대부분 오늘/어제 파일 1~2개)
+# - 중복 확인은 기사 ID → 날짜 목록 파일로 하므로 수집 실행마다 날짜 파일 전체를 읽지 않음
+# - 기간 조회는 그 기간의 날짜 파일만 읽고, 보존 기간이 지난 날짜는 파일을 지우기만 하면 됨
+# - 이전 버전 저장소(스냅샷 + 델타)가 있으면 처음 한 번 날짜별 파일로 옮김 (원본 파일은 그대로 둠)
+#   옮긴 뒤 표시 파일을 남기므로 보존 기간 정리로 날짜 파일이 모두 지워져도 다시 옮기지 않음
+# - 이전 버전에서 만든 기사(uuid ID, url 없음)도 그대로 유지되어 기존 요약/스크랩이 계속 연결됨
+class ArticleStore:
+    def __init__(self, partition_dir=PARTITION_DIR, legacy_snapshot=SNAPSHOT_FILE, legacy_delta_dir=DELTA_DIR):
+        self.partition_dir = partition_dir
+        self.legacy_snapshot = legacy_snapshot
+        self.legacy_delta_dir = legacy_delta_dir
+        self._manifest = None
+        os.makedirs(partition_dir, exist_ok=True)
+        marker = os.path.join(partition_dir, MIGRATED_MARKER)
+        if not os.path.exists(marker):
+            if not self.partitions():
+                self._migrate_legacy()
+            open(marker, "w").close()
+
+    def _path(self, day):
+        return os.path.join(self.partition_dir, day + ".json")
+
+    def _read(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    # ✅ 저장된 날짜 목록 (오래된 날짜부터)
+    def partitions(self):
+        return sorted(
+            name[:-5] for name in os.listdir(self.partition_dir) if name.endswith(".json") and not name.startswith(".")
+        )
+
+    # ✅ 기사 읽기 (날짜를 주면 그 기간의 파일만 읽음, 날짜는 "2025-05-12" 형식이고 양 끝 포함)
+    def load(self, date_from=None, date_to=None):
+        articles = []
+        for day in self.partitions():
+            if (date_from is None or day >= date_from) and (date_to is None or day <= date_to):
+                articles.extend(self._read(self._path(day)))
+        return articles
+
+    # ✅ 저장된 기사 ID 목록 (목록 파일만 읽음)
+    def known_ids(self):
+        return set(self._load_manifest())
+
+    def _load_manifest(self):
+        if self._manifest is None:
+            try:
+                with open(self._manifest_path(), "r", encoding="utf-8") as f:
+                    self._manifest = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                # 목록 파일이 없으면(이전 버전에서 만든 날짜 파일) 한 번만 전체를 읽어 다시 만듦
+                self._manifest = {a["id"]: day for day in self.partitions() for a in self._read(self._path(day))}
+                self._save_manifest()
+        return self._manifest
+
+    def _save_manifest(self):
+        _write_json_atomic(self._manifest_path(), self._manifest)
+
+    def _manifest_path(self):
+        return os.path.join(self.partition_dir, MANIFEST_FILE)
+
+    # ✅ 기사를 게시 날짜 파일에 저장 (이번에 바뀌는 날짜 파일만 읽고 다시 씀)
+    # replace=False이면 이미 있는 ID는 건너뛰고, True이면 새 내용으로 교체 (캐시에서 다시 추출한 경우)
+    # 저장한 기사 목록을 반환
+    def append(self, articles, replace=False):
+        manifest = self._load_manifest()
+        saved = {}
+        for article in articles:
+            if article["id"] in manifest and not replace:
+                continue
+            article["published_ts"] = published_ts_of(article)
+            saved[article["id"]] = article
+
+        by_day = {}
+        for article in saved.values():
+            by_day.setdefault(day_of(article["published_ts"]), []).append(article)
+        # 교체되는 기사의 이전 날짜 파일에서도 빼야 하므로 (게시 시각이 바뀐 경우) 함께 다시 씀
+        touched = set(by_day) | {manifest[article_id] for article_id in saved if article_id in manifest}
+        for day in touched:
+            kept = [a for a in self._read(self._path(day)) if a["id"] not in saved]
+            if kept or by_day.get(day):
+                _write_json_atomic(self._path(day), kept + by_day.get(day, []))
+            elif os.path.exists(self._path(day)):
+                os.remove(self._path(day))
+
+        if saved:
+            manifest.update({article_id: day_of(a["published_ts"]) for article_id, a in saved.items()})
+            self._save_manifest()
+        return list(saved.values())
+
+    # ✅ 보존 기간 정책: 경계 날짜보다 오래된 날짜 파일 삭제 (기사 수와 관계없이 파일 하나당 삭제 1번)
+    # keep에 있는 기사(사용자가 스크랩/요약한 기사)는 남김: 그 날짜 파일은 남길 기사만으로 다시 쓰고,
+    # 남길 기사만 있는 날짜 파일은 읽지 않고 그대로 둠 (날짜별 기사 ID는 목록 파일에서 확인)
+    # 삭제하거나 다시 쓴 날짜 목록을 반환 (카탈로그/색인은 같은 경계 시각으로 정리)
+    def drop_before(self, cutoff, keep=()):
+        cutoff_day = day_of(cutoff)
+        keep = set(keep)
+        manifest = self._load_manifest()
+        ids_by_day = {}
+        for article_id, day in manifest.items():
+            if day < cutoff_day:
+                ids_by_day.setdefault(day, []).append(article_id)
+
+        dropped = []
+        for day in self.partitions():
+            if day >= cutoff_day:
+                continue
+            ids = ids_by_day.get(day, [])
+            if ids and all(article_id in keep for article_id in ids):
+                continue
+            if any(article_id in keep for article_id in ids):
+                _write_json_atomic(self._path(day), [a for a in self._read(self._path(day)) if a["id"] in keep])
+            else:
+                os.remove(self._path(day))
+            dropped.append(day)
+        if dropped:
+            self._manifest = {i: day for i, day in manifest.items() if day >= cutoff_day or i in keep}
+            self._save_manifest()
+        return dropped
+
+    # 이전 버전 저장소(스냅샷 + 델타)를 ID 기준으로 병합해 날짜별 파일로 나눔
+    def _migrate_legacy(self):
+        merged = {}
+        delta_files = []
+        if os.path.isdir(self.legacy_delta_dir):
+            delta_files = sorted(name for name in os.listdir(self.legacy_delta_dir) if name.endswith(".json"))
+        for path in [self.legacy_snapshot] + [os.path.join(self.legacy_delta_dir, name) for name in delta_files]:
+            for article in self._read(path):
+                merged[article["id"]] = article
+        if not merged:
+            return
+
+        now = time.time()
+        for article in merged.values():
+            article["published_ts"] = published_ts_of(article, now)
+            article["date"] = day_of(article["published_ts"])
+        self.append(merged.values())
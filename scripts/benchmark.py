@@ -0,0 +1,597 @@
+import os
+import sys
+import json
+import math
+import time
+import platform
+import argparse
+import subprocess
+import pickle
+import tempfile
+import statistics
+import tracemalloc
+import multiprocessing
+
+import pandas as pd
+
+from synthetic_corpus import generate_articles, write_snapshot, SOURCES
+from fake_news_server import FakeNewsServer
+from article_store import ArticleStore
+from article_catalog import ArticleCatalog
+from article_index import ArticleIndex
+import textrank
+from keywords import KeywordExtractor
+from user_store import UserStore
+from similarity_index import SimilarityIndex, article_text
+
+# ✅ 성능 벤치마크 모음
+# 사용법: python scripts/benchmark.py <이름|all> --size 100000 [--output result.json] [--compare baseline.json]
+# 결과 JSON에는 커밋/파이썬/플랫폼 정보가 함께 기록되어 커밋 간 결과를 비교할 수 있음
+
+APP_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit_app.py")
+
+
+def timed(fn, repeat=5):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+# 기존 앱과 같은 방식: 기사 목록 전체를 파이썬 컴프리헨션으로 필터
+def _legacy_filter(articles, categories, sources, keyword, search):
+    return [
+        a for a in articles if
+        (a["category"] in categories if categories else True)
+        and (a["source"] in sources if sources else True)
+        and (keyword is None or keyword in a.get("keywords", []))
+        and (search.lower() in (a["title"] + a["content"]).lower())
+    ]
+
+
+# 기존 앱과 같은 방식: JSON 전체 로드 후 필터
+def _json_filter(json_path, categories, sources, keyword, search):
+    with open(json_path, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+    return _legacy_filter(articles, categories, sources, keyword, search)
+
+
+FILTER_QUERIES = {
+    "category_source": dict(categories=["정치"], sources=["연합뉴스"], keyword=None, search=""),
+    "keyword": dict(categories=[], sources=[], keyword="반도체", search=""),
+    "search_fts": dict(categories=[], sources=[], keyword=None, search="인공지능"),
+    "search_short": dict(categories=[], sources=[], keyword=None, search="금리"),
+}
+
+
+# ✅ JSON 전체 로드 + 필터 vs SQLite/FTS5 카탈로그 질의 vs 앱과 같은 경로(카탈로그에서 만든 공유 색인 필터 + 본문은 한 건씩 조회)
+def bench_catalog(size, repeat=5, page=20):
+    articles = generate_articles(size)
+    queries = FILTER_QUERIES
+    result = {"benchmark": "catalog", "size": size, "queries": {}}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, "news_articles.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(articles, f, ensure_ascii=False)
+
+        started = time.perf_counter()
+        catalog = ArticleCatalog(os.path.join(workdir, "news_catalog.db"))
+        catalog.upsert_articles(articles)
+        result["catalog_import_s"] = round(time.perf_counter() - started, 3)
+        result["catalog_bytes"] = os.path.getsize(catalog.path)
+
+        index = ArticleIndex.from_catalog(catalog)
+        for name, q in queries.items():
+            positions = index.filter(**q)
+            result["queries"][name] = {
+                "json_full_scan_ms": timed(lambda: _json_filter(json_path, **q), repeat),
+                "catalog_page_ms": timed(lambda: catalog.query(**q, limit=page, offset=0), repeat),
+                "catalog_count_ms": timed(lambda: catalog.count(**q), repeat),
+                "index_filter_ms": timed(lambda: index.filter(**q), repeat),
+                "page_content_ms": timed(lambda: [catalog.get_content(index.rowids[p]) for p in positions[:page]], repeat),
+                "matches": len(positions),
+            }
+        catalog.close()
+    return result
+
+
+def _retained_bytes(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+# ✅ 세션별 메모리 비교
+# - 기존: st.cache_data가 호출마다 역직렬화한 사본을 주고 그 사본을 session_state에 보관
+# - 변경: st.cache_resource로 공유하는 ArticleIndex 하나, 세션은 참조와 필터 결과만 보관
+def bench_index_memory(size, repeat=5, sessions=10):
+    articles = generate_articles(size)
+    payload = pickle.dumps(articles)
+
+    index_bytes = _retained_bytes(lambda: ArticleIndex.from_articles(articles))
+    index = ArticleIndex.from_articles(articles)
+
+    old_bytes = _retained_bytes(lambda: [pickle.loads(payload) for _ in range(sessions)])
+    new_bytes = _retained_bytes(lambda: [{"index": index, "page": index.filter()[:20]} for _ in range(sessions)])
+    return {
+        "benchmark": "index_memory",
+        "size": size,
+        "sessions": sessions,
+        "shared_index_bytes": index_bytes,
+        "old_per_session_bytes": old_bytes // sessions,
+        "new_per_session_bytes": new_bytes // sessions,
+        "filter_all_ms": timed(lambda: index.filter(), repeat),
+        "filter_search_ms": timed(lambda: index.filter(search="인공지능"), repeat),
+        "filter_category_keyword_ms": timed(lambda: index.filter(categories=["정치"], keyword="반도체"), repeat),
+    }
+
+
+def _payload_bytes(node):
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if proto is not None and hasattr(proto, "ByteSize") else 0
+    children = getattr(node, "children", {})
+    return size + sum(_payload_bytes(child) for child in children.values())
+
+
+# ✅ 메인 피드 재실행(rerun) 시간과 화면 전송량 (Streamlit AppTest로 로그인 상태의 앱 실행)
+def bench_feed_render(size, repeat=5):
+    from streamlit.testing.v1 import AppTest
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            catalog = ArticleCatalog()
+            catalog.upsert_articles(generate_articles(size))
+            catalog.close()
+            os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+            app = AppTest.from_file(APP_FILE, default_timeout=600)
+            app.session_state["logged_in"] = True
+            app.session_state["user_id"] = "benchmark"
+            app.session_state["username"] = "benchmark"
+            app.run()  # 첫 실행은 공유 색인 구성 포함
+            return {
+                "benchmark": "feed_render",
+                "size": size,
+                "rerun_ms": timed(app.run, repeat),
+                "buttons": len(app.button),
+                "payload_bytes": _payload_bytes(app._tree),
+            }
+        finally:
+            os.chdir(cwd)
+
+
+# ✅ TextRank 요약 처리량 (기사별 개별 요약 vs 코퍼스 일괄 요약)
+def bench_textrank(size, repeat=3):
+    texts = [a["content"] for a in generate_articles(size)]
+
+    started = time.perf_counter()
+    for text in texts:
+        textrank.summarize(text)
+    single_s = time.perf_counter() - started
+
+    batch_ms = timed(lambda: textrank.summarize_batch(texts), repeat)
+    return {
+        "benchmark": "textrank",
+        "size": size,
+        "single_articles_per_s": round(size / single_s, 1),
+        "single_ms_per_article": round(single_s / size * 1000, 3),
+        "batch_articles_per_s": round(size / (batch_ms / 1000), 1),
+    }
+
+
+# ✅ 키워드 추출 처리량 (기존 기사별 Counter 방식 vs 코퍼스 단위 TF-IDF)
+def bench_keywords(size, repeat=3):
+    from news_collect import extract_keywords
+
+    texts = [a["title"] + " " + a["content"] for a in generate_articles(size)]
+    legacy_ms = timed(lambda: [extract_keywords(text) for text in texts], repeat)
+    with tempfile.TemporaryDirectory() as workdir:
+        df_file = os.path.join(workdir, "keyword_df.json")
+        batch_ms = timed(lambda: KeywordExtractor(df_file=df_file).extract_batch(texts, update=False), repeat)
+    return {
+        "benchmark": "keywords",
+        "size": size,
+        "legacy_ms": legacy_ms,
+        "batch_ms": batch_ms,
+        "legacy_docs_per_s": round(size / (legacy_ms / 1000), 1),
+        "batch_docs_per_s": round(size / (batch_ms / 1000), 1),
+        "batch_speedup": round(legacy_ms / batch_ms, 2),  # 1 미만이면 기존 방식보다 느림 (조사 제거/IDF 계산 포함)
+    }
+
+
+def _user_store_worker(args):
+    path, worker, writes = args
+    store = UserStore(path=path, legacy_users_file=os.path.join(os.path.dirname(path), "users.json"))
+    won_signup = store.create_user("shared-user", "hash") is not None  # 같은 사용자명 동시 가입 → 하나만 성공
+    user_id = store.create_user(f"user-{worker}", "hash")
+    started = time.perf_counter()
+    for i in range(writes):
+        store.add_scrap(user_id, f"article-{i}")
+        store.set_summary(user_id, f"article-{i}", f"key-{worker}-{i}")
+        if i % 3 == 0:
+            store.remove_scrap(user_id, f"article-{i}")
+    elapsed = time.perf_counter() - started
+    store.close()
+    return user_id, won_signup, elapsed
+
+
+# 기존 앱과 같은 방식: 파일 전체를 읽고 한 건 추가한 뒤 다시 씀
+def _json_store_worker(args):
+    path, worker, writes = args
+    for i in range(writes):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                scraps = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            scraps = []
+        scraps.append(f"article-{worker}-{i}")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(scraps, f)
+
+
+# ✅ 여러 프로세스가 같은 사용자 저장소에 동시에 쓰는 스트레스 테스트 (유실/중복 확인 + 처리량)
+def bench_user_store(size, repeat=1, workers=8):
+    writes = max(1, size // workers)
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "user_data.db")
+        UserStore(path=path, legacy_users_file=os.path.join(workdir, "users.json")).close()
+        with multiprocessing.Pool(workers) as pool:
+            started = time.perf_counter()
+            results = pool.map(_user_store_worker, [(path, w, writes) for w in range(workers)])
+            elapsed = time.perf_counter() - started
+
+        store = UserStore(path=path, legacy_users_file=os.path.join(workdir, "users.json"))
+        expected_scraps = writes - len(range(0, writes, 3))
+        lost = sum(
+            (expected_scraps - len(store.scraps(user_id))) + (writes - len(store.summaries(user_id)))
+            for user_id, _, _ in results
+        )
+        store.close()
+
+        json_path = os.path.join(workdir, "scrap.json")
+        with multiprocessing.Pool(workers) as pool:
+            pool.map(_json_store_worker, [(json_path, w, writes) for w in range(workers)])
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                json_kept = len(json.load(f))
+        except json.JSONDecodeError:
+            json_kept = 0
+
+    operations = workers * (writes * 2 + len(range(0, writes, 3)))
+    return {
+        "benchmark": "user_store",
+        "workers": workers,
+        "writes_per_worker": writes,
+        "lost_writes": lost,
+        "shared_signup_winners": sum(won for _, won, _ in results),
+        "writes_per_s": round(operations / elapsed, 1),
+        "slowest_worker_s": round(max(t for _, _, t in results), 3),
+        "legacy_json_lost_writes": workers * writes - json_kept,
+    }
+
+
+# ✅ 기사 로딩 시간 (기존 json.load vs 날짜별 저장소 vs 카탈로그에서 공유 색인 구성)
+def bench_load_articles(size, repeat=3):
+    with tempfile.TemporaryDirectory() as workdir:
+        snapshot = os.path.join(workdir, "news_articles.json")
+        write_snapshot(snapshot, size)
+
+        def json_load():
+            with open(snapshot, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        store = ArticleStore(
+            partition_dir=os.path.join(workdir, "news_partitions"), legacy_snapshot=snapshot,
+            legacy_delta_dir=os.path.join(workdir, "news_deltas"),
+        )
+        catalog = ArticleCatalog(os.path.join(workdir, "news_catalog.db"))
+        catalog.import_store(store)
+        result = {
+            "benchmark": "load_articles",
+            "size": size,
+            "snapshot_bytes": os.path.getsize(snapshot),
+            "json_load_ms": timed(json_load, repeat),
+            "article_store_load_ms": timed(store.load, repeat),
+            "index_from_catalog_ms": timed(lambda: ArticleIndex.from_catalog(catalog), repeat),
+        }
+        catalog.close()
+    return result
+
+
+# ✅ 필터 지연 시간 (기존 리스트 컴프리헨션 vs 공유 색인의 역색인 필터 + 유사 중복 묶기)
+def bench_filter(size, repeat=5):
+    articles = generate_articles(size)
+    index = ArticleIndex.from_articles(articles)
+    result = {"benchmark": "filter", "size": size, "queries": {}}
+    for name, q in FILTER_QUERIES.items():
+        result["queries"][name] = {
+            "comprehension_ms": timed(lambda: _legacy_filter(articles, **q), repeat),
+            "index_ms": timed(lambda: index.collapse(index.filter(**q)), repeat),
+            "matches": len(index.filter(**q)),
+        }
+    return result
+
+
+# ✅ 유사도 색인 (구성/저장/불러오기, 검색 순위, 페이지 단위 관련 기사, 증분 추가)
+# 검색은 앱과 같은 경로(전체 후보 점수 + 부분 문자열 검사 + 정렬)를 기존 부분 문자열 필터와 비교
+def bench_similarity(size, repeat=5, page=20, new_articles=100):
+    articles = generate_articles(size + new_articles)
+    articles, extra = articles[:size], articles[size:]
+    article_index = ArticleIndex.from_articles(articles)
+    positions = list(range(len(articles)))
+    ids = [a["id"] for a in articles]
+    queries = ["반도체", "금리 물가", "대통령 선거 후보"]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "similarity_index.npz")
+        started = time.perf_counter()
+        index = SimilarityIndex(path=path)
+        index.add(ids, [article_text(a) for a in articles])
+        index.vectors()
+        build_s = time.perf_counter() - started
+        save_ms = timed(index.save, 1)
+        file_bytes = os.path.getsize(path)
+        load_ms = timed(lambda: SimilarityIndex(path=path).vectors(), repeat)
+
+        rows = index.rows(article_index.ids)
+
+        def ranked(query):
+            return article_index.rank(positions, query, index.scores(query, rows[positions]))
+
+        result = {
+            "benchmark": "similarity",
+            "size": size,
+            "build_s": round(build_s, 3),
+            "save_ms": save_ms,
+            "load_ms": load_ms,
+            "file_bytes": file_bytes,
+            "matrix_bytes": index.tf.data.nbytes + index.tf.indices.nbytes + index.tf.indptr.nbytes,
+            "queries": {
+                query: {
+                    "substring_ms": timed(lambda: article_index.filter(search=query), repeat),
+                    "top20_ms": timed(lambda: index.search(query, 20), repeat),
+                    "ranked_filter_ms": timed(lambda: ranked(query), repeat),
+                    "matches": len(ranked(query)),
+                }
+                for query in queries
+            },
+            "related_page_ms": timed(lambda: index.related(ids[:page], k=10), repeat),
+            "related_1000_ms": timed(lambda: index.related(ids[:1000], k=10), 1),
+        }
+
+        # 수집 1회분 새 기사 추가 → 저장 → 앱이 다시 불러와 행렬 계산
+        def incremental():
+            updated = SimilarityIndex(path=path)
+            updated.add([a["id"] for a in extra], [article_text(a) for a in extra])
+            updated.vectors()
+            return updated
+
+        result["incremental_add_ms"] = timed(incremental, repeat)
+    return result
+
+
+# ✅ 게시 시각 색인 (기간 필터 + 최신순 정렬, 보존 기간 정리)
+# 기존 방식: 재실행마다 date 문자열을 해석해 기간으로 거르고 정렬
+# 색인: 최신순으로 구성한 색인에서 날짜별 위치 목록만 합침 / 보존 기간: 전체 재작성 vs 날짜 파일 삭제
+def bench_time_index(size, repeat=5, window_days=7, retention_days=21):
+    from article_store import parse_timestamp, day_start, retention_cutoff
+
+    articles = generate_articles(size)
+    newest_first = sorted(articles, key=lambda a: a["published_ts"], reverse=True)
+    index = ArticleIndex.from_articles(newest_first)
+    date_to = index.days[-1]
+    date_from = index.days[-window_days]
+
+    def legacy():
+        start, end = day_start(date_from), day_start(date_to) + 86400
+        matched = [a for a in articles if start <= parse_timestamp(a["date"]) < end]
+        return sorted(matched, key=lambda a: parse_timestamp(a["date"]), reverse=True)
+
+    result = {
+        "benchmark": "time_index",
+        "size": size,
+        "window_days": window_days,
+        "legacy_parse_sort_ms": timed(legacy, repeat),
+        "index_window_ms": timed(lambda: index.filter(date_from=date_from, date_to=date_to), repeat),
+        "index_one_day_ms": timed(lambda: index.filter(date_from=date_to, date_to=date_to), repeat),
+        "index_all_days_ms": timed(lambda: index.filter(), repeat),
+        "matches": len(index.filter(date_from=date_from, date_to=date_to)),
+    }
+
+    # 보존 기간 정리: 마지막 날짜 기준 retention_days 이전 기사 삭제
+    cutoff = retention_cutoff(retention_days, now=day_start(date_to))
+    with tempfile.TemporaryDirectory() as workdir:
+        snapshot = os.path.join(workdir, "news_articles.json")
+        with open(snapshot, "w", encoding="utf-8") as f:
+            json.dump(articles, f, ensure_ascii=False)
+
+        def rewrite():
+            with open(snapshot, "r", encoding="utf-8") as f:
+                kept = [a for a in json.load(f) if a["published_ts"] >= cutoff]
+            with open(snapshot + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(kept, f, ensure_ascii=False)
+
+        result["rewrite_retention_ms"] = timed(rewrite, 1)
+        store = ArticleStore(partition_dir=os.path.join(workdir, "news_partitions"), legacy_snapshot=snapshot)
+        started = time.perf_counter()
+        dropped = store.drop_before(cutoff)
+        result["partition_drop_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        result["dropped_days"] = len(dropped)
+    return result
+
+
+# ✅ 스크랩 CSV 내보내기 (기존: 전체 기사 순회 + 리스트 포함 검사 vs 색인 조회)
+def bench_csv_export(size, repeat=5, scraps=200):
+    articles = generate_articles(size)
+    index = ArticleIndex.from_articles(articles)
+    scrap_list = [a["id"] for a in articles[::max(1, size // scraps)]][:scraps]
+
+    def legacy():
+        scrap_info = [
+            {"title": a["title"], "date": a["date"], "source": a["source"]}
+            for a in articles
+            if a["id"] in scrap_list
+        ]
+        return pd.DataFrame(scrap_info).to_csv(index=False)
+
+    def indexed():
+        scrap_info = [{"title": a["title"], "date": a["date"], "source": a["source"]} for a in index.lookup(scrap_list)]
+        return pd.DataFrame(scrap_info).to_csv(index=False)
+
+    return {
+        "benchmark": "csv_export",
+        "size": size,
+        "scraps": len(scrap_list),
+        "legacy_ms": timed(legacy, repeat),
+        "indexed_ms": timed(indexed, repeat),
+    }
+
+
+# ✅ 수집 처리량 (가짜 뉴스 웹 대상, 지연/오류/느린 언론사 포함)
+# 첫 실행은 모든 피드/기사를 받고, 두 번째 실행은 조건부 요청(304)으로 새 기사가 없음을 확인
+def bench_collect(size, repeat=1, latency=0.02, error_rate=0.02, slow_delay=0.3):
+    import news_collect
+    from fetch_cache import FetchCache
+    from host_health import HostHealth
+
+    feeds_needed = math.ceil(size / (len(SOURCES) * news_collect.MAX_ARTICLES_PER_FEED))
+    categories = [f"분류{i}" for i in range(max(1, feeds_needed))]
+    saved = news_collect.RSS_FEEDS, news_collect.fetch_cache, news_collect.host_health
+    cwd = os.getcwd()
+    server = FakeNewsServer(
+        categories=categories, items_per_feed=news_collect.MAX_ARTICLES_PER_FEED, latency=latency,
+        error_rate=error_rate, slow_hosts={SOURCES[-1]: slow_delay},
+    )
+    with tempfile.TemporaryDirectory() as workdir, server:
+        os.chdir(workdir)
+        os.makedirs("scripts")
+        try:
+            news_collect.RSS_FEEDS = server.rss_feeds()
+            news_collect.fetch_cache = FetchCache()
+            news_collect.host_health = HostHealth()
+            store = ArticleStore()
+
+            started = time.perf_counter()
+            articles = news_collect.collect_news(force=True, store=store)
+            cold_s = time.perf_counter() - started
+            store.append(articles)
+            cold_requests = server.requests
+
+            started = time.perf_counter()
+            again = news_collect.collect_news(force=True, store=store)
+            warm_s = time.perf_counter() - started
+            warm_requests = server.requests - cold_requests
+
+            # 파서를 고친 뒤처럼 캐시에서 저장된 기사를 모두 다시 추출 (네트워크 요청 없음)
+            news_collect.fetch_cache.offline = True
+            started = time.perf_counter()
+            reextracted = news_collect.collect_news(force=True, store=store)
+            offline_s = time.perf_counter() - started
+        finally:
+            news_collect.RSS_FEEDS, news_collect.fetch_cache, news_collect.host_health = saved
+            os.chdir(cwd)
+
+    return {
+        "benchmark": "collect",
+        "size": server.article_count(),
+        "feeds": len(SOURCES) * len(categories),
+        "latency_s": latency,
+        "error_rate": error_rate,
+        "collected": len(articles),
+        "cold_s": round(cold_s, 3),
+        "cold_articles_per_s": round(len(articles) / cold_s, 1),
+        "cold_requests": cold_requests,
+        "warm_s": round(warm_s, 3),
+        "warm_new_articles": len(again),
+        "warm_requests": warm_requests,
+        "offline_s": round(offline_s, 3),
+        "offline_reextracted": len(reextracted),
+    }
+
+
+BENCHMARKS = {
+    "catalog": bench_catalog,
+    "index_memory": bench_index_memory,
+    "feed_render": bench_feed_render,
+    "textrank": bench_textrank,
+    "keywords": bench_keywords,
+    "user_store": bench_user_store,
+    "load_articles": bench_load_articles,
+    "filter": bench_filter,
+    "csv_export": bench_csv_export,
+    "collect": bench_collect,
+    "similarity": bench_similarity,
+    "time_index": bench_time_index,
+}
+
+
+def _run_info():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def _numbers(value, prefix=""):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _numbers(item, f"{prefix}.{key}" if prefix else key)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        yield prefix, value
+
+
+# ✅ 이전 결과 JSON과 숫자 항목별 비교 (이름이 _ms, _s, _bytes로 끝나면 작을수록 좋음)
+def compare(baseline, result):
+    old = dict(_numbers(baseline.get("results", baseline)))
+    lines = []
+    for path, new in _numbers(result.get("results", result)):
+        if path not in old or old[path] == 0 or path.endswith("size"):
+            continue
+        change = (new - old[path]) / old[path] * 100
+        lower_is_better = path.endswith(("_ms", "_s", "_bytes"))
+        marker = "" if abs(change) < 10 else ("⚠️" if (change > 0) == lower_is_better else "✅")
+        lines.append(f"{path}: {old[path]} → {new} ({change:+.1f}%) {marker}".rstrip())
+    return lines
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SummarizeBot 벤치마크")
+    parser.add_argument("name", choices=sorted(BENCHMARKS) + ["all"])
+    parser.add_argument("--size", type=int, default=10000, help="합성 기사 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    names = sorted(BENCHMARKS) if args.name == "all" else [args.name]
+    results = {}
+    for name in names:
+        print(f"▶ {name}", file=sys.stderr)
+        results[name] = BENCHMARKS[name](args.size, repeat=args.repeat)
+    result = {"run": _run_info(), "results": results}
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print("\n".join(compare(json.load(f), result)))
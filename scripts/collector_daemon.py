@@ -0,0 +1,221 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+
+# ✅ 백그라운드 수집기 설정
+LOCK_FILE = os.path.join("scripts", "collector.lock")
+STATUS_FILE = os.path.join("scripts", "collector_status.json")
+SCHEDULE_FILE = os.path.join("scripts", "collector_schedule.json")   # 언론사별 수집 주기 (선택)
+DEFAULT_INTERVAL = 3600   # 언론사별 기본 수집 주기 (초)
+MAX_SLEEP = 60            # 다음 수집 시각까지 기다리는 최대 간격 (일정 파일 변경 반영용)
+LOCK_WAIT = 2.0           # 잠금을 잡지 못했을 때 다시 시도하는 시간 (초)
+
+
+# ✅ 프로세스 간 수집 잠금 (한 번에 수집기 하나만 실행)
+# 잠금은 파일 기술자에 걸리므로 프로세스가 비정상 종료돼도 운영체제가 자동으로 해제
+# 수집기만 잠금을 잡음 (앱은 상태 파일의 pid로 실행 여부를 확인하므로 수집기와 잠금을 다투지 않음)
+class CollectorLock:
+    def __init__(self, path=LOCK_FILE):
+        self.path = path
+        self.file = None
+
+    # wait초 동안 잠금을 다시 시도 (0이면 한 번만 시도)
+    def acquire(self, wait=0):
+        deadline = time.monotonic() + wait
+        while not self._try_acquire():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+        return True
+
+    def _try_acquire(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.file = open(self.path, "a+")
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+                self.file.seek(0)
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self.file.close()
+            self.file = None
+            return False
+        return True
+
+    def release(self):
+        if self.file is None:
+            return
+        if sys.platform == "win32":
+            import msvcrt
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        self.file.close()
+        self.file = None
+
+
+# ✅ 상태 파일 (앱이 주기적으로 읽어 진행률/마지막 수집 결과를 표시)
+def read_status(path=STATUS_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"state": "idle", "last_success": {}}
+
+
+# ✅ 수집기가 실행 중인지 확인 (상태가 running이고 기록된 pid의 프로세스가 살아 있음)
+# 수집기가 강제 종료돼 상태 파일에 running이 남아 있어도 pid가 없으면 실행 중이 아님
+def is_running(status):
+    return status.get("state") == "running" and pid_alive(status.get("pid"))
+
+
+def pid_alive(pid):
+    if not pid:
+        return False
+    if sys.platform == "win32":
+        # Windows의 os.kill(pid, 0)은 Ctrl+C를 보내므로 프로세스 핸들을 열어서 확인
+        import ctypes
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # 다른 사용자의 프로세스
+    return True
+
+
+def write_status(status, path=STATUS_FILE):
+    status["updated_at"] = time.time()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(status, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ✅ 언론사별 수집 주기: {"default": 3600, "연합뉴스": 900, ...}
+def load_schedule(path=SCHEDULE_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            schedule = json.load(f)
+    except FileNotFoundError:
+        schedule = {}
+    except json.JSONDecodeError as e:
+        logging.error(f"[수집기] {path} 파일이 손상되었습니다. 기본 주기를 사용합니다: {e}")
+        schedule = {}
+    return schedule
+
+
+def interval_of(source, schedule):
+    return schedule.get(source, schedule.get("default", DEFAULT_INTERVAL))
+
+
+# 언론사별 다음 수집 시각 (한 번도 수집하지 않았으면 지금)
+def next_runs(sources, status, schedule, now=None):
+    now = time.time() if now is None else now
+    last_success = status.get("last_success", {})
+    return {
+        source: last_success[source] + interval_of(source, schedule) if source in last_success else now
+        for source in sources
+    }
+
+
+# ✅ 수집 1회 실행 (LOCK_WAIT초 안에 잠금을 잡지 못하면 다른 수집기가 실행 중이므로 None)
+def run_once(sources=None, force=True, presummarize=False, lock_path=LOCK_FILE, status_path=STATUS_FILE):
+    from news_collect import run_collection, RSS_FEEDS
+
+    lock = CollectorLock(lock_path)
+    if not lock.acquire(wait=LOCK_WAIT):
+        return None
+    sources = sorted(sources or RSS_FEEDS)
+    status = read_status(status_path)
+    status.update({
+        "state": "running",
+        "pid": os.getpid(),
+        "sources": sources,
+        "started_at": time.time(),
+        "progress": {"stage": "starting", "done": 0, "total": 0},
+    })
+    write_status(status, status_path)
+
+    last_write = [0.0]
+
+    def progress(stage, done, total):
+        # 기사마다 파일을 쓰지 않도록 0.5초에 한 번만 기록 (단계가 바뀌면 바로 기록)
+        now = time.monotonic()
+        if stage == status["progress"]["stage"] and done < total and now - last_write[0] < 0.5:
+            return
+        last_write[0] = now
+        status["progress"] = {"stage": stage, "done": done, "total": total}
+        write_status(status, status_path)
+
+    try:
+        result = run_collection(force=force, presummarize=presummarize, sources=sources, progress=progress)
+        finished_at = time.time()
+        status["last_success"] = {**status.get("last_success", {}), **{source: finished_at for source in sources}}
+        status.update({"state": "idle", "finished_at": finished_at, "last_result": result, "last_error": None})
+        return result
+    except Exception as e:
+        logging.error(f"[수집기] 수집 실패: {e}")
+        status.update({"state": "error", "finished_at": time.time(), "last_error": str(e)})
+        raise
+    finally:
+        status.pop("progress", None)
+        status["pid"] = None
+        write_status(status, status_path)
+        lock.release()
+
+
+# ✅ 상시 실행: 주기가 된 언론사만 모아서 수집하고, 다음 수집 시각까지 대기
+def serve(sources=None, presummarize=False):
+    from news_collect import RSS_FEEDS
+
+    sources = sources or list(RSS_FEEDS)
+    while True:
+        schedule = load_schedule()
+        now = time.time()
+        runs = next_runs(sources, read_status(), schedule, now)
+        due = [source for source, at in runs.items() if at <= now]
+        if due:
+            try:
+                if run_once(due, presummarize=presummarize) is not None:
+                    continue
+                logging.error("[수집기] 다른 수집기가 실행 중이라 잠시 후 다시 시도합니다.")
+            except Exception:
+                pass  # 오류는 상태 파일/로그에 기록됨, 잠시 후 다시 시도
+            time.sleep(MAX_SLEEP)
+            continue
+        time.sleep(min(MAX_SLEEP, max(1.0, min(runs.values()) - now)))
+
+
+# ✅ 실행: python scripts/collector_daemon.py [--once] [--sources 연합뉴스 한겨레] [--presummarize]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="백그라운드 뉴스 수집기")
+    parser.add_argument("--once", action="store_true", help="한 번만 수집하고 종료")
+    parser.add_argument("--sources", nargs="+", help="수집할 언론사 (기본: 전체)")
+    parser.add_argument("--presummarize", action="store_true", help="수집 후 새 기사를 미리 요약")
+    args = parser.parse_args()
+
+    if args.once:
+        result = run_once(args.sources, presummarize=args.presummarize)
+        if result is None:
+            print("⚠️ 다른 수집기가 실행 중입니다.")
+            sys.exit(1)
+        print(f"✅ 수집 완료: {result}")
+    else:
+        try:
+            serve(args.sources, presummarize=args.presummarize)
+        except KeyboardInterrupt:
+            print("🛑 수집기를 종료합니다.")
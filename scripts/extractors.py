@@ -0,0 +1,175 @@
+import os
+import sys
+import time
+import logging
+from urllib.parse import urlparse
+
+import lxml.html
+
+# ✅ 본문 추출기 설정
+MIN_EMBEDDED_LENGTH = 200   # 피드에 포함된 본문이 이보다 짧으면 요약문으로 보고 페이지를 받음
+MIN_CONTENT_LENGTH = 100    # 추출 결과가 이보다 짧으면 다음 추출기로 넘어감
+DROP_TAGS = ("script", "style", "noscript", "figure", "figcaption", "iframe", "button")
+
+# ✅ 언론사별 본문 선택자 (기사 페이지 호스트 → 제목/본문 CSS 선택자), 사이트 개편 시 여기만 고치면 됨
+# 쉼표로 나눈 선택자는 앞의 것이 우선 (앞 선택자에 맞는 요소가 없을 때만 다음 선택자 사용)
+# tests/fixtures/extractors/<호스트>.html 에 사이트별 기사 페이지가 있어야 함 (tests/test_extractors.py)
+SITE_SELECTORS = {
+    "www.hani.co.kr": {"title": "h3.title, h1", "body": "div.article-text p, div.article-text"},
+    "www.yna.co.kr": {"title": "h1.tit, h1", "body": "article.story-news p:not(.txt-copyright)"},
+    "www.donga.com": {"title": "h1.title, h1", "body": "section.news_view"},
+    "www.khan.co.kr": {"title": "h1.headline, h1", "body": "p.content_text"},
+    "www.hankookilbo.com": {"title": "h2.title, h1", "body": "p.editor-p"},
+    "www.joongang.co.kr": {"title": "h1.headline, h1", "body": "div#article_body > p"},
+}
+DEFAULT_SELECTOR = {"title": "h1", "body": "article p"}   # 등록되지 않은 사이트용 일반 선택자
+
+
+# ✅ 모든 추출기가 실패한 경우 (프로세스 풀에서도 그대로 전달되도록 메시지만 가짐)
+class ExtractionError(Exception):
+    pass
+
+
+# ✅ 추출기 등록부
+# - 피드 추출기(entry → (제목, 본문)): 네트워크 없이 RSS 항목만으로 추출
+# - HTML 추출기(url, html → (제목, 본문)): 다운로드한 페이지에서 추출, 등록 순서대로 시도
+# 추출 실패는 None 반환 또는 예외 (다음 추출기로 넘어감)
+FEED_EXTRACTORS = []
+HTML_EXTRACTORS = []
+
+
+def feed_extractor(name):
+    def decorator(fn):
+        FEED_EXTRACTORS.append((name, fn))
+        return fn
+    return decorator
+
+
+def html_extractor(name):
+    def decorator(fn):
+        HTML_EXTRACTORS.append((name, fn))
+        return fn
+    return decorator
+
+
+# ✅ HTML 조각 → 줄 단위 텍스트 (스크립트/캡션 등 제거)
+def html_to_text(html):
+    if not html or not html.strip():
+        return ""
+    root = lxml.html.fragment_fromstring(html, create_parent="div")
+    return element_text(root)
+
+
+def element_text(element):
+    # 순회 중에 지우면 다음 요소를 건너뛰므로 목록을 먼저 만든 뒤 지움
+    for tag in list(element.iter(*DROP_TAGS)):
+        tag.drop_tree()
+    return "\n".join(text.strip() for text in element.itertext() if text.strip())
+
+
+# 쉼표로 나눈 선택자를 앞에서부터 시도해 처음 맞는 요소 목록 반환
+def _select(doc, selector):
+    for part in selector.split(","):
+        elements = doc.cssselect(part.strip())
+        if elements:
+            return elements
+    return []
+
+
+def _accept(title, content, minimum=MIN_CONTENT_LENGTH):
+    return (title or "", content) if content and len(content) >= minimum else None
+
+
+# ✅ 1순위: 피드에 포함된 전체 본문 (content:encoded 등)
+@feed_extractor("embedded")
+def extract_embedded(entry):
+    contents = [html_to_text(block.get("value", "")) for block in entry.get("content", [])]
+    content = max(contents, key=len, default="")
+    return (entry.get("title", ""), content) if content else None
+
+
+# ✅ 2순위: 언론사별 lxml 선택자
+@html_extractor("selectors")
+def extract_with_selectors(url, html):
+    selectors = SITE_SELECTORS.get(urlparse(url).netloc.lower(), DEFAULT_SELECTOR)
+    doc = lxml.html.document_fromstring(html)
+    titles = _select(doc, selectors["title"])
+    title = titles[0].text_content().strip() if titles else (doc.findtext(".//title") or "").strip()
+    content = "\n".join(filter(None, (element_text(element) for element in _select(doc, selectors["body"]))))
+    return _accept(title, content)
+
+
+# ✅ 3순위: newspaper (가장 느리지만 범용)
+@html_extractor("newspaper")
+def extract_with_newspaper(url, html):
+    import newspaper
+
+    article = newspaper.Article(url, language="ko")
+    article.download(input_html=html)
+    article.parse()
+    return _accept(article.title, article.text, minimum=1)
+
+
+# ✅ RSS 항목에서 본문 추출 → (제목, 본문, 추출기 이름) / 본문이 min_length보다 짧으면 None (페이지를 받아야 함)
+def extract_from_feed(entry, min_length=MIN_EMBEDDED_LENGTH):
+    for name, extractor in FEED_EXTRACTORS:
+        try:
+            result = extractor(entry)
+        except Exception as e:
+            logging.error(f"[추출기 {name}] 실패: {e} - {entry.get('link')}")
+            continue
+        if result and len(result[1]) >= min_length:
+            return result + (name,)
+    return None
+
+
+# ✅ 다운로드한 HTML에서 본문 추출 → (제목, 본문, 추출기 이름, 소요 시간) / 모두 실패하면 ExtractionError
+# 프로세스 풀에서 실행되므로 최상위 함수로 두고, 로그/계측은 호출한 쪽(부모 프로세스)에서 기록
+def extract_from_html(url, html):
+    started = time.perf_counter()
+    errors = []
+    for name, extractor in HTML_EXTRACTORS:
+        try:
+            result = extractor(url, html)
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+            continue
+        if result:
+            return result + (name, time.perf_counter() - started)
+        errors.append(f"{name}: 본문 없음")
+    raise ExtractionError("; ".join(errors))
+
+
+# ✅ 저장된 HTML로 추출기 점검: python scripts/extractors.py [HTML 파일/폴더 ...]
+# 인자가 없으면 수집 캐시(scripts/fetch_cache/pages)의 원본 HTML을 사용 (사이트별 고정 페이지는 tests/fixtures/extractors)
+if __name__ == "__main__":
+    import gzip
+    from collections import Counter
+
+    paths = sys.argv[1:] or [os.path.join("scripts", "fetch_cache", "pages")]
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += [os.path.join(path, name) for name in sorted(os.listdir(path))]
+        elif os.path.exists(path):
+            files.append(path)
+        else:
+            print(f"⚠️ {path} 경로가 없습니다.")
+
+    winners = Counter()
+    for path in files:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8", errors="replace") as f:
+            html = f.read()
+        # 캐시 파일에는 URL이 없으므로 <link rel="canonical"> 또는 og:url에서 호스트를 얻음
+        doc = lxml.html.document_fromstring(html)
+        urls = doc.xpath("//link[@rel='canonical']/@href | //meta[@property='og:url']/@content")
+        try:
+            title, content, name, elapsed = extract_from_html(urls[0] if urls else "http://unknown/", html)
+        except ExtractionError as e:
+            winners["실패"] += 1
+            print(f"{os.path.basename(path)}\t실패\t{e}")
+            continue
+        winners[name] += 1
+        print(f"{os.path.basename(path)}\t{name}\t{len(content)}자\t{elapsed * 1000:.1f}ms\t{title[:40]}")
+    print("✅ 추출기별 성공 수: " + ", ".join(f"{name}={count}" for name, count in winners.most_common()))
@@ -0,0 +1,156 @@
+import sys
+import json
+import time
+import hashlib
+import threading
+from email.utils import formatdate
+from html import escape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from synthetic_corpus import make_article, SOURCES, CATEGORIES, FIRST_DAY_TS
+
+# ✅ 벤치마크용 가짜 뉴스 웹 (RSS 피드 + 기사 페이지)
+# - 언론사마다 포트가 다른 서버를 띄워 수집기 입장에서는 서로 다른 호스트로 보임
+# - 응답 지연(latency), 오류 비율(error_rate), 느린 언론사(slow_hosts)를 설정 가능
+# - 피드는 ETag를 보내고 If-None-Match가 같으면 304로 응답
+# - 같은 시드면 항상 같은 피드/기사를 돌려줌 (오류가 나는 URL도 시드로 결정)
+
+
+def _chance(seed, text):
+    digest = hashlib.sha1(f"{seed}:{text}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+
+class FakeNewsServer:
+    def __init__(self, sources=SOURCES, categories=CATEGORIES, items_per_feed=10, latency=0.0,
+                 error_rate=0.0, slow_hosts=None, seed=0):
+        self.sources = list(sources)
+        self.categories = list(categories)
+        self.items_per_feed = items_per_feed
+        self.latency = latency                    # 모든 요청의 기본 지연 (초)
+        self.error_rate = error_rate              # 기사 페이지가 500으로 실패할 비율
+        self.slow_hosts = dict(slow_hosts or {})  # 언론사 → 추가 지연 (초)
+        self.seed = seed
+        # 합성 기사의 게시 시각(2025-05-01~28)을 서버 시작 시각까지의 최근 28일로 옮김 (보존 기간 필터에 걸리지 않도록)
+        self.time_shift = int(time.time()) - (FIRST_DAY_TS + 28 * 86400)
+        self.servers = {}
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        for source in self.sources:
+            server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler(source))
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.servers[source] = server
+        return self
+
+    def stop(self):
+        for server in self.servers.values():
+            server.shutdown()
+            server.server_close()
+        self.servers = {}
+
+    def base_url(self, source):
+        return f"http://127.0.0.1:{self.servers[source].server_address[1]}"
+
+    # ✅ news_collect.RSS_FEEDS와 같은 형식의 피드 목록
+    def rss_feeds(self):
+        return {
+            source: {category: f"{self.base_url(source)}/rss/{c}.xml" for c, category in enumerate(self.categories)}
+            for source in self.sources
+        }
+
+    def article_count(self):
+        return len(self.sources) * len(self.categories) * self.items_per_feed
+
+    def _article(self, source_index, category_index, item):
+        index = (source_index * len(self.categories) + category_index) * self.items_per_feed + item
+        return make_article(index, self.seed)
+
+    def _feed(self, source, category_index):
+        source_index = self.sources.index(source)
+        items = []
+        for item in range(self.items_per_feed):
+            article = self._article(source_index, category_index, item)
+            link = f"{self.base_url(source)}/article/{category_index}/{item}.html"
+            published = formatdate(article["published_ts"] + self.time_shift, usegmt=True)
+            items.append(
+                f"<item><title>{escape(article['title'])}</title><link>{link}</link>"
+                f"<description>{escape(article['content'][:120])}</description>"
+                f"<content:encoded><![CDATA[<p>{article['content']}</p>]]></content:encoded>"
+                f"<pubDate>{published}</pubDate></item>"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+            f"<channel><title>{escape(source)}</title>{''.join(items)}</channel></rss>"
+        )
+
+    def _page(self, source, category_index, item):
+        article = self._article(self.sources.index(source), category_index, item)
+        paragraphs = "".join(f"<p>{escape(sentence)}.</p>" for sentence in article["content"].split(". "))
+        return (
+            f"<html><head><meta charset='utf-8'><title>{escape(article['title'])}</title></head>"
+            f"<body><article><h1>{escape(article['title'])}</h1>{paragraphs}</article></body></html>"
+        )
+
+    def _handler(self, source):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body=b"", content_type="text/html; charset=utf-8", etag=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                if etag:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                with fake._lock:
+                    fake.requests += 1
+                time.sleep(fake.latency + fake.slow_hosts.get(source, 0.0))
+                parts = self.path.strip("/").split("/")
+                try:
+                    if parts[0] == "rss":
+                        body = fake._feed(source, int(parts[1].split(".")[0])).encode("utf-8")
+                        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+                        if self.headers.get("If-None-Match") == etag:
+                            return self._send(304, etag=etag)
+                        return self._send(200, body, "application/rss+xml; charset=utf-8", etag)
+                    if parts[0] == "article":
+                        if _chance(fake.seed, f"{source}/{self.path}") < fake.error_rate:
+                            return self._send(500, b"internal error")
+                        category_index, item = int(parts[1]), int(parts[2].split(".")[0])
+                        return self._send(200, fake._page(source, category_index, item).encode("utf-8"))
+                except (IndexError, ValueError):
+                    pass
+                self._send(404, b"not found")
+
+        return Handler
+
+
+# ✅ 단독 실행: python scripts/fake_news_server.py [피드당 기사 수] [지연(초)] [오류 비율]
+# 출력된 피드 목록(JSON)을 RSS_FEEDS 대신 사용
+if __name__ == "__main__":
+    items_per_feed = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    error_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    server = FakeNewsServer(items_per_feed=items_per_feed, latency=latency, error_rate=error_rate).start()
+    print(json.dumps(server.rss_feeds(), ensure_ascii=False, indent=2))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
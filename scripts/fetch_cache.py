@@ -0,0 +1,164 @@
+import os
+import json
+import gzip
+import time
+import hashlib
+import threading
+
+# ✅ 수집기 HTTP 캐시 설정
+CACHE_DIR = os.path.join("scripts", "fetch_cache")
+CACHE_MAX_BYTES = 200 * 1024 * 1024   # 캐시 전체 최대 크기 (압축 기준)
+CACHE_MAX_AGE_DAYS = 14               # 이 기간보다 오래된 항목은 삭제
+
+
+def url_key(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+# ✅ RSS 피드 조건부 요청(ETag/Last-Modified) + 기사 HTML 압축 저장 캐시
+# - feeds.json: 피드 URL별 ETag, Last-Modified, 마지막 수신 시각
+# - feeds/<sha1>.xml.gz: 304 응답 시 다시 파싱할 피드 본문
+# - pages/<sha1>.html.gz: 기사 URL별 원본 HTML (파서 수정 후 네트워크 없이 재추출 가능)
+class FetchCache:
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, max_age_days=CACHE_MAX_AGE_DAYS, offline=False):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.offline = offline  # True이면 캐시에 없는 페이지는 네트워크 대신 실패 처리
+        self.meta_file = os.path.join(cache_dir, "feeds.json")
+        self._lock = threading.Lock()
+        self.reset_stats()
+        os.makedirs(os.path.join(cache_dir, "feeds"), exist_ok=True)
+        os.makedirs(os.path.join(cache_dir, "pages"), exist_ok=True)
+        self.feeds = self._load_meta()
+
+    # 실행별 통계 (수집 데몬처럼 한 프로세스에서 여러 번 수집하면 실행마다 초기화)
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {
+                "feed_not_modified": 0,
+                "feed_fetched": 0,
+                "page_hits": 0,
+                "page_misses": 0,
+                "evicted": 0,
+            }
+
+    def _load_meta(self):
+        try:
+            with open(self.meta_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _path(self, kind, url):
+        suffix = ".xml.gz" if kind == "feeds" else ".html.gz"
+        return os.path.join(self.cache_dir, kind, url_key(url) + suffix)
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _read(self, path):
+        try:
+            with gzip.open(path, "rb") as f:
+                return f.read()
+        except (FileNotFoundError, OSError, EOFError):
+            return None
+
+    def _write(self, path, data):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    # ✅ 피드 조건부 요청 헤더 (본문이 캐시에 있을 때만)
+    def feed_headers(self, url):
+        with self._lock:
+            meta = self.feeds.get(url)
+        if not meta or not os.path.exists(self._path("feeds", url)):
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    # 304 응답이거나 오프라인일 때 캐시된 피드 본문 반환 (없으면 None)
+    def load_feed(self, url):
+        body = self._read(self._path("feeds", url))
+        if body is not None:
+            self._count("feed_not_modified")
+        return body
+
+    def store_feed(self, url, body, etag=None, last_modified=None):
+        self._write(self._path("feeds", url), body)
+        with self._lock:
+            self.feeds[url] = {"etag": etag, "last_modified": last_modified, "fetched_at": time.time()}
+        self._count("feed_fetched")
+
+    # ✅ 기사 HTML 캐시 조회/저장
+    def get_page(self, url):
+        data = self._read(self._path("pages", url))
+        if data is None:
+            self._count("page_misses")
+            return None
+        self._count("page_hits")
+        return data.decode("utf-8")
+
+    def put_page(self, url, html):
+        self._write(self._path("pages", url), html.encode("utf-8"))
+
+    # ✅ 오래된 항목 삭제 후 전체 크기가 한도를 넘으면 오래된 순으로 삭제
+    def evict(self):
+        now = time.time()
+        files = []
+        for kind in ("feeds", "pages"):
+            folder = os.path.join(self.cache_dir, kind)
+            for name in os.listdir(folder):
+                path = os.path.join(folder, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if name.endswith(".tmp") or now - stat.st_mtime > self.max_age:
+                    self._remove(path)
+                else:
+                    files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+        with self._lock:
+            self.feeds = {
+                url: meta for url, meta in self.feeds.items()
+                if os.path.exists(self._path("feeds", url))
+            }
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            self.stats["evicted"] += 1
+        except FileNotFoundError:
+            pass
+
+    def save(self):
+        tmp_path = self.meta_file + ".tmp"
+        with self._lock:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.feeds, f, ensure_ascii=False)
+        os.replace(tmp_path, self.meta_file)
+
+    def report(self):
+        s = self.stats
+        page_total = s["page_hits"] + s["page_misses"]
+        hit_rate = (s["page_hits"] / page_total * 100) if page_total else 0.0
+        return (
+            f"📦 캐시: 피드 미변경 {s['feed_not_modified']}건 / 새로 받음 {s['feed_fetched']}건, "
+            f"기사 HTML 적중 {s['page_hits']}건 / 미적중 {s['page_misses']}건 ({hit_rate:.1f}%), "
+            f"삭제 {s['evicted']}건"
+        )
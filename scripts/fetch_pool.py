@@ -0,0 +1,95 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+
+
+# ✅ 전체 마감 시간 초과로 실행되지 못한 작업
+class DeadlineExceeded(Exception):
+    pass
+
+
+def host_of(url):
+    return urlparse(url).netloc.lower()
+
+
+# ✅ 호스트별 동시 요청 수 제한 + 전체 마감 시간을 지원하는 작업 풀
+# - 한 호스트가 느려도 다른 호스트의 작업은 계속 진행됨
+# - 결과는 항상 입력 순서대로 반환 (실행 순서와 무관하게 결정적)
+class HostLimitedPool:
+    def __init__(self, max_workers=16, per_host=2, deadline=None):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.deadline = deadline  # time.monotonic() 기준 절대 시각 (None이면 제한 없음)
+
+    def remaining(self):
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    # fn(item)을 병렬 실행하고 [(결과, 예외), ...]를 입력 순서대로 반환
+    # on_done(완료 수, 전체 수)이 있으면 작업 하나가 끝날 때마다 호출 (진행률 표시용)
+    def map(self, fn, items, url_of, on_done=None):
+        items = list(items)
+        results = [(None, None)] * len(items)
+        if not items:
+            return results
+
+        # 호스트별 대기열 (호스트 등장 순서대로 라운드 로빈)
+        queues = {}
+        for index, item in enumerate(items):
+            queues.setdefault(host_of(url_of(item)), deque()).append(index)
+        hosts = deque(queues)
+        active = {host: 0 for host in queues}
+        running = {}
+        finished = 0
+
+        def next_index():
+            # 여유 슬롯이 있는 호스트에서 다음 작업 하나를 꺼냄
+            for _ in range(len(hosts)):
+                host = hosts[0]
+                hosts.rotate(-1)
+                if queues[host] and active[host] < self.per_host:
+                    active[host] += 1
+                    return host, queues[host].popleft()
+            return None
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while True:
+                while len(running) < self.max_workers and not self.expired():
+                    picked = next_index()
+                    if picked is None:
+                        break
+                    host, index = picked
+                    running[executor.submit(fn, items[index])] = (host, index)
+
+                if not running:
+                    break
+
+                done, _ = wait(running, timeout=self.remaining(), return_when=FIRST_COMPLETED)
+                if not done:
+                    break  # 마감 시간 초과
+
+                for future in done:
+                    host, index = running.pop(future)
+                    active[host] -= 1
+                    error = future.exception()
+                    results[index] = (None, error) if error else (future.result(), None)
+                    finished += 1
+                    if on_done:
+                        on_done(finished, len(items))
+        finally:
+            # 마감 시간 이후 남은 작업은 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # 실행되지 못했거나 끝나지 않은 작업은 DeadlineExceeded로 표시
+        for host, index in running.values():
+            results[index] = (None, DeadlineExceeded(url_of(items[index])))
+        for queue in queues.values():
+            for index in queue:
+                results[index] = (None, DeadlineExceeded(url_of(items[index])))
+        return results
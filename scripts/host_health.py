@@ -0,0 +1,127 @@
+import os
+import json
+import time
+import threading
+from collections import Counter
+
+# ✅ 호스트 상태(서킷 브레이커) 설정
+HEALTH_FILE = os.path.join("scripts", "host_health.json")
+FAILURE_THRESHOLD = 3        # 연속 실패 N회 시 서킷 열림
+COOLDOWN_SECONDS = 30 * 60   # 서킷이 열린 뒤 재시도(프로브)까지 대기 시간
+LATENCY_ALPHA = 0.3          # 평균 지연 시간 지수 이동 평균 가중치
+
+
+# ✅ 서킷이 열려 요청을 보내지 않은 경우
+class CircuitOpen(Exception):
+    pass
+
+
+# ✅ 호스트별 지연 시간/실패율 기록 + 서킷 브레이커 (실행 간 유지)
+# - 연속 실패가 FAILURE_THRESHOLD회에 도달하면 서킷을 열고 요청을 건너뜀
+# - COOLDOWN_SECONDS가 지나면 요청 하나만 프로브로 보내 성공 시 서킷을 닫음
+# - 프로브가 성공/실패 기록 없이 끝나도(예외 등) release로 half-open 표시를 풀어 다음 프로브를 허용
+class HostHealth:
+    def __init__(self, path=HEALTH_FILE, threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN_SECONDS):
+        self.path = path
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.hosts = self._load()
+        self.skipped = Counter()  # 이번 실행에서 서킷 때문에 건너뛴 요청 수
+        self._probing = set()
+        self._lock = threading.Lock()
+
+    # 실행별 통계 초기화 (수집 데몬처럼 한 프로세스에서 여러 번 수집하는 경우)
+    def reset_stats(self):
+        with self._lock:
+            self.skipped = Counter()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _host(self, host):
+        return self.hosts.setdefault(host, {
+            "requests": 0,
+            "failures": 0,
+            "consecutive_failures": 0,
+            "avg_latency": 0.0,
+            "avg_failure_latency": 0.0,
+            "opened_at": None,
+        })
+
+    # ✅ 요청을 보내도 되는지 확인 (열린 서킷이면 False)
+    def allow(self, host):
+        with self._lock:
+            h = self.hosts.get(host)
+            if not h or h["opened_at"] is None:
+                return True
+            if time.time() - h["opened_at"] < self.cooldown or host in self._probing:
+                self.skipped[host] += 1
+                return False
+            # 쿨다운이 지났으면 프로브 요청 하나만 허용 (half-open)
+            self._probing.add(host)
+            return True
+
+    def record_success(self, host, latency):
+        with self._lock:
+            h = self._host(host)
+            h["requests"] += 1
+            h["consecutive_failures"] = 0
+            h["avg_latency"] = self._ewma(h["avg_latency"], latency, h["requests"])
+            h["opened_at"] = None
+            self._probing.discard(host)
+
+    def record_failure(self, host, latency):
+        with self._lock:
+            h = self._host(host)
+            h["requests"] += 1
+            h["failures"] += 1
+            h["consecutive_failures"] += 1
+            h["avg_latency"] = self._ewma(h["avg_latency"], latency, h["requests"])
+            h["avg_failure_latency"] = self._ewma(h["avg_failure_latency"], latency, h["failures"])
+            if host in self._probing or h["consecutive_failures"] >= self.threshold:
+                h["opened_at"] = time.time()
+            self._probing.discard(host)
+
+    def release(self, host):
+        with self._lock:
+            self._probing.discard(host)
+
+    def _ewma(self, average, value, count):
+        return value if count == 1 else (1 - LATENCY_ALPHA) * average + LATENCY_ALPHA * value
+
+    def open_circuits(self):
+        with self._lock:
+            return sorted(host for host, h in self.hosts.items() if h["opened_at"] is not None)
+
+    # 건너뛴 요청 수 × 평균 실패 지연 시간으로 절약한 시간 추정
+    def saved_seconds(self, host):
+        h = self.hosts.get(host, {})
+        return self.skipped[host] * h.get("avg_failure_latency", 0.0)
+
+    def total_saved_seconds(self):
+        return sum((self.saved_seconds(host) for host in list(self.skipped)), 0.0)
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with self._lock:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.hosts, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def report(self):
+        lines = []
+        for host in self.open_circuits():
+            h = self.hosts[host]
+            failure_rate = h["failures"] / h["requests"] * 100 if h["requests"] else 0.0
+            lines.append(
+                f"🚧 서킷 열림: {host} (실패율 {failure_rate:.0f}%, 건너뜀 {self.skipped[host]}건, "
+                f"절약 약 {self.saved_seconds(host):.0f}초)"
+            )
+        if not lines:
+            return "✅ 열린 서킷 없음"
+        lines.append(f"⏱️ 서킷 브레이커로 절약한 시간: 약 {self.total_saved_seconds():.0f}초")
+        return "\n".join(lines)
@@ -0,0 +1,178 @@
+import os
+import re
+import json
+import logging
+from itertools import chain
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+# ✅ 키워드 추출 설정
+DF_FILE = os.path.join("scripts", "keyword_df.json")   # 누적 문서 빈도(DF) 통계
+MAX_VOCAB = 200_000                                    # DF 통계에 보관할 최대 단어 수
+USE_KONLPY = os.getenv("KEYWORD_USE_KONLPY") == "1"    # konlpy 명사 추출 사용 여부 (Java 필요)
+
+STOPWORDS = {
+    "하다", "되다", "있다", "없다", "이다", "그리고", "하지만", "또한", "즉", "않다",
+    "기자", "뉴스", "사진", "제공", "오늘", "이번", "지난", "대해", "통해", "위해", "관련", "때문",
+    "이날", "그는", "그러나", "이후", "현재", "경우", "가운데", "한편", "특히", "가장",
+}
+
+# 명사 뒤에 붙는 조사/복수 접미사 (긴 것부터 제거)
+JOSA = sorted([
+    "들에게", "들은", "들이", "들을", "들의", "들도", "들",
+    "에서는", "으로는", "에게서", "까지는", "이라는", "이라고", "에서", "으로", "에게", "한테", "까지",
+    "부터", "보다", "처럼", "이나", "라는", "라고", "과의", "와의", "에는", "에도", "께서", "은", "는",
+    "이", "가", "을", "를", "의", "에", "도", "와", "과", "로", "만",
+], key=len, reverse=True)
+
+# 앞 글자의 받침 유무에 따라 모양이 정해지는 조사 (받침 있음: 은/이/을/과/으로, 없음: 는/가/를/와/로)
+# 모양이 맞지 않으면 조사가 아니라 명사의 일부로 봄 (전문가 → "전문" + 가 로 자르지 않음)
+JOSA_AFTER_CONSONANT = {"은", "이", "을", "과", "과의", "으로", "으로는", "이나", "이라는", "이라고"}
+JOSA_AFTER_VOWEL = {"는", "가", "를", "와", "와의", "로", "라는", "라고"}
+
+# 용언(동사/형용사) 활용형 어미 — 키워드 후보에서 제외 (과거형 "~ㅆ다"는 받침으로 따로 확인)
+VERB_ENDINGS = (
+    "한다", "된다", "는다", "인다", "진다", "하다", "되다", "이다", "니다", "없다", "않다", "같다", "싶다",
+    "하는", "되는", "했던", "하며", "했고", "하고", "해서", "하면", "했으며", "됐고",
+)
+
+# 조사/용언 어미처럼 끝나지만 명사인 단어 (이 단어로 끝나면 그대로 명사로 봄)
+NOUN_ENDINGS = (
+    "바다", "캐나다", "사이다", "판다", "우간다", "르완다", "아젠다",
+    "경기도", "강원도", "제주도", "울릉도", "북도", "남도",
+    "고양이", "어린이", "젊은이", "늙은이",
+)
+
+HANGUL_WORD = re.compile(r"[가-힣]{2,}")
+FINAL_SSANG_SIOT = 20   # 받침 ㅆ (했다/됐다/밝혔다 등 과거형)
+FINAL_RIEUL = 8         # 받침 ㄹ (조사 "로"는 받침 ㄹ 뒤에도 붙음)
+
+
+# 한글 음절의 받침 번호 (받침이 없으면 0)
+def _final(syllable):
+    return (ord(syllable) - 0xAC00) % 28
+
+
+def _is_predicate(word):
+    return word.endswith(VERB_ENDINGS) or (word[-1] == "다" and _final(word[-2]) == FINAL_SSANG_SIOT)
+
+
+def _josa_fits(stem, josa):
+    final = _final(stem[-1])
+    if josa in JOSA_AFTER_CONSONANT:
+        return final != 0
+    if josa in JOSA_AFTER_VOWEL:
+        return final == 0 or (josa.startswith("로") and final == FINAL_RIEUL)
+    return True
+
+
+# ✅ 어절 → 명사 후보 (용언이거나 불용어면 None), 같은 어절이 반복되므로 결과를 캐시
+@lru_cache(maxsize=500_000)
+def _noun_of(word):
+    if not word.endswith(NOUN_ENDINGS):
+        if _is_predicate(word):
+            return None
+        for josa in JOSA:
+            if word.endswith(josa) and len(word) - len(josa) >= 2:
+                stem = word[:-len(josa)]
+                if _josa_fits(stem, josa):
+                    word = stem
+                    break
+    return None if word in STOPWORDS else word
+
+
+# ✅ 정규식 기반 명사 후보 추출 (조사 제거 + 용언 제외)
+def regex_nouns(text):
+    return [noun for noun in map(_noun_of, HANGUL_WORD.findall(text)) if noun]
+
+
+# ✅ 코퍼스 단위 TF-IDF 키워드 추출기
+# - 수집 실행 전체를 희소 행렬 하나로 만들어 한 번에 처리
+# - 어절 → 명사 변환은 배치에서 서로 다른 어절마다 한 번만 하고, TF/DF는 단어 번호 배열로 계산
+# - DF 통계를 파일에 누적해 새 배치가 와도 전체를 다시 학습하지 않음
+# - 행별 상위 k개는 파이썬 반복 없이 정렬/인덱스 연산으로 계산
+class KeywordExtractor:
+    def __init__(self, df_file=DF_FILE, use_konlpy=USE_KONLPY):
+        self.df_file = df_file
+        self.df, self.n_docs = self._load()
+        self.split_words, self.to_noun = HANGUL_WORD.findall, _noun_of
+        if use_konlpy:
+            nouns = self._konlpy_tokenizer()
+            if nouns:
+                self.split_words, self.to_noun = nouns, lambda noun: noun
+
+    def _load(self):
+        try:
+            with open(self.df_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return Counter(data["df"]), data["n_docs"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return Counter(), 0
+
+    def _konlpy_tokenizer(self):
+        try:
+            from konlpy.tag import Okt
+            okt = Okt()
+        except Exception as e:
+            logging.error(f"konlpy 초기화 실패, 정규식 추출로 대체: {e}")
+            return None
+        return lambda text: [n for n in okt.nouns(text) if len(n) >= 2 and n not in STOPWORDS]
+
+    # ✅ 여러 문서의 키워드를 한 번에 추출 (update=True이면 DF 통계에 이번 배치를 반영)
+    def extract_batch(self, texts, top_n=5, update=True):
+        texts = list(texts)
+        if not texts:
+            return []
+        words = [self.split_words(text) for text in texts]
+        all_words = list(chain.from_iterable(words))
+
+        # 서로 다른 어절만 명사로 바꾸고, 명사를 가나다순 번호로 매김 (명사가 아니면 -1)
+        noun_of = {word: self.to_noun(word) for word in dict.fromkeys(all_words)}
+        vocab = sorted({noun for noun in noun_of.values() if noun})
+        if not vocab:  # 모든 문서에 후보 단어가 없음
+            return [[] for _ in texts]
+        vocab_index = {noun: i for i, noun in enumerate(vocab)}
+        term_of = {word: vocab_index[noun] if noun else -1 for word, noun in noun_of.items()}
+
+        # 어절 순서대로 (문서 번호, 단어 번호) 배열을 만들고 같은 칸을 합쳐 TF 희소 행렬 생성
+        terms = np.fromiter(map(term_of.__getitem__, all_words), dtype=np.int64, count=len(all_words))
+        rows = np.repeat(np.arange(len(texts)), list(map(len, words)))
+        is_noun = terms >= 0
+        tf = csr_matrix(
+            (np.ones(int(is_noun.sum()), dtype=np.int64), (rows[is_noun], terms[is_noun])),
+            shape=(len(texts), len(vocab)),
+        )
+        tf.sum_duplicates()
+
+        if update:
+            batch_df = np.bincount(tf.indices, minlength=len(vocab))
+            self.df.update(dict(zip(vocab, batch_df.tolist())))
+            self.n_docs += len(texts)
+        n_docs = max(self.n_docs, len(texts))
+        df = np.array([self.df.get(word, 0) for word in vocab], dtype=np.float64)
+        idf = np.log((1 + n_docs) / (1 + df)) + 1
+
+        # 로그 TF × IDF
+        scores = (1 + np.log(tf.data.astype(np.float64))) * idf[tf.indices]
+
+        # 행 번호 오름차순, 점수 내림차순으로 정렬한 뒤 행마다 앞의 top_n개만 선택
+        rows = np.repeat(np.arange(tf.shape[0]), np.diff(tf.indptr))
+        order = np.lexsort((tf.indices, -scores, rows))
+        rank = np.arange(len(order)) - tf.indptr[rows[order]]
+        selected = order[rank < top_n]
+
+        keywords = [[] for _ in texts]
+        for row, column in zip(rows[selected].tolist(), tf.indices[selected].tolist()):
+            keywords[row].append(vocab[column])
+        return keywords
+
+    def save(self):
+        if len(self.df) > MAX_VOCAB:
+            self.df = Counter(dict(self.df.most_common(MAX_VOCAB)))
+        tmp_path = self.df_file + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"n_docs": self.n_docs, "df": self.df}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.df_file)
@@ -0,0 +1,193 @@
+import os
+import sys
+import json
+import time
+import cProfile
+import threading
+from contextlib import contextmanager
+
+# ✅ 단계별 시간/횟수 계측 설정
+PROFILE_ENV = "SUMMARIZEBOT_PROFILE"          # 값이 있으면 cProfile 결과(.prof)를 이 폴더에 저장 ("1"이면 기본 폴더)
+PROFILE_DIR = os.path.join("scripts", "profiles")
+METRIC_PREFIX = "summarizebot"
+
+
+def _label_key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+
+def _prometheus_labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+
+# ✅ 단계별 타이머 + 카운터 (언론사/호스트 등 라벨별로 집계)
+# - timer(단계, source=..., host=...)로 구간 시간을 재고, count(이름, ...)로 횟수를 셈
+# - 다른 객체가 이미 세고 있는 값(FetchCache 통계 등)은 add_source로 등록해 그대로 읽어 내보냄 (같은 일을 두 번 세지 않음)
+# - 여러 스레드(수집 작업 풀, Streamlit 세션)에서 동시에 기록해도 잠금으로 보호
+# - 실행 요약 표, JSONL, Prometheus 텍스트 형식으로 내보냄
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.timers = {}     # (단계, 라벨) → [횟수, 합계(초), 최대(초)]
+        self.counters = {}   # (이름, 라벨) → 값
+        self.sources = {}    # 접두어 → 카운터 dict를 돌려주는 함수 (reset으로 지우지 않음)
+        self.started_at = time.time()
+
+    def reset(self):
+        with self._lock:
+            self.timers = {}
+            self.counters = {}
+            self.started_at = time.time()
+
+    def observe(self, stage, seconds, **labels):
+        key = (stage, _label_key(labels))
+        with self._lock:
+            entry = self.timers.setdefault(key, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    @contextmanager
+    def timer(self, stage, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started, **labels)
+
+    def count(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def add_source(self, prefix, read):
+        with self._lock:
+            self.sources[prefix] = read
+
+    # 직접 센 카운터 + 등록된 외부 카운터 ((이름, 라벨), 값) 목록
+    def _counter_items(self):
+        with self._lock:
+            items = list(self.counters.items())
+            sources = list(self.sources.items())
+        for prefix, read in sources:
+            items += [((f"{prefix}_{name}", ()), value) for name, value in dict(read()).items()]
+        return items
+
+    # JSONL 한 줄(write_jsonl 결과)에서 다시 만들기
+    @classmethod
+    def from_entry(cls, entry):
+        m = cls()
+        for t in entry.get("timers", []):
+            m.timers[(t["stage"], _label_key(t["labels"]))] = [t["count"], t["total_s"], t["max_s"]]
+        for c in entry.get("counters", []):
+            m.counters[(c["name"], _label_key(c["labels"]))] = c["value"]
+        return m
+
+    def snapshot(self):
+        with self._lock:
+            timers = [
+                {"stage": stage, "labels": dict(labels), "count": n, "total_s": round(total, 6), "max_s": round(peak, 6)}
+                for (stage, labels), (n, total, peak) in self.timers.items()
+            ]
+        counters = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in self._counter_items()
+        ]
+        return timers, counters
+
+    # ✅ 실행 요약 표 (단계별 합계 시간 내림차순, by로 라벨을 지정하면 그 라벨별로 나눠 표시)
+    def summary_table(self, by=None):
+        timers, counters = self.snapshot()
+        rows = {}
+        for t in timers:
+            key = (t["stage"], t["labels"].get(by, "") if by else "")
+            row = rows.setdefault(key, [0, 0.0, 0.0])
+            row[0] += t["count"]
+            row[1] += t["total_s"]
+            row[2] = max(row[2], t["max_s"])
+
+        lines = [f"{'단계':<20} {by or '':<16} {'횟수':>7} {'합계(초)':>10} {'평균(ms)':>10} {'최대(ms)':>10}"]
+        for (stage, label), (n, total, peak) in sorted(rows.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{stage:<20} {label:<16} {n:>7} {total:>10.3f} {total / n * 1000:>10.1f} {peak * 1000:>10.1f}")
+
+        totals = {}
+        for c in counters:
+            totals[c["name"]] = totals.get(c["name"], 0) + c["value"]
+        if totals:
+            lines.append("카운터: " + ", ".join(f"{name}={value}" for name, value in sorted(totals.items())))
+        return "\n".join(lines)
+
+    # ✅ JSONL로 추가 기록 (실행마다 한 줄씩 쌓여 실행 간 비교 가능)
+    def write_jsonl(self, path, **run_info):
+        timers, counters = self.snapshot()
+        entry = {"time": time.time(), "elapsed_s": round(time.time() - self.started_at, 3), **run_info,
+                 "timers": timers, "counters": counters}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    # ✅ Prometheus 텍스트 형식 (node_exporter textfile collector 등에서 읽을 수 있도록 원자적으로 교체)
+    def prometheus_text(self):
+        with self._lock:
+            timers = sorted(self.timers.items())
+        counters = sorted(self._counter_items())
+        lines = []
+        if timers:
+            name = f"{METRIC_PREFIX}_stage_seconds"
+            lines += [f"# HELP {name} 단계별 소요 시간", f"# TYPE {name} summary"]
+            for (stage, labels), (n, total, _) in timers:
+                label_text = _prometheus_labels((("stage", stage),) + labels)
+                lines.append(f"{name}_sum{label_text} {total:.6f}")
+                lines.append(f"{name}_count{label_text} {n}")
+        for counter_name in sorted({name for (name, _), _ in counters}):
+            name = f"{METRIC_PREFIX}_{counter_name}_total"
+            lines += [f"# TYPE {name} counter"]
+            lines += [f"{name}{_prometheus_labels(labels)} {value}" for (n, labels), value in counters if n == counter_name]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"  # 여러 세션이 동시에 내보내도 충돌하지 않도록
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+
+
+# ✅ 선택적 cProfile (환경 변수 SUMMARIZEBOT_PROFILE이 설정된 경우에만 동작)
+@contextmanager
+def profiled(name):
+    target = os.getenv(PROFILE_ENV)
+    if not target:
+        yield
+        return
+    profile_dir = PROFILE_DIR if target == "1" else target
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        os.makedirs(profile_dir, exist_ok=True)
+        profiler.dump_stats(os.path.join(profile_dir, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.prof"))
+
+
+# 프로세스 전체에서 공유하는 기본 계측 객체
+metrics = Metrics()
+
+
+# ✅ 마지막 실행 요약 표 출력: python scripts/metrics.py [JSONL 경로] [라벨]
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join("scripts", "metrics", "collector.jsonl")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+    except FileNotFoundError:
+        print(f"❌ {path} 파일이 없습니다.")
+        sys.exit(1)
+    if not lines:
+        print(f"⚠️ {path}에 기록된 실행이 없습니다.")
+        sys.exit(1)
+    print(Metrics.from_entry(json.loads(lines[-1])).summary_table(by=sys.argv[2] if len(sys.argv) > 2 else None))
@@ -0,0 +1,127 @@
+import os
+import re
+import zlib
+
+import numpy as np
+
+# ✅ 유사 중복 기사 탐지(MinHash + LSH) 설정
+INDEX_FILE = os.path.join("scripts", "near_dup_index.npz")
+SHINGLE_SIZE = 5          # 문자 5-gram
+NUM_PERM = 128            # MinHash 서명 길이
+BANDS = 32                # LSH 밴드 수 (BANDS × ROWS = NUM_PERM)
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.6  # 추정 Jaccard 유사도가 이 값 이상이면 같은 기사로 묶음
+MAX_HASH = np.uint64(0xFFFFFFFF)
+
+_rng = np.random.RandomState(20250512)
+_PERM_A = _rng.randint(1, 2 ** 31 - 1, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, 2 ** 31 - 1, size=NUM_PERM).astype(np.uint64)
+
+NON_WORD = re.compile(r"[\W_]+")
+
+
+# ✅ 공백/문장부호를 제거한 본문의 문자 5-gram 해시 집합
+def shingle_hashes(text):
+    normalized = NON_WORD.sub("", (text or "").lower())
+    if len(normalized) < SHINGLE_SIZE:
+        normalized = normalized.ljust(SHINGLE_SIZE)
+    shingles = {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+    return np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+
+# ✅ MinHash 서명 (해시 함수 NUM_PERM개를 행렬 연산으로 한 번에 적용)
+def minhash(text):
+    hashes = shingle_hashes(text)
+    permuted = (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) & MAX_HASH
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def _band_keys(signature):
+    return [(band, signature[band * ROWS:(band + 1) * ROWS].tobytes()) for band in range(BANDS)]
+
+
+# ✅ 유사 중복 기사 색인
+# - 같은 밴드 값을 가진 기사만 후보로 비교하므로 추가 1건당 전체 비교가 필요 없음
+# - 그룹마다 처음 들어온 기사를 대표(canonical) 기사로 지정
+#   대표 기사 ID는 그룹 이름으로 쓰여 스크랩/요약 키가 되므로, 대표 기사가 보존 기간으로 삭제돼도 남은 기사의 값은 바꾸지 않음
+# - 서명과 대표 기사 ID를 파일로 저장해 증분 수집 간에 유지 (밴드 버킷은 불러올 때 재구성)
+class NearDupIndex:
+    def __init__(self, path=INDEX_FILE, threshold=SIMILARITY_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.ids = []
+        self.canonical_ids = []
+        self.signatures = []
+        self.positions = {}
+        self.buckets = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        data = np.load(self.path)
+        for article_id, canonical_id, signature in zip(data["ids"], data["canonical_ids"], data["signatures"]):
+            self._insert(str(article_id), str(canonical_id), signature)
+
+    def _insert(self, article_id, canonical_id, signature):
+        position = len(self.ids)
+        self.ids.append(article_id)
+        self.canonical_ids.append(canonical_id)
+        self.signatures.append(signature)
+        self.positions[article_id] = position
+        for key in _band_keys(signature):
+            self.buckets.setdefault(key, []).append(position)
+
+    # ✅ 기사 추가 → 대표 기사 ID 반환 (비슷한 기사가 없으면 자기 자신)
+    def add(self, article_id, text):
+        if article_id in self.positions:
+            return self.canonical_ids[self.positions[article_id]]
+
+        signature = minhash(text)
+        candidates = {position for key in _band_keys(signature) for position in self.buckets.get(key, ())}
+        canonical_id = article_id
+        if candidates:
+            candidates = sorted(candidates)
+            similarity = (np.stack([self.signatures[p] for p in candidates]) == signature).mean(axis=1)
+            best = int(np.argmax(similarity))
+            if similarity[best] >= self.threshold:
+                canonical_id = self.canonical_ids[candidates[best]]
+
+        self._insert(article_id, canonical_id, signature)
+        return canonical_id
+
+    def canonical_of(self, article_id):
+        position = self.positions.get(article_id)
+        return self.canonical_ids[position] if position is not None else article_id
+
+    # ✅ 보존 기간이 지나 삭제된 기사 제거 (버킷 재구성)
+    def remove(self, ids):
+        ids = set(ids)
+        if not ids & set(self.positions):
+            return
+        kept = [(a, c, s) for a, c, s in zip(self.ids, self.canonical_ids, self.signatures) if a not in ids]
+        self.ids, self.canonical_ids, self.signatures = [], [], []
+        self.positions, self.buckets = {}, {}
+        for article_id, canonical_id, signature in kept:
+            self._insert(article_id, canonical_id, signature)
+
+    def save(self):
+        signatures = np.stack(self.signatures) if self.signatures else np.zeros((0, NUM_PERM), dtype=np.uint32)
+        tmp_path = self.path + ".tmp.npz"
+        np.savez_compressed(
+            tmp_path, ids=np.array(self.ids), canonical_ids=np.array(self.canonical_ids), signatures=signatures
+        )
+        os.replace(tmp_path, self.path)
+
+
+# ✅ 기존 카탈로그 기사를 색인에 모두 반영하고 대표 기사 ID를 기록 (python scripts/near_dup.py)
+if __name__ == "__main__":
+    from article_catalog import ArticleCatalog
+
+    catalog = ArticleCatalog()
+    index = NearDupIndex()
+    pairs = [(a["id"], index.add(a["id"], a["title"] + " " + a["content"])) for a in catalog.iter_articles()]
+    catalog.update_canonical_ids(pairs)
+    index.save()
+    groups = len({canonical_id for _, canonical_id in pairs})
+    print(f"✅ {len(pairs)}개 기사 → {groups}개 그룹")
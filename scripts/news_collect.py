@@ -1,14 +1,29 @@
 import os
+import sys
 import feedparser
-import newspaper
-import uuid
-import json
-from bs4 import BeautifulSoup
+import requests
+import time
+import calendar
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from collections import Counter
 import re
+import argparse
 import logging
 
+from fetch_pool import HostLimitedPool, DeadlineExceeded, host_of
+from fetch_cache import FetchCache
+from host_health import HostHealth, CircuitOpen
+from article_store import ArticleStore, article_id, canonical_url, parse_timestamp, day_of, retention_cutoff
+from article_catalog import ArticleCatalog
+from user_store import UserStore
+from keywords import KeywordExtractor
+from near_dup import NearDupIndex
+from similarity_index import SimilarityIndex, article_text
+from metrics import metrics, profiled
+from extractors import extract_from_feed, extract_from_html
+
 # ✅ 로깅 설정
 logging.basicConfig(filename="scripts/news_collect.log", level=logging.ERROR, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -16,6 +31,22 @@ logging.basicConfig(filename="scripts/news_collect.log", level=logging.ERROR, fo
 LAST_RUN_FILE = os.path.join("scripts", "last_news_collect.txt")
 os.makedirs("scripts", exist_ok=True)
 
+# ✅ 단계별 계측 결과 (실행마다 JSONL 한 줄 추가, Prometheus 파일은 마지막 실행 기준으로 교체)
+METRICS_JSONL = os.path.join("scripts", "metrics", "collector.jsonl")
+METRICS_PROM = os.path.join("scripts", "metrics", "collector.prom")
+
+# ✅ 병렬 수집 설정
+MAX_WORKERS = 16          # 전체 동시 요청 수
+PER_HOST_LIMIT = 2        # 호스트(언론사)별 동시 요청 수
+REQUEST_TIMEOUT = 7       # 요청 1건당 타임아웃 (초)
+RUN_DEADLINE = 600        # 전체 수집 마감 시간 (초)
+MAX_ARTICLES_PER_FEED = 10
+USER_AGENT = "Mozilla/5.0 (compatible; SummarizeBot/1.0)"
+
+# ✅ 본문 추출 설정 (피드 포함 본문 → 언론사별 선택자 → newspaper 순서, extractors.py 참고)
+PARSE_WORKERS = min(4, os.cpu_count() or 1)   # HTML 파싱 프로세스 수 (1이면 다운로드한 스레드에서 바로 파싱)
+EMBEDDED_ONLY_SOURCES = {"조선일보"}          # 기사 페이지를 받지 않고 피드 포함 본문만 쓰는 언론사
+
 # ✅ RSS 피드 정의 (rss_feeds.json 파일 대신)
 RSS_FEEDS = {
       "조선일보": {
@@ -93,7 +124,12 @@ RSS_FEEDS = {
 }
 
 articles = []
-collected_urls = set()
+collected_urls = set()  # 이번 실행에서 고른 기사 (정규화된 URL 기준)
+known_ids = set()       # 저장소에 이미 있는 기사 ID (오프라인 재추출에서는 비워서 캐시된 기사를 모두 다시 추출)
+fetch_cache = FetchCache()
+host_health = HostHealth()
+metrics.add_source("fetch_cache", lambda: fetch_cache.stats)  # 캐시 적중/미적중은 FetchCache가 센 값을 그대로 내보냄
+parse_pool = None  # 수집 중에만 열리는 HTML 파싱 프로세스 풀
 
 # ✅ 정지어 목록 (필터링할 단어들)
 STOPWORDS = set(["하다", "되다", "있다", "없다", "이다", "그리고", "하지만", "또한", "즉", "않다"])
@@ -111,7 +147,8 @@ def update_last_run():
     with open(LAST_RUN_FILE, "w") as f:
         f.write(datetime.today().strftime("%Y-%m-%d"))
 
-# ✅ 키워드 추출 함수 (정규표현식 기반 + 정지어 필터)
+# ✅ 키워드 추출 함수 (정규표현식 기반 + 정지어 필터, 기사 단위)
+# 수집 시에는 KeywordExtractor로 실행 전체를 한 번에 처리하며, 이 함수는 벤치마크 비교용으로 유지
 def extract_keywords(text, top_n=5):
     words = re.findall(r'\b[가-힣]{2,}\b', text)
     filtered_words = [word for word in words if word not in STOPWORDS]
@@ -119,76 +156,348 @@ def extract_keywords(text, top_n=5):
     ranked_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
     return [word for word, _ in ranked_words[:top_n]]
 
-def extract_chosun_encoded(entry):
-    raw_html = entry.get("content", [{}])[0].get("value", "")
-    soup = BeautifulSoup(raw_html, "html.parser")
-    return soup.get_text(separator="\n").strip()
+# 피드 포함 본문만 쓰는 언론사는 길이와 관계없이 본문이 있으면 사용
+def extract_embedded(source, entry):
+    with metrics.timer("feed_extract", source=source):
+        if source in EMBEDDED_ONLY_SOURCES:
+            return extract_from_feed(entry, min_length=1)
+        return extract_from_feed(entry)
+
+def parse_feed(body, host):
+    with metrics.timer("feed_parse", host=host):
+        return feedparser.parse(body)
+
+# ✅ RSS 피드 다운로드 (ETag/Last-Modified 조건부 요청, 304이면 캐시된 본문 사용)
+def fetch_feed(rss_url):
+    host = host_of(rss_url)
+    if fetch_cache.offline:
+        body = fetch_cache.load_feed(rss_url)
+        if body is None:
+            raise RuntimeError("오프라인 모드: 캐시된 피드 없음")
+        return parse_feed(body, host)
+
+    headers = {"User-Agent": USER_AGENT, **fetch_cache.feed_headers(rss_url)}
+    with metrics.timer("feed_download", host=host):
+        response = requests.get(rss_url, timeout=REQUEST_TIMEOUT, headers=headers)
+    if response.status_code == 304:
+        body = fetch_cache.load_feed(rss_url)
+        if body is not None:
+            metrics.count("feed_not_modified", host=host)
+            return parse_feed(body, host)
+        # 캐시 본문이 그 사이 삭제된 경우 조건 없이 다시 요청
+        with metrics.timer("feed_download", host=host):
+            response = requests.get(rss_url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT})
+
+    response.raise_for_status()
+    fetch_cache.store_feed(rss_url, response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return parse_feed(response.content, host)
+
+# ✅ 기사 HTML 가져오기 (캐시 우선, 없으면 다운로드 후 저장)
+def fetch_page(url):
+    html = fetch_cache.get_page(url)
+    if html is not None:
+        return html
+    if fetch_cache.offline:
+        raise RuntimeError("오프라인 모드: 캐시된 HTML 없음")
+
+    # 장애 중인 호스트는 요청하지 않고 바로 RSS 요약으로 대체
+    host = host_of(url)
+    if not host_health.allow(host):
+        raise CircuitOpen(host)
+
+    started = time.monotonic()
+    try:
+        with metrics.timer("page_download", host=host):
+            response = requests.get(url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT})
+        response.raise_for_status()
+        host_health.record_success(host, time.monotonic() - started)
+    except requests.RequestException:
+        host_health.record_failure(host, time.monotonic() - started)
+        metrics.count("page_errors", host=host)
+        raise
+    finally:
+        host_health.release(host)  # 프로브가 기록 없이 끝나도 호스트가 half-open 상태로 남지 않도록
+
+    # charset이 없으면 requests는 ISO-8859-1로 가정하므로 본문에서 인코딩을 추정
+    if not response.encoding or response.encoding.lower() == "iso-8859-1":
+        response.encoding = response.apparent_encoding or "utf-8"
+    html = response.text
+    fetch_cache.put_page(url, html)
+    return html
+
+# ✅ HTML 파싱 프로세스 풀 (파싱은 CPU 작업이라 스레드끼리는 GIL 때문에 사실상 순서대로 실행됨)
+# 이미 스레드가 도는 프로세스에서 fork하지 않도록 forkserver(Windows는 spawn)로 작업 프로세스를 만듦
+def open_parse_pool():
+    if PARSE_WORKERS <= 1:
+        return None
+    context = multiprocessing.get_context("spawn" if sys.platform == "win32" else "forkserver")
+    return ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=context)
+
+def parse_html(url, html):
+    if parse_pool is None:
+        return extract_from_html(url, html)
+    return parse_pool.submit(extract_from_html, url, html).result()
+
+# ✅ RSS 항목 하나를 기사로 변환 (피드에 본문이 있으면 그대로 사용, 없으면 본문 다운로드/파싱)
+def build_article(job):
+    source, category_name, entry = job
+    url = entry.link
+
+    embedded = extract_embedded(source, entry)
+    if embedded:
+        title, content, extractor = embedded
+        metrics.count("extracted", source=source, extractor=extractor)
+        return make_article(job, title or entry.title, content)
+
+    try:
+        html = fetch_page(url)
+        title, content, extractor, elapsed = parse_html(url, html)
+        metrics.observe("article_parse", elapsed, source=source, extractor=extractor)
+        metrics.count("extracted", source=source, extractor=extractor)
+    except CircuitOpen:
+        metrics.count("circuit_fallbacks", source=source)
+        title = entry.title
+        content = entry.get("summary", "") or ""
+    except Exception as e:
+        logging.error(f"[{source} - {category_name}] 본문 다운로드/추출 실패: {e} - {url}")
+        metrics.count("parse_fallbacks", source=source)
+        title = entry.title
+        content = entry.get("summary", "") or ""
+
+    return make_article(job, title or entry.title, content)
+
+# ✅ 본문 다운로드 없이 RSS 요약으로 기사 생성 (마감 시간 초과 시 사용)
+def build_fallback_article(job):
+    source, category_name, entry = job
+    return make_article(job, entry.title, entry.get("summary", "") or "")
+
+# ✅ RSS 항목의 게시 시각 (UTC epoch 초)
+# feedparser가 해석한 시각(UTC struct_time)을 먼저 쓰고, 없으면 원문 문자열을 직접 해석, 그래도 없으면 지금
+def entry_timestamp(entry):
+    for key in ("published_parsed", "updated_parsed"):
+        if entry.get(key):
+            return float(calendar.timegm(entry[key]))
+    return parse_timestamp(entry.get("published") or entry.get("updated")) or time.time()
+
+def make_article(job, title, content):
+    source, category_name, entry = job
+    published_ts = entry_timestamp(entry)
+    return {
+        "id": article_id(entry.link),
+        "url": entry.link,
+        "title": title,
+        "content": content,
+        "source": source,
+        "category": category_name,
+        "date": day_of(published_ts),  # 한국 시간 기준 게시 날짜
+        "published_ts": published_ts,
+        "keywords": [],  # 수집이 끝난 뒤 전체 기사에 대해 한 번에 추출
+        "collected_at": time.time()
+    }
+
+# ✅ 피드에서 수집할 항목 선정 (피드 순서대로, 피드당 최대 10개)
+# 보존 기간이 지난 기사는 받아도 바로 삭제되므로 건너뜀
+def select_entries(source, category_name, feed, cutoff=None):
+    jobs = []
+    for entry in feed.entries:
+        if len(jobs) >= MAX_ARTICLES_PER_FEED:
+            break
+        try:
+            url = canonical_url(entry.link)
+            if url in collected_urls or article_id(url) in known_ids:
+                continue
+            if cutoff is not None and entry_timestamp(entry) < cutoff:
+                continue
+            if source in EMBEDDED_ONLY_SOURCES and not extract_embedded(source, entry):
+                continue
+            collected_urls.add(url)
+            jobs.append((source, category_name, entry))
+        except Exception as e:
+            logging.error(f"[{source} - {category_name}] 수집 실패: {e}")
+    return jobs
 
 # ✅ 뉴스 수집 및 분석 함수
-def collect_news():
-    if not can_run_today():
+# 1) 모든 RSS 피드를 병렬로 받고 2) 피드 순서대로 아직 저장소에 없는 기사만 고른 뒤 3) 본문을 병렬로 다운로드
+# 결과 순서는 RSS_FEEDS 정의 순서와 피드 내 순서를 그대로 따름
+# sources: 수집할 언론사 목록 (None이면 전체), progress(단계, 완료 수, 전체 수): 진행률 콜백
+def collect_news(force=False, store=None, sources=None, progress=None):
+    global parse_pool
+    if not force and not can_run_today():
         print("⚠️ 오늘은 이미 뉴스 수집이 완료되었습니다.")
         return []
 
-    for source, categories in RSS_FEEDS.items():
-        for category_name, rss_url in categories.items():
-            feed = feedparser.parse(rss_url)
-            count = 0
-
-            for entry in feed.entries:
-                if count >= 10:
-                    break
-                try:
-                    url = entry.link
-                    if url in collected_urls:
-                        continue
-
-                    if source == "조선일보":
-                        title = entry.title
-                        content = extract_chosun_encoded(entry)
-                        if not content:
-                            continue
-                    else:
-                        article = newspaper.Article(url, language='ko')
-                        try:
-                            article.download()
-                            article.parse()
-                            title = article.title
-                            content = article.text
-                        except Exception as e:
-                            logging.error(f"[{source} - {category_name}] newspaper 다운로드/파싱 실패: {e} - {url}")
-                            title = entry.title
-                            content = entry.get("summary", "") or ""
-
-                    date = entry.published[:10] if "published" in entry else datetime.today().strftime("%Y-%m-%d")
-                    keywords = extract_keywords(title + " " + content)
-
-                    articles.append({
-                        "id": str(uuid.uuid4()),
-                        "title": title,
-                        "content": content,
-                        "source": source,
-                        "category": category_name,
-                        "date": date,
-                        "keywords": keywords
-                    })
-
-                    collected_urls.add(url)
-                    count += 1
-                except Exception as e:
-                    logging.error(f"[{source} - {category_name}] 수집 실패: {e}")
+    # 수집기 데몬이 같은 프로세스에서 여러 번 호출하므로 이전 실행 결과를 비움
+    articles.clear()
+    collected_urls.clear()
+    known_ids.clear()
+    if store is not None and not fetch_cache.offline:
+        known_ids.update(store.known_ids())
+
+    def report(stage):
+        return (lambda done, total: progress(stage, done, total)) if progress else None
+
+    pool = HostLimitedPool(MAX_WORKERS, PER_HOST_LIMIT, deadline=time.monotonic() + RUN_DEADLINE)
+
+    feed_jobs = [
+        (source, category_name, rss_url)
+        for source, categories in RSS_FEEDS.items() if sources is None or source in sources
+        for category_name, rss_url in categories.items()
+    ]
+    with metrics.timer("stage_feeds"):
+        feed_results = pool.map(
+            fetch_feed, [rss_url for _, _, rss_url in feed_jobs], url_of=lambda url: url, on_done=report("feeds")
+        )
+
+    jobs = []
+    cutoff = retention_cutoff()
+    for (source, category_name, rss_url), (feed, error) in zip(feed_jobs, feed_results):
+        if error:
+            logging.error(f"[{source} - {category_name}] RSS 수집 실패: {error} - {rss_url}")
+            metrics.count("feed_errors", source=source)
+            continue
+        jobs.extend(select_entries(source, category_name, feed, cutoff))
+
+    with metrics.timer("stage_articles"):
+        parse_pool = open_parse_pool()
+        try:
+            results = pool.map(build_article, jobs, url_of=lambda job: job[2].link, on_done=report("articles"))
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(cancel_futures=True)
+            parse_pool = None
+
+    for job, (article, error) in zip(jobs, results):
+        source, category_name, entry = job
+        if isinstance(error, DeadlineExceeded):
+            logging.error(f"[{source} - {category_name}] 마감 시간 초과, RSS 요약으로 대체 - {entry.link}")
+            article = build_fallback_article(job)
+            metrics.count("deadline_fallbacks", source=source)
+        elif error:
+            logging.error(f"[{source} - {category_name}] 수집 실패: {error}")
+            metrics.count("article_errors", source=source)
+            continue
+        articles.append(article)
+        metrics.count("articles_collected", source=source)
 
+    # ✅ 이번 실행의 기사 전체에 대해 TF-IDF 키워드를 한 번에 추출 (DF 통계는 누적)
+    if progress:
+        progress("analyze", 0, len(articles))
+    with metrics.timer("stage_keywords"):
+        keyword_extractor = KeywordExtractor()
+        # 오프라인 재추출은 이미 DF에 반영된 기사를 다시 처리하므로 통계를 누적하지 않음
+        keywords = keyword_extractor.extract_batch(
+            [a["title"] + " " + a["content"] for a in articles], update=not fetch_cache.offline
+        )
+        for article, article_keywords in zip(articles, keywords):
+            article["keywords"] = article_keywords
+        keyword_extractor.save()
+
+    # ✅ 여러 언론사에 실린 같은 기사(유사 중복)를 묶고 그룹의 대표 기사 ID를 기록
+    with metrics.timer("stage_near_dup"):
+        near_dup_index = NearDupIndex()
+        for article in articles:
+            article["canonical_id"] = near_dup_index.add(article["id"], article["title"] + " " + article["content"])
+        near_dup_index.save()
+
+    # ✅ 검색 순위/관련 기사용 유사도 색인에 새 기사를 한 번에 추가 (기존 행은 그대로 두고 덧붙임)
+    with metrics.timer("stage_similarity"):
+        similarity_index = SimilarityIndex()
+        similarity_index.remove([a["id"] for a in articles])  # 다시 추출한 기사는 새 본문으로 교체
+        similarity_index.add([a["id"] for a in articles], [article_text(a) for a in articles])
+        similarity_index.save()
+
+    with metrics.timer("stage_state_save"):
+        fetch_cache.evict()
+        fetch_cache.save()
+        host_health.save()
     update_last_run()
-    return articles
+    return list(articles)  # 다음 호출에서 전역 목록을 비워도 반환한 결과는 유지
+
+# ✅ 수집 → 저장소/카탈로그 반영 → (선택) 사전 요약까지 한 번 실행하고 결과 요약을 반환
+# 카탈로그 버전은 기사 추가/삭제를 모두 마친 뒤 올리므로 앱은 완성된 결과만 다시 읽음
+# 보존 기간이 지난 기사는 저장소의 날짜 파일과 카탈로그/색인에서 같은 경계 시각으로 함께 삭제
+# (사용자가 스크랩/요약한 기사와 그 그룹 기사는 보존 기간과 관계없이 남김)
+# 계측 값은 실행마다 초기화하고 실행이 끝나면 JSONL/Prometheus 파일로 내보냄
+def run_collection(force=False, offline=False, presummarize=False, sources=None, progress=None):
+    metrics.reset()
+    fetch_cache.reset_stats()
+    host_health.reset_stats()
+    with profiled("collector"), metrics.timer("collect_total"):
+        fetch_cache.offline = offline
+        store = ArticleStore()  # news_partitions/<날짜>.json (scripts 폴더의 한 단계 위에 저장)
+        collected = collect_news(force=force or offline, store=store, sources=sources, progress=progress)
+        if progress:
+            progress("saving", 0, len(collected))
+        cutoff = retention_cutoff()
+        catalog = ArticleCatalog()
+        # 사용자가 스크랩/요약한 기사(같은 그룹 기사 포함)는 보존 기간이 지나도 남김
+        user_store = UserStore()
+        referenced = user_store.referenced_ids()
+        user_store.close()
+        keep = referenced | catalog.group_members(referenced)
+        with metrics.timer("stage_store"):
+            known = store.known_ids()
+            saved = store.append(collected, replace=offline)  # 오프라인 재추출이면 기존 기사도 새 본문으로 교체
+            dropped_days = store.drop_before(cutoff, keep)
+        new_articles = [a for a in saved if a["id"] not in known]
+
+        # 앱이 조회하는 SQLite 카탈로그에도 반영
+        with metrics.timer("stage_catalog"):
+            catalog.upsert_articles(saved)
+            removed_ids = catalog.remove_before(cutoff, keep)
+            if saved or removed_ids:
+                catalog.bump_version()
+
+        if removed_ids:
+            with metrics.timer("stage_retention"):
+                near_dup_index = NearDupIndex()
+                near_dup_index.remove(removed_ids)
+                near_dup_index.save()
+                similarity_index = SimilarityIndex()
+                similarity_index.remove(removed_ids)
+                similarity_index.save()
+
+        result = {
+            "collected": len(collected), "new_articles": len(new_articles),
+            "updated": len(saved) - len(new_articles), "removed": len(removed_ids),
+            "dropped_days": len(dropped_days),
+            # 서킷 브레이커 상태 (수집 데몬 상태 파일의 last_result에도 그대로 기록됨)
+            "open_circuits": host_health.open_circuits(),
+            "circuit_saved_s": round(host_health.total_saved_seconds(), 1),
+        }
+        if presummarize:
+            from presummarize import run_presummarize
+            if progress:
+                progress("presummarize", 0, len(new_articles))
+            with metrics.timer("stage_presummarize"):
+                result["presummarize"] = run_presummarize(new_articles, catalog)
+        catalog.close()
+
+    try:
+        metrics.write_jsonl(METRICS_JSONL, run="collector", sources=sources, **result)
+        metrics.write_prometheus(METRICS_PROM)
+    except OSError as e:
+        logging.error(f"계측 결과 저장 실패: {e}")
+    return result
 
 # ✅ 메인 함수 (자동 실행 지원)
 if __name__ == "__main__":
-    articles = collect_news()
-    news_file = "news_articles.json"  # scripts 폴더의 한 단계 위에 저장
-
-    if articles:
-        with open(news_file, "w", encoding="utf-8") as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
-        print(f"✅ 총 {len(articles)}개 뉴스 수집 완료.")
-    else:
-        print("⚠️ 수집된 기사가 없습니다.")
+    parser = argparse.ArgumentParser(description="뉴스 수집기")
+    parser.add_argument("--force", action="store_true", help="오늘 이미 수집했어도 다시 실행")
+    parser.add_argument("--offline", action="store_true", help="네트워크 없이 캐시된 피드/HTML에서 다시 추출 (--force 포함)")
+    parser.add_argument("--presummarize", action="store_true", help="수집 후 새 기사를 미리 요약해 공용 요약 캐시에 저장")
+    args = parser.parse_args()
+
+    result = run_collection(force=args.force, offline=args.offline, presummarize=args.presummarize)
+    if "presummarize" in result:
+        print(f"🤖 사전 요약: {result['presummarize']}")
+    if result["new_articles"]:
+        print(f"✅ 새 뉴스 {result['new_articles']}개 수집 완료.")
+    if result["updated"]:
+        print(f"♻️ 기존 기사 {result['updated']}개를 다시 추출해 교체했습니다.")
+    if not result["new_articles"] and not result["updated"]:
+        print("⚠️ 새로 수집된 기사가 없습니다.")
+    print(fetch_cache.report())
+    print(host_health.report())
+    print(metrics.summary_table())
+    print(metrics.summary_table(by="source"))
@@ -0,0 +1,178 @@
+import os
+import json
+import time
+import random
+import asyncio
+import logging
+
+import openai
+
+from summary_cache import SummaryCache, SUMMARY_CACHE_FILE, SUMMARY_MODEL, build_summary_prompt, summary_key
+
+# ✅ 사전 요약(배치) 설정
+CHECKPOINT_FILE = os.path.join("scripts", "presummarize_checkpoint.json")
+CONCURRENCY = 4                # 동시에 진행할 요청 수
+REQUESTS_PER_MINUTE = 60       # 분당 최대 요청 수
+MAX_RETRIES = 5                # 429/5xx/연결 오류 시 재시도 횟수
+BACKOFF_BASE = 2.0             # 재시도 대기 시간 (초, 지수 증가 + 무작위 지터)
+TOKEN_BUDGET = 300_000         # 1회 실행에서 사용할 최대 토큰 수
+COST_BUDGET_USD = 3.0          # 1회 실행에서 사용할 최대 비용 (USD)
+PRICE_PER_1K_INPUT = 0.0025    # gpt-4o 입력 1K 토큰 가격 (USD)
+PRICE_PER_1K_OUTPUT = 0.01     # gpt-4o 출력 1K 토큰 가격 (USD)
+
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+# ✅ 분당 요청 수 제한 (요청 간 최소 간격 유지)
+class RateLimiter:
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute
+        self.next_time = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# ✅ 토큰/비용 예산
+class Budget:
+    def __init__(self, max_tokens=TOKEN_BUDGET, max_cost=COST_BUDGET_USD):
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.tokens = 0
+        self.cost = 0.0
+
+    def charge(self, usage):
+        if usage is None:
+            return
+        self.tokens += usage.total_tokens
+        self.cost += usage.prompt_tokens / 1000 * PRICE_PER_1K_INPUT + usage.completion_tokens / 1000 * PRICE_PER_1K_OUTPUT
+
+    def exhausted(self):
+        return self.tokens >= self.max_tokens or self.cost >= self.max_cost
+
+
+# ✅ 체크포인트: 아직 요약하지 못한 기사 ID (다음 실행에서 이어서 처리)
+def load_pending(path=CHECKPOINT_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("pending", [])
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def save_pending(pending, path=CHECKPOINT_FILE):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"pending": pending, "updated_at": time.time()}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _retry_delay(error, attempt):
+    # 서버가 Retry-After를 주면 그 값을 우선 사용
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return BACKOFF_BASE * (2 ** attempt) + random.uniform(0, BACKOFF_BASE)
+
+
+async def _summarize(client, content, limiter):
+    for attempt in range(MAX_RETRIES + 1):
+        await limiter.acquire()
+        try:
+            return await client.chat.completions.create(
+                model=SUMMARY_MODEL,
+                messages=[{"role": "user", "content": build_summary_prompt(content)}],
+            )
+        except RETRYABLE_ERRORS as e:
+            if attempt == MAX_RETRIES:
+                raise
+            await asyncio.sleep(_retry_delay(e, attempt))
+
+
+# ✅ 기사 목록을 비동기로 사전 요약해 공용 요약 캐시에 저장
+# 시작 전에 전체 작업 목록을 체크포인트에 쓰고, 기사 하나가 끝날 때마다 목록에서 빼서 다시 씀
+# 예산을 다 쓰거나 실패한 기사, 중간에 중단된 실행의 남은 기사는 체크포인트에 남아 다음 실행에서 이어서 처리
+async def presummarize(articles, cache, client, concurrency=CONCURRENCY, requests_per_minute=REQUESTS_PER_MINUTE,
+                       budget=None, checkpoint_file=CHECKPOINT_FILE):
+    budget = budget or Budget()
+    limiter = RateLimiter(requests_per_minute)
+    semaphore = asyncio.Semaphore(concurrency)
+    stats = {"summarized": 0, "cached": 0, "failed": 0, "skipped_budget": 0}
+
+    # 같은 본문(=같은 캐시 키)은 한 번만 요청
+    jobs = {}
+    for a in articles:
+        jobs.setdefault(summary_key(a["content"]), a)
+    pending = dict.fromkeys(article["id"] for article in jobs.values())
+    save_pending(list(pending), checkpoint_file)
+
+    def done(article):
+        pending.pop(article["id"], None)
+        save_pending(list(pending), checkpoint_file)
+
+    async def worker(key, article):
+        async with semaphore:
+            if cache.peek(key) is not None:
+                stats["cached"] += 1
+                done(article)
+                return
+            if budget.exhausted():
+                stats["skipped_budget"] += 1
+                return
+            try:
+                response = await _summarize(client, article["content"], limiter)
+            except Exception as e:
+                logging.error(f"[사전 요약] 실패: {e} - {article['id']}")
+                stats["failed"] += 1
+                return
+            budget.charge(response.usage)
+            cache.put(key, response.choices[0].message.content.strip())
+            stats["summarized"] += 1
+            done(article)
+
+    await asyncio.gather(*(worker(key, article) for key, article in jobs.items()))
+    stats.update(tokens=budget.tokens, cost_usd=round(budget.cost, 4), pending=len(pending))
+    return stats
+
+
+# ✅ 수집 후 단계: 이번에 새로 수집한 기사 + 이전 실행에서 남은 기사를 사전 요약
+def run_presummarize(new_articles, catalog, api_key=None, base_url=None, cache_file=SUMMARY_CACHE_FILE, **options):
+    pending_articles = catalog.get_articles(load_pending(options.get("checkpoint_file", CHECKPOINT_FILE)))
+    articles = pending_articles + [a for a in new_articles if a.get("content")]
+    if not articles:
+        return {"summarized": 0, "cached": 0, "failed": 0, "skipped_budget": 0, "pending": 0}
+
+    cache = SummaryCache(cache_file)
+    client = openai.AsyncOpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"), base_url=base_url, max_retries=0)
+
+    async def main():
+        try:
+            return await presummarize(articles, cache, client, **options)
+        finally:
+            await client.close()
+
+    try:
+        return asyncio.run(main())
+    finally:
+        cache.close()
+
+
+# ✅ 단독 실행: 체크포인트에 남은 기사만 이어서 요약
+if __name__ == "__main__":
+    from article_catalog import ArticleCatalog
+
+    stats = run_presummarize([], ArticleCatalog(), base_url=os.getenv("OPENAI_BASE_URL"))
+    print(f"🤖 사전 요약: {stats}")
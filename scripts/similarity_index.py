@@ -0,0 +1,181 @@
+import os
+import sys
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from keywords import regex_nouns
+
+# ✅ 기사 유사도 색인(TF-IDF 코사인) 설정
+INDEX_FILE = os.path.join("scripts", "similarity_index.npz")
+N_FEATURES = 2 ** 20      # 해시 공간 크기 (단어 사전 없이 고정 차원이라 새 기사를 바로 추가 가능)
+BATCH_SIZE = 256          # 관련 기사 계산 시 한 번에 처리하는 기사 수 (BATCH_SIZE × 기사 수 밀집 행렬)
+MIN_RELATED_SCORE = 0.1   # 이보다 유사도가 낮은 기사는 관련 기사로 보지 않음
+
+_vectorizer = HashingVectorizer(
+    analyzer=regex_nouns, n_features=N_FEATURES, alternate_sign=False, norm=None, dtype=np.float32
+)
+
+
+def article_text(article):
+    return article["title"] + " " + article["content"]
+
+
+# 문서 → 로그 TF 희소 행렬 (명사 후보를 해시 공간에 배치)
+def term_frequencies(texts):
+    tf = _vectorizer.transform(texts).tocsr()
+    np.log1p(tf.data, out=tf.data)
+    return tf
+
+
+# ✅ 점수 배열의 행별 상위 k개 (argpartition으로 k개만 고른 뒤 그 안에서만 정렬)
+def top_k(scores, k):
+    k = min(k, scores.shape[-1])
+    if k <= 0:
+        return np.zeros(scores.shape[:-1] + (0,), dtype=np.int64)
+    part = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    order = np.argsort(-np.take_along_axis(scores, part, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(part, order, axis=-1)
+
+
+# ✅ 기사 유사도 색인 (검색 순위 + 관련 기사)
+# - 기사별 로그 TF를 해시 공간의 희소 행렬로 저장하고, IDF는 불러올 때 행렬에서 다시 계산
+# - 새 기사는 행을 덧붙이기만 하면 되므로 수집 실행마다 전체를 다시 만들 필요가 없음
+# - 검색/관련 기사는 L2 정규화한 TF-IDF 행렬의 곱(코사인 유사도)으로 한 번에 계산
+# - 곱셈은 단어 → 기사 방향(전치) 행렬로 하므로 질의에 나온 단어의 열만 읽음 (역색인과 같은 효과)
+class SimilarityIndex:
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        self.ids = []
+        self.positions = {}
+        self.tf = sp.csr_matrix((0, N_FEATURES), dtype=np.float32)
+        self._vectors = None
+        self._postings = None
+        self._idf = None
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        data = np.load(self.path)
+        self.ids = [str(article_id) for article_id in data["ids"]]
+        self.positions = {article_id: position for position, article_id in enumerate(self.ids)}
+        self.tf = sp.csr_matrix((data["data"], data["indices"], data["indptr"]), shape=(len(self.ids), N_FEATURES))
+
+    def __len__(self):
+        return len(self.ids)
+
+    # ✅ 새 기사 추가 (이미 있는 ID는 건너뜀), 여러 기사를 행렬 하나로 한 번에 변환
+    def add(self, ids, texts):
+        pairs = [(article_id, text) for article_id, text in zip(ids, texts) if article_id not in self.positions]
+        pairs = list({article_id: text for article_id, text in pairs}.items())
+        if not pairs:
+            return 0
+        for article_id, _ in pairs:
+            self.positions[article_id] = len(self.ids)
+            self.ids.append(article_id)
+        self.tf = sp.vstack([self.tf, term_frequencies([text for _, text in pairs])], format="csr")
+        self._vectors = self._postings = self._idf = None
+        return len(pairs)
+
+    # ✅ 보존 기간이 지나 삭제된 기사 제거
+    def remove(self, ids):
+        ids = set(ids) & set(self.positions)
+        if not ids:
+            return
+        kept = [position for position, article_id in enumerate(self.ids) if article_id not in ids]
+        self.tf = self.tf[kept]
+        self.ids = [self.ids[position] for position in kept]
+        self.positions = {article_id: position for position, article_id in enumerate(self.ids)}
+        self._vectors = self._postings = self._idf = None
+
+    def save(self):
+        tmp_path = self.path + ".tmp.npz"
+        np.savez(
+            tmp_path, ids=np.array(self.ids, dtype=str), data=self.tf.data, indices=self.tf.indices,
+            indptr=self.tf.indptr,
+        )
+        os.replace(tmp_path, self.path)
+
+    # IDF = log((1 + 문서 수) / (1 + DF)) + 1 (keywords.py와 같은 식), DF는 열별 0이 아닌 값의 수
+    def idf(self):
+        if self._idf is None:
+            df = np.bincount(self.tf.indices, minlength=N_FEATURES)
+            self._idf = (np.log((1 + len(self.ids)) / (1 + df)) + 1).astype(np.float32)
+        return self._idf
+
+    # TF × IDF를 행별로 L2 정규화 (행렬 원소마다 해당 열의 IDF를 곱함)
+    def _weigh(self, tf):
+        weighted = tf.astype(np.float32)
+        weighted.data *= self.idf()[weighted.indices]
+        return normalize(weighted, copy=False)
+
+    # 정규화된 TF-IDF 행렬(기사 × 단어)과 전치 행렬(단어 × 기사), 처음 사용할 때 한 번 계산해 둠
+    def vectors(self):
+        if self._vectors is None:
+            self._vectors = self._weigh(self.tf) if self.ids else self.tf
+            self._postings = self._vectors.T.tocsr()
+        return self._vectors
+
+    def postings(self):
+        self.vectors()
+        return self._postings
+
+    # 기사 ID 목록 → 색인 행 번호 배열 (색인에 없는 기사는 -1), 호출하는 쪽에서 한 번 만들어 재사용
+    def rows(self, ids):
+        return np.array([self.positions.get(article_id, -1) for article_id in ids], dtype=np.int64)
+
+    # ✅ 검색어와 기사들의 코사인 유사도 (rows를 주면 그 순서대로, 색인에 없는 기사(-1)는 0)
+    def scores(self, query, rows=None):
+        if not self.ids:
+            return np.zeros(0 if rows is None else len(rows), dtype=np.float32)
+        scores = (self._weigh(term_frequencies([query])) @ self.postings()).toarray().ravel()
+        if rows is None:
+            return scores
+        return np.where(rows >= 0, scores[rows], 0.0)
+
+    # ✅ 검색 순위 상위 k개 → [(기사 ID, 점수), ...]
+    def search(self, query, k=20):
+        scores = self.scores(query)
+        return [(self.ids[i], float(scores[i])) for i in top_k(scores, k) if scores[i] > 0]
+
+    # ✅ 기사별 관련 기사 상위 k개 → {기사 ID: [(관련 기사 ID, 점수), ...]}
+    # BATCH_SIZE개씩 (기사 × 전체) 유사도 행렬을 한 번에 계산하고 자기 자신은 제외
+    def related(self, ids, k=5, min_score=MIN_RELATED_SCORE):
+        ids = [article_id for article_id in dict.fromkeys(ids) if article_id in self.positions]
+        if not ids:
+            return {}
+        vectors, postings = self.vectors(), self.postings()
+        related = {}
+        for start in range(0, len(ids), BATCH_SIZE):
+            batch = ids[start:start + BATCH_SIZE]
+            rows = np.array([self.positions[article_id] for article_id in batch])
+            scores = (vectors[rows] @ postings).toarray()
+            scores[np.arange(len(rows)), rows] = -1.0
+            for article_id, row_scores, best in zip(batch, scores, top_k(scores, k)):
+                related[article_id] = [
+                    (self.ids[i], float(row_scores[i])) for i in best if row_scores[i] >= min_score
+                ]
+        return related
+
+
+# ✅ 카탈로그와 색인 맞추기(빠진 기사 추가, 삭제된 기사 제거) 또는 검색: python scripts/similarity_index.py [검색어]
+if __name__ == "__main__":
+    from article_catalog import ArticleCatalog
+
+    catalog = ArticleCatalog()
+    index = SimilarityIndex()
+    if len(sys.argv) > 1:
+        results = index.search(sys.argv[1])
+        titles = {a["id"]: a["title"] for a in catalog.get_articles([article_id for article_id, _ in results])}
+        for article_id, score in results:
+            print(f"{score:.3f}\t{titles.get(article_id, article_id)}")
+    else:
+        articles = list(catalog.iter_articles())
+        known = {a["id"] for a in articles}
+        index.remove([article_id for article_id in index.ids if article_id not in known])
+        added = index.add([a["id"] for a in articles], [article_text(a) for a in articles])
+        index.save()
+        print(f"✅ 유사도 색인: 기사 {len(index)}개 (새로 추가 {added}개)")
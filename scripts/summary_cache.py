@@ -0,0 +1,182 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import Future
+
+# ✅ 공용 요약 캐시 설정
+SUMMARY_CACHE_FILE = os.path.join("user_data", "summary_cache.db")
+SUMMARY_MODEL = "gpt-4o"
+SUMMARY_PROMPT = "다음 뉴스 기사를 3문장으로 요약해줘:\n\n{content}"
+MAX_ENTRIES = 50000   # 이 개수를 넘으면 오래 사용하지 않은 요약부터 삭제 (LRU)
+
+KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+def build_summary_prompt(content):
+    return SUMMARY_PROMPT.format(content=content)
+
+
+# ✅ 캐시 키 = 모델 + 프롬프트(기사 본문 포함)의 해시
+# 본문/프롬프트/모델 중 하나라도 바뀌면 다른 키가 됨
+def summary_key(content, model=SUMMARY_MODEL):
+    prompt = build_summary_prompt(content)
+    return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def is_summary_key(value):
+    return isinstance(value, str) and bool(KEY_PATTERN.match(value))
+
+
+# ✅ 모든 사용자가 공유하는 요약 캐시 (SQLite)
+# - 같은 기사에 대한 요약은 한 번만 생성하고 사용자별 summary.json에는 키만 저장
+# - single-flight: 같은 키를 동시에 요청하면 첫 요청만 API를 호출하고 나머지는 그 결과를 기다림
+# - 적중/미적중/합류(coalesced) 횟수를 집계
+class SummaryCache:
+    def __init__(self, path=SUMMARY_CACHE_FILE, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "evicted": 0}
+        with self._lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                """CREATE TABLE IF NOT EXISTS summaries (
+                    key TEXT PRIMARY KEY,
+                    summary TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )"""
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_last_access ON summaries(last_access)")
+
+    def close(self):
+        self.conn.close()
+
+    def _lookup(self, key):
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row:
+                self.conn.execute(
+                    "UPDATE summaries SET last_access = ?, hits = hits + 1 WHERE key = ?", (time.time(), key)
+                )
+        return row[0] if row else None
+
+    # 화면 표시용 조회 (통계/사용 시각을 갱신하지 않는 읽기 전용)
+    def peek(self, key):
+        with self._lock:
+            row = self.conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    # ✅ 캐시 조회 (없으면 None)
+    def get(self, key):
+        summary = self._lookup(key)
+        with self._lock:
+            self.stats["hits" if summary is not None else "misses"] += 1
+        return summary
+
+    def put(self, key, summary, model=SUMMARY_MODEL):
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                """INSERT INTO summaries (key, summary, model, created_at, last_access) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET summary = excluded.summary, last_access = excluded.last_access""",
+                (key, summary, model, now, now),
+            )
+        self.evict()
+
+    # 여러 요약을 한 트랜잭션으로 저장 (일괄 요약용)
+    def put_many(self, items, model=SUMMARY_MODEL):
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                """INSERT INTO summaries (key, summary, model, created_at, last_access) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET summary = excluded.summary, last_access = excluded.last_access""",
+                [(key, summary, model, now, now) for key, summary in items],
+            )
+        self.evict()
+
+    # ✅ single-flight 등록 → (요약, Future, 생성 담당 여부)
+    # - 캐시에 있으면 (요약, None, False)
+    # - 같은 키를 다른 요청이 생성 중이면 (None, Future, False) → Future.result()로 그 결과를 기다림
+    # - 아니면 (None, Future, True) → 호출한 쪽이 생성하고 성공/실패와 관계없이 finish()를 반드시 호출
+    def claim(self, key):
+        summary = self._lookup(key)
+        with self._lock:
+            if summary is None and key not in self._inflight:
+                # 조회 직후 다른 요청이 생성을 끝냈을 수 있으므로 잠금 안에서 한 번 더 확인
+                row = self.conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+                summary = row[0] if row else None
+            if summary is not None:
+                self.stats["hits"] += 1
+                return summary, None, False
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+        return None, future, leader
+
+    # ✅ 생성 끝: 성공하면 저장하고 기다리던 요청에 결과를, 실패하면 같은 예외를 전달
+    def finish(self, key, future, summary=None, error=None, model=SUMMARY_MODEL):
+        try:
+            if error is None:
+                self.put(key, summary, model)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            if error is None:
+                future.set_result(summary)
+            else:
+                future.set_exception(error)
+
+    # ✅ 캐시에 있으면 반환, 없으면 generate()로 만들어 저장 (같은 키 동시 요청은 한 번만 생성)
+    def get_or_create(self, key, generate, model=SUMMARY_MODEL):
+        summary, future, leader = self.claim(key)
+        if summary is not None:
+            return summary
+        if not leader:
+            return future.result()
+        try:
+            summary = generate()
+        except BaseException as e:
+            self.finish(key, future, error=e)
+            raise
+        self.finish(key, future, summary, model=model)
+        return summary
+
+    # ✅ 최대 개수를 넘으면 마지막 사용 시각이 오래된 요약부터 삭제
+    def evict(self):
+        with self._lock, self.conn:
+            count = self.conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self.conn.execute(
+                    "DELETE FROM summaries WHERE key IN (SELECT key FROM summaries ORDER BY last_access LIMIT ?)",
+                    (overflow,),
+                )
+                self.stats["evicted"] += overflow
+
+    def hit_rate(self):
+        total = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+        return (self.stats["hits"] + self.stats["coalesced"]) / total if total else 0.0
+
+    def report(self):
+        s = self.stats
+        return (
+            f"🧠 요약 캐시: 적중 {s['hits']}건, 미적중 {s['misses']}건, 동시 요청 합류 {s['coalesced']}건 "
+            f"(적중률 {self.hit_rate() * 100:.1f}%), 삭제 {s['evicted']}건"
+        )
@@ -0,0 +1,150 @@
+import os
+import json
+import time
+import statistics
+
+from summary_cache import SUMMARY_MODEL, build_summary_prompt
+
+# ✅ 스트리밍 요약 설정
+LATENCY_LOG_FILE = os.path.join("user_data", "summary_latency.jsonl")   # 요청별 첫 토큰/전체 지연 시간 기록
+
+
+class IncompleteSummary(Exception):
+    pass
+
+
+# ✅ 스트리밍 요약 한 건
+# - tokens()를 순회하면 받은 조각을 바로 돌려줌 (st.write_stream에 그대로 전달)
+# - 끝까지 정상적으로 받은 경우에만 status가 "completed"가 되고 text에 전체 요약이 남음
+# - 연결 끊김/길이 초과 등으로 finish_reason이 "stop"이 아닌 응답은 IncompleteSummary
+# - 화면 이동 등으로 순회가 중간에 멈추면 "cancelled"로 기록
+# - 요청마다 첫 토큰까지 걸린 시간(TTFT)과 전체 시간을 JSONL로 기록
+class SummaryStream:
+    def __init__(self, client, content, model=SUMMARY_MODEL, log_file=LATENCY_LOG_FILE):
+        self.client = client
+        self.content = content
+        self.model = model
+        self.log_file = log_file
+        self.parts = []
+        self.status = None
+        self.error = None
+        self.ttft = None
+        self.total = None
+
+    @property
+    def text(self):
+        return "".join(self.parts).strip()
+
+    def tokens(self):
+        started = time.perf_counter()
+        self.status = "cancelled"  # 끝까지 순회하지 않고 닫히면 이 상태로 기록
+        response = None
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": build_summary_prompt(self.content)}],
+                stream=True,
+            )
+            finish_reason = None
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.delta and choice.delta.content:
+                    if self.ttft is None:
+                        self.ttft = time.perf_counter() - started
+                    self.parts.append(choice.delta.content)
+                    yield choice.delta.content
+                finish_reason = choice.finish_reason or finish_reason
+            # 연결이 끊겨 종료 이유 없이 끝난 응답도 미완성으로 처리
+            if finish_reason != "stop" or not self.text:
+                raise IncompleteSummary(f"요약이 완성되지 않았습니다 (finish_reason={finish_reason})")
+            self.status = "completed"
+        except Exception as e:
+            self.status = "error"
+            self.error = str(e)
+            raise
+        finally:
+            self.total = time.perf_counter() - started
+            if response is not None:
+                response.close()  # 중단된 경우 연결을 끊어 남은 토큰 생성을 멈춤
+            record_latency(self, self.log_file)
+
+
+# ✅ 공용 캐시와 함께 스트리밍 요약 → (요약, SummaryStream 또는 None)
+# 캐시에 있으면 바로 반환하고, 같은 키를 동시에 요청하면 첫 요청만 스트리밍하고 나머지는 그 결과를 기다림
+# render(tokens): 받은 조각을 끝까지 순회하며 화면에 그림 (앱에서는 st.write_stream)
+# wait(future): 다른 요청이 생성을 끝낼 때까지 기다리며 결과를 반환 (앱에서는 진행 표시와 함께 대기)
+def stream_through_cache(cache, key, client, content, model=SUMMARY_MODEL, render=list, wait=None,
+                         log_file=LATENCY_LOG_FILE):
+    summary, future, leader = cache.claim(key)
+    if summary is not None:
+        return summary, None
+    if not leader:
+        return (wait(future) if wait else future.result()), None
+
+    stream = SummaryStream(client, content, model=model, log_file=log_file)
+    try:
+        render(stream.tokens())
+        if stream.status != "completed":  # render가 끝까지 순회하지 않은 경우
+            raise IncompleteSummary("요약 스트리밍이 중간에 멈췄습니다")
+    except BaseException as e:
+        cache.finish(key, future, error=e)
+        raise
+    cache.finish(key, future, stream.text, model=model)
+    return stream.text, stream
+
+
+def record_latency(stream, log_file=LATENCY_LOG_FILE):
+    entry = {
+        "time": time.time(),
+        "model": stream.model,
+        "status": stream.status,
+        "ttft_ms": round(stream.ttft * 1000, 1) if stream.ttft is not None else None,
+        "total_ms": round(stream.total * 1000, 1),
+        "chars": len(stream.text),
+        "error": stream.error,
+    }
+    try:
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    except OSError:
+        pass  # 기록 실패가 요약 표시를 막지 않도록 무시
+
+
+def _percentile(values, q):
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return round(statistics.quantiles(values, n=100, method="inclusive")[q - 1], 1)
+
+
+# ✅ 기록된 지연 시간 요약 (상태별 건수, TTFT/전체 시간 p50·p95)
+def latency_report(log_file=LATENCY_LOG_FILE):
+    entries = []
+    try:
+        with open(log_file, "r", encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        pass
+    completed = [e for e in entries if e["status"] == "completed"]
+    ttft = [e["ttft_ms"] for e in completed if e["ttft_ms"] is not None]
+    total = [e["total_ms"] for e in completed]
+    statuses = {}
+    for e in entries:
+        statuses[e["status"]] = statuses.get(e["status"], 0) + 1
+    return {
+        "requests": len(entries),
+        "statuses": statuses,
+        "ttft_ms_p50": _percentile(ttft, 50),
+        "ttft_ms_p95": _percentile(ttft, 95),
+        "total_ms_p50": _percentile(total, 50),
+        "total_ms_p95": _percentile(total, 95),
+    }
+
+
+# ✅ 지연 시간 통계 출력 (python scripts/summary_stream.py)
+if __name__ == "__main__":
+    print(json.dumps(latency_report(), ensure_ascii=False, indent=2))
@@ -0,0 +1,80 @@
+import sys
+import json
+import random
+import hashlib
+
+# ✅ 벤치마크용 합성 한국어 뉴스 코퍼스 생성기 (시드가 같으면 항상 같은 결과)
+SOURCES = ["조선일보", "한겨레", "연합뉴스", "동아일보", "경향신문", "한국일보", "오마이뉴스"]
+CATEGORIES = ["정치", "경제", "사회", "국제", "IT", "문화", "스포츠", "연예", "과학", "오피니언"]
+NOUNS = [
+    "대통령", "정부", "국회", "후보", "선거", "경제", "금리", "물가", "수출", "반도체", "기업", "시장",
+    "주가", "환율", "부동산", "교육", "학생", "병원", "의료", "환경", "기후", "에너지", "전기차", "배터리",
+    "인공지능", "플랫폼", "스타트업", "투자", "노동", "임금", "일자리", "청년", "복지", "연금", "외교",
+    "미국", "중국", "일본", "북한", "안보", "국방", "법원", "검찰", "경찰", "사고", "재난", "축구", "야구",
+    "영화", "드라마", "음악", "공연", "관광", "서울", "부산", "지역", "농업", "산업", "정책", "예산",
+]
+PARTICLES = ["은", "는", "이", "가", "을", "를", "의", "에", "에서", "으로", "와", "과", "도"]
+FIRST_DAY_TS = 1746025200   # 2025-05-01 00:00 (한국 시간)
+PREDICATES = [
+    "발표했다", "밝혔다", "강조했다", "전망했다", "증가했다", "감소했다", "논의했다", "합의했다",
+    "비판했다", "지적했다", "추진한다", "검토하고 있다", "예정이다", "나타났다", "확인됐다",
+]
+
+
+def _sentence(rng):
+    words = []
+    for _ in range(rng.randint(3, 6)):
+        noun = rng.choice(NOUNS)
+        words.append(noun + rng.choice(PARTICLES) if rng.random() < 0.7 else noun)
+    words.append(rng.choice(PREDICATES))
+    return " ".join(words) + "."
+
+
+def make_article(index, seed=0, sentences=(4, 12)):
+    rng = random.Random(seed * 1_000_003 + index)
+    source = rng.choice(SOURCES)
+    body = " ".join(_sentence(rng) for _ in range(rng.randint(*sentences)))
+    title_words = rng.sample(NOUNS, 3)
+    day = 1 + index % 28
+    published_ts = FIRST_DAY_TS + (day - 1) * 86400 + index * 7919 % 86400  # 난수열을 바꾸지 않도록 rng 미사용
+    return {
+        "id": hashlib.sha1(f"{seed}-{index}".encode()).hexdigest()[:16],
+        "url": f"https://news.example.com/{seed}/{index}",
+        "title": f"{title_words[0]} {title_words[1]}, {title_words[2]} {rng.choice(PREDICATES)}",
+        "content": body,
+        "source": source,
+        "category": rng.choice(CATEGORIES),
+        "date": f"2025-05-{day:02d}",
+        "published_ts": published_ts,
+        "keywords": rng.sample(NOUNS, 5),
+        "collected_at": 1746000000 + index,
+    }
+
+
+# 기사를 하나씩 생성 (100만 건도 메모리에 모두 올리지 않고 처리 가능)
+def iter_articles(n, seed=0):
+    for i in range(n):
+        yield make_article(i, seed)
+
+
+def generate_articles(n, seed=0):
+    return list(iter_articles(n, seed))
+
+
+# ✅ 기존 news_articles.json 형식(기사 배열)으로 바로 파일에 기록
+def write_snapshot(path, n, seed=0):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i, article in enumerate(iter_articles(n, seed)):
+            f.write(("," if i else "") + json.dumps(article, ensure_ascii=False))
+        f.write("]")
+
+
+# ✅ 합성 코퍼스 파일 만들기: python scripts/synthetic_corpus.py 1000000 news_articles.json [seed]
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("사용법: python scripts/synthetic_corpus.py <기사 수> <출력 파일> [시드]")
+        sys.exit(1)
+    count, path = int(sys.argv[1]), sys.argv[2]
+    write_snapshot(path, count, seed=int(sys.argv[3]) if len(sys.argv) > 3 else 0)
+    print(f"✅ 합성 기사 {count}개를 {path}에 저장했습니다.")
@@ -0,0 +1,95 @@
+import re
+import time
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# ✅ 오프라인 추출 요약(TextRank) 설정
+TEXTRANK_MODEL = "textrank"   # 공용 요약 캐시에서 GPT 요약과 구분하기 위한 모델 이름
+SUMMARY_SENTENCES = 3
+MIN_SENTENCE_LENGTH = 10      # 이보다 짧은 문장(바이라인, 사진 설명 등)은 제외
+DAMPING = 0.85
+MAX_ITERATIONS = 100
+TOLERANCE = 1e-6
+
+# 문장 끝 부호(따옴표/괄호가 붙어도 됨) 뒤의 공백, 줄바꿈,
+# 또는 본문 추출 과정에서 공백 없이 붙어 버린 '다.' 뒤에서 분리
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。])[\"'”’)\]]*\s+|(?<=다\.)(?=[^\s\d.])|\n+")
+
+
+def split_sentences(text):
+    sentences = [s.strip() for s in SENTENCE_BOUNDARY.split(text or "")]
+    return [s for s in sentences if len(s) >= MIN_SENTENCE_LENGTH]
+
+
+# 한국어는 조사가 붙어 어절 단위 TF-IDF가 희소하므로 문자 2~3-gram 사용
+def _vectorizer():
+    return TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 3), sublinear_tf=True)
+
+
+# ✅ 문장 유사도 행렬에 대한 PageRank (numpy 거듭제곱법)
+def _pagerank(similarity):
+    n = similarity.shape[0]
+    np.fill_diagonal(similarity, 0.0)
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    # 다른 문장과 전혀 겹치지 않는 문장은 모든 문장으로 균등하게 이동
+    transition = np.divide(similarity, row_sums, out=np.full_like(similarity, 1.0 / n), where=row_sums > 0)
+    scores = np.full(n, 1.0 / n)
+    for _ in range(MAX_ITERATIONS):
+        updated = (1 - DAMPING) / n + DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            return updated
+        scores = updated
+    return scores
+
+
+def _top_sentences(sentences, vectors, n):
+    if len(sentences) <= n:
+        return " ".join(sentences)
+    similarity = (vectors @ vectors.T).toarray()
+    scores = _pagerank(similarity)
+    top = np.sort(np.argsort(-scores, kind="stable")[:n])  # 원문 순서대로 배치
+    return " ".join(sentences[i] for i in top)
+
+
+# ✅ 기사 하나를 n문장으로 요약
+def summarize(text, n=SUMMARY_SENTENCES):
+    sentences = split_sentences(text)
+    if len(sentences) <= n:
+        return " ".join(sentences)
+    return _top_sentences(sentences, _vectorizer().fit_transform(sentences), n)
+
+
+# ✅ 여러 기사를 한 번에 요약 (전체 문장으로 TF-IDF를 한 번만 학습한 뒤 기사별 행 블록으로 순위 계산)
+def summarize_batch(texts, n=SUMMARY_SENTENCES):
+    sentences_per_text = [split_sentences(text) for text in texts]
+    all_sentences = [s for sentences in sentences_per_text for s in sentences]
+    if not all_sentences:
+        return ["" for _ in texts]
+
+    vectors = _vectorizer().fit_transform(all_sentences)
+    summaries, offset = [], 0
+    for sentences in sentences_per_text:
+        block = vectors[offset:offset + len(sentences)]
+        summaries.append(_top_sentences(sentences, block, n))
+        offset += len(sentences)
+    return summaries
+
+
+# ✅ 카탈로그 전체를 TextRank로 요약해 공용 요약 캐시에 저장 (python scripts/textrank.py)
+if __name__ == "__main__":
+    from article_catalog import ArticleCatalog
+    from summary_cache import SummaryCache, summary_key
+
+    articles = list(ArticleCatalog().iter_articles())
+    started = time.perf_counter()
+    summaries = summarize_batch([a["content"] for a in articles])
+    elapsed = time.perf_counter() - started
+
+    cache = SummaryCache()
+    cache.put_many(
+        [(summary_key(a["content"], model=TEXTRANK_MODEL), summary) for a, summary in zip(articles, summaries) if summary],
+        model=TEXTRANK_MODEL,
+    )
+    cache.close()
+    print(f"✅ {len(articles)}개 기사 요약 완료 ({len(articles) / elapsed:.0f}건/초)")
@@ -0,0 +1,175 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+
+# ✅ 사용자 데이터 저장소 설정
+USER_DB_FILE = os.path.join("user_data", "user_data.db")
+LEGACY_USERS_FILE = os.path.join("user_data", "users.json")
+BUSY_TIMEOUT_MS = 30000   # 다른 프로세스가 쓰는 중이면 이 시간까지 대기
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    user_id TEXT NOT NULL UNIQUE,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scraps (
+    user_id TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (user_id, article_id)
+);
+CREATE TABLE IF NOT EXISTS summaries (
+    user_id TEXT NOT NULL,
+    article_id TEXT NOT NULL,
+    summary_ref TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (user_id, article_id)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+MIGRATED_QUERY = "SELECT 1 FROM meta WHERE key = 'json_migrated'"
+
+
+# ✅ 사용자/스크랩/요약 목록 저장소 (SQLite WAL)
+# - 변경은 행 단위 트랜잭션이라 파일 전체를 다시 쓰지 않음
+# - 여러 Streamlit 프로세스/탭이 같은 폴더를 써도 서로의 변경을 덮어쓰지 않음
+# - 처음 열 때 기존 users.json, <user_id>/scrap.json, summary.json을 한 번 가져옴
+class UserStore:
+    def __init__(self, path=USER_DB_FILE, legacy_users_file=LEGACY_USERS_FILE):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+        self._migrate_json(legacy_users_file)
+
+    def close(self):
+        self.conn.close()
+
+    # 쓰기 트랜잭션 (BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡아 프로세스 간 경합 시 대기)
+    # unless 질의 결과가 있으면 잠금을 잡은 뒤 아무것도 쓰지 않고 None 반환 (다른 프로세스가 먼저 처리한 경우)
+    def _write(self, statements, unless=None):
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                if unless and self.conn.execute(unless).fetchone():
+                    self.conn.execute("ROLLBACK")
+                    return None
+                results = [self.conn.execute(sql, params) for sql, params in statements]
+                self.conn.execute("COMMIT")
+                return results
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def _read(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    # ✅ 사용자
+    def get_user(self, username):
+        rows = self._read("SELECT username, password, user_id FROM users WHERE username = ?", (username,))
+        return dict(zip(("username", "password", "user_id"), rows[0])) if rows else None
+
+    # 이미 있는 사용자명이면 None, 아니면 새 user_id 반환
+    def create_user(self, username, password_hash):
+        user_id = str(uuid.uuid4())
+        cursor = self._write([(
+            "INSERT OR IGNORE INTO users (username, password, user_id, created_at) VALUES (?, ?, ?, ?)",
+            (username, password_hash, user_id, time.time()),
+        )])[0]
+        return user_id if cursor.rowcount == 1 else None
+
+    # ✅ 스크랩
+    def scraps(self, user_id):
+        rows = self._read("SELECT article_id FROM scraps WHERE user_id = ? ORDER BY created_at, rowid", (user_id,))
+        return [row[0] for row in rows]
+
+    def add_scrap(self, user_id, article_id):
+        self._write([(
+            "INSERT OR IGNORE INTO scraps (user_id, article_id, created_at) VALUES (?, ?, ?)",
+            (user_id, article_id, time.time()),
+        )])
+
+    def remove_scrap(self, user_id, article_id):
+        self._write([("DELETE FROM scraps WHERE user_id = ? AND article_id = ?", (user_id, article_id))])
+
+    # ✅ 요약 (값은 공용 요약 캐시 키 또는 이전 형식의 요약 문장)
+    def summaries(self, user_id):
+        rows = self._read(
+            "SELECT article_id, summary_ref FROM summaries WHERE user_id = ? ORDER BY created_at, rowid", (user_id,)
+        )
+        return dict(rows)
+
+    def set_summary(self, user_id, article_id, summary_ref):
+        self._write([(
+            """INSERT INTO summaries (user_id, article_id, summary_ref, created_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT(user_id, article_id) DO UPDATE SET summary_ref = excluded.summary_ref""",
+            (user_id, article_id, summary_ref, time.time()),
+        )])
+
+    # ✅ 어느 사용자든 스크랩했거나 요약을 저장한 기사 ID (보존 기간이 지나도 지우지 않음)
+    def referenced_ids(self):
+        rows = self._read("SELECT article_id FROM scraps UNION SELECT article_id FROM summaries")
+        return {row[0] for row in rows}
+
+    # ✅ 스크랩/요약 키 변경 (기사 ID → 그룹 대표 ID, 새 키로 이미 저장된 항목이 있으면 그쪽을 유지)
+    def rekey(self, user_id, mapping):
+        statements = []
+        for old_id, new_id in mapping.items():
+            for table in ("scraps", "summaries"):
+                statements.append((
+                    f"UPDATE OR IGNORE {table} SET article_id = ? WHERE user_id = ? AND article_id = ?",
+                    (new_id, user_id, old_id),
+                ))
+                statements.append((f"DELETE FROM {table} WHERE user_id = ? AND article_id = ?", (user_id, old_id)))
+        self._write(statements)
+
+    # ✅ 기존 JSON 파일 가져오기 (한 번만, 여러 프로세스가 동시에 열어도 안전)
+    # 가져온 표시는 쓰기 잠금을 잡은 뒤 다시 확인하므로 동시에 연 프로세스 중 하나만 가져옴 (self.migrated)
+    def _migrate_json(self, legacy_users_file):
+        self.migrated = False
+        if self._read(MIGRATED_QUERY):
+            return
+        user_dir = os.path.dirname(legacy_users_file)
+        users = _read_json(legacy_users_file, {})
+        statements = []
+        now = time.time()
+        for username, info in users.items():
+            statements.append((
+                "INSERT OR IGNORE INTO users (username, password, user_id, created_at) VALUES (?, ?, ?, ?)",
+                (username, info["password"], info["user_id"], now),
+            ))
+            user_path = os.path.join(user_dir, info["user_id"])
+            for article_id in _read_json(os.path.join(user_path, "scrap.json"), []):
+                statements.append((
+                    "INSERT OR IGNORE INTO scraps (user_id, article_id, created_at) VALUES (?, ?, ?)",
+                    (info["user_id"], article_id, now),
+                ))
+            for article_id, summary_ref in _read_json(os.path.join(user_path, "summary.json"), {}).items():
+                statements.append((
+                    "INSERT OR IGNORE INTO summaries (user_id, article_id, summary_ref, created_at) VALUES (?, ?, ?, ?)",
+                    (info["user_id"], article_id, summary_ref, now),
+                ))
+        statements.append(("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (str(now),)))
+        self.migrated = self._write(statements, unless=MIGRATED_QUERY) is not None
+
+
+def _read_json(path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
@@ -1,13 +1,28 @@
 import streamlit as st
 import os
 import json
-import uuid
 import csv
 import hashlib
+import math
+import time
 from openai import OpenAI
 import pandas as pd
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 import subprocess  # 외부 프로세스 실행을 위한 라이브러리
+import sys
+
+# ✅ scripts 폴더의 모듈(기사 저장소 등)을 불러오기 위한 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from article_store import ArticleStore
+from article_catalog import ArticleCatalog
+from article_index import ArticleIndex
+from similarity_index import SimilarityIndex
+from summary_cache import SummaryCache, SUMMARY_MODEL, build_summary_prompt, summary_key, is_summary_key
+from user_store import UserStore
+from summary_stream import stream_through_cache
+from collector_daemon import is_running, read_status
+from metrics import metrics, profiled
+import textrank
 
 # ✅ API 키 로딩 (환경 변수 사용)
 api_key = os.getenv("OPENAI_API_KEY")
@@ -17,31 +32,27 @@ if not api_key:
 
 client = OpenAI(api_key=api_key)
 
-# ✅ 사용자 회원가입 및 로그인 시스템
-USER_DATA_FILE = "user_data/users.json"
-os.makedirs("user_data", exist_ok=True)
+# ✅ 뉴스 피드 한 페이지에 표시할 기사 수
+PAGE_SIZE = 20
+RELATED_COUNT = 5  # 기사별로 보여줄 관련 기사 수
 
-# ✅ 사용자 데이터 로드 함수
-def load_user_data():
-    try:
-        with open(USER_DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        st.error(f"⚠️ {USER_DATA_FILE} 파일이 손상되었습니다. 사용자 데이터를 초기화합니다.")
-        return {}
-    except FileNotFoundError:
-        return {}
-
-# ✅ 사용자 데이터 저장 함수
-def save_user_data(data):
-    try:
-        with open(USER_DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-    except Exception as e:
-        st.error(f"❌ 사용자 데이터를 저장하는 동안 오류가 발생했습니다: {e}")
+# ✅ 단계별 계측 결과 (프로세스 누적값, 이 주기마다 JSONL 한 줄 추가 + Prometheus 파일 교체)
+APP_METRICS_JSONL = os.path.join("user_data", "metrics", "app.jsonl")
+APP_METRICS_PROM = os.path.join("user_data", "metrics", "app.prom")
+APP_METRICS_INTERVAL = 60
 
-# ✅ 사용자 데이터 로드
-user_data = load_user_data()
+# ✅ 수집 상태/카탈로그 버전 확인 주기 (초)
+COLLECTOR_POLL_SECONDS = 10
+COLLECTOR_STAGES = {
+    "starting": "준비", "feeds": "RSS 피드", "articles": "기사 본문", "analyze": "키워드/중복 분석",
+    "saving": "저장", "presummarize": "사전 요약",
+}
+
+# ✅ 사용자 회원가입 및 로그인 시스템
+# 사용자/스크랩/요약 목록은 SQLite(WAL) 저장소에 행 단위로 저장 (여러 프로세스가 같은 폴더를 공유해도 안전)
+@st.cache_resource
+def get_user_store():
+    return UserStore()
 
 # ✅ 비밀번호 암호화 함수
 def hash_password(password):
@@ -56,19 +67,19 @@ def show_auth_form():
         username = st.text_input("사용자명")
         password = st.text_input("비밀번호", type="password")
         if st.button("회원가입"):
-            if username in user_data:
+            # 사용자명 중복 확인과 추가를 한 트랜잭션으로 처리
+            if get_user_store().create_user(username, hash_password(password)) is None:
                 st.error("❌ 이미 존재하는 사용자명입니다.")
             else:
-                user_data[username] = {"password": hash_password(password), "user_id": str(uuid.uuid4())}
-                save_user_data(user_data)
                 st.success("✅ 회원가입 성공! 로그인하세요.")
     elif mode == "로그인":  # 'else'를 'elif mode == "로그인"'으로 명시적으로 변경
         st.subheader("로그인")
         username = st.text_input("사용자명")
         password = st.text_input("비밀번호", type="password")
         if st.button("로그인"):
-            if username in user_data and user_data[username]["password"] == hash_password(password):
-                st.session_state.user_id = user_data[username]["user_id"]
+            user = get_user_store().get_user(username)
+            if user and user["password"] == hash_password(password):
+                st.session_state.user_id = user["user_id"]
                 st.session_state.username = username
                 st.success(f"✅ 로그인 성공! 환영합니다, {username}!")
                 st.session_state.logged_in = True  # 로그인 상태를 True로 설정
@@ -85,31 +96,136 @@ def show_logout_button():
             st.session_state.logged_in = False
             st.rerun()
 
-# ✅ 뉴스 업데이트 기능
+# ✅ 뉴스 업데이트 기능 (백그라운드 수집기를 띄우고 바로 반환, 진행 상황은 수집 상태 패널에 표시)
 def update_news():
-    today = date.today().isoformat()
-    last_update = st.session_state.get("last_news_update")
-
-    if last_update == today:
-        st.sidebar.info("✅ 오늘 뉴스 업데이트 완료")
+    # 수집기는 프로세스 간 잠금으로 한 번에 하나만 실행되고, 앱은 잠금 대신 상태 파일로 확인
+    if is_running(read_status()):
+        st.sidebar.info("🔄 이미 뉴스 수집이 진행 중입니다.")
         return False
-    else:
-        st.sidebar.info("🔄 뉴스 업데이트 중...")
+    try:
+        subprocess.Popen([sys.executable, "scripts/collector_daemon.py", "--once"])
+        st.sidebar.success("🔄 뉴스 수집을 시작했습니다.")
+        return True
+    except OSError as e:
+        st.sidebar.error(f"❌ 뉴스 수집기를 실행하지 못했습니다: {e}")
+        return False
+
+# ✅ 수집 상태 패널 (주기적으로 상태 파일과 카탈로그 버전을 확인)
+# 수집기가 새 카탈로그 버전을 올리면 누가 클릭하지 않아도 앱 전체를 다시 실행해 새 색인으로 전환
+@st.fragment(run_every=COLLECTOR_POLL_SECONDS)
+def show_collector_status():
+    status = read_status()
+    progress = status.get("progress")
+    if is_running(status) and progress:
+        stage = COLLECTOR_STAGES.get(progress["stage"], progress["stage"])
+        ratio = progress["done"] / progress["total"] if progress["total"] else 0.0
+        st.progress(min(ratio, 1.0), text=f"🔄 뉴스 수집 중: {stage} {progress['done']}/{progress['total']}")
+    elif status.get("state") == "error":
+        st.caption(f"⚠️ 마지막 수집 실패: {status.get('last_error')}")
+    elif status.get("finished_at"):
+        finished = datetime.fromtimestamp(status["finished_at"]).strftime("%m-%d %H:%M")
+        new_articles = (status.get("last_result") or {}).get("new_articles", 0)
+        st.caption(f"🕒 마지막 수집 {finished} · 새 기사 {new_articles}건")
+
+    if get_catalog().version() != st.session_state.get("catalog_version"):
+        st.rerun(scope="app")
+
+# ✅ 기사 카탈로그 (SQLite, 모든 세션이 연결 하나를 공유)
+@st.cache_resource
+def get_catalog():
+    catalog = ArticleCatalog()
+    # 카탈로그가 비어 있으면 기사 저장소(날짜별 파일, 이전 버전 news_articles.json은 자동으로 옮김)에서 한 번 가져옴
+    if catalog.count() == 0:
         try:
-            # scripts/news_collect.py 실행
-            subprocess.run(["python", "scripts/news_collect.py"], check=True)
-            st.session_state.last_news_update = today
-            st.sidebar.success("✅ 뉴스 업데이트 완료")
-            # 뉴스 데이터를 다시 로드하여 화면에 반영
-            if "articles" in st.session_state:
-                del st.session_state["articles"]
-            return True
-        except subprocess.CalledProcessError as e:
-            st.sidebar.error(f"❌ 뉴스 업데이트 실패: {e}")
-            return False
-        except FileNotFoundError:
-            st.sidebar.error("❌ scripts/news_collect.py 파일을 찾을 수 없습니다.")
-            return False
+            store = ArticleStore()
+            if store.partitions():
+                catalog.import_store(store)
+        except json.JSONDecodeError:
+            st.error("⚠️ news_articles.json 파일이 손상되었습니다. 파일을 확인하거나 다시 생성해주세요.")
+    return catalog
+
+# ✅ 기사 색인 (프로세스 전체에서 하나만 만들어 모든 세션이 공유, 본문은 필요할 때 카탈로그에서 읽음)
+# 카탈로그 버전별로 캐시하고 최신 버전 하나만 보관 (새 버전이 올라오면 다시 구성)
+@st.cache_resource(max_entries=1)
+def get_article_index(version):
+    return ArticleIndex.from_catalog(get_catalog())
+
+# ✅ 유사도 색인 (검색 순위 + 관련 기사, 수집기가 만든 파일을 카탈로그 버전별로 한 번만 읽음)
+# 기사 색인 위치 → 유사도 색인 행 번호 배열도 함께 만들어 검색할 때마다 ID를 찾지 않도록 함
+@st.cache_resource(max_entries=1)
+def get_similarity_index(version):
+    index = SimilarityIndex()
+    index.vectors()  # 정규화된 TF-IDF 행렬을 미리 계산해 첫 검색이 느려지지 않도록
+    return index, index.rows(get_article_index(version).ids)
+
+# ✅ 페이지 기사들의 관련 기사 (스크랩/요약 클릭으로 같은 페이지를 다시 그릴 때는 캐시 사용)
+@st.cache_data(max_entries=256, show_spinner=False)
+def get_related(version, ids):
+    similarity_index, _ = get_similarity_index(version)
+    return similarity_index.related(list(ids), k=RELATED_COUNT * 2)
+
+# ✅ 공용 요약 캐시 (모든 사용자/세션이 공유)
+@st.cache_resource
+def get_summary_cache():
+    return SummaryCache()
+
+# ✅ OpenAI로 기사 요약 생성
+def request_summary(content):
+    with metrics.timer("openai_summary", mode="batch"):
+        response = client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=[
+                {
+                    "role": "user",
+                    "content": build_summary_prompt(content),
+                }
+            ]
+        )
+    return response.choices[0].message.content.strip()
+
+# ✅ 스트리밍 요약: 받은 토큰을 바로 화면에 그리고, 끝까지 받은 경우에만 공용 캐시에 저장
+# 같은 기사를 여러 사용자가 동시에 요청하면 첫 요청만 스트리밍하고 나머지는 저장된 결과를 기다림
+def stream_summary(content, key, model):
+    def render(tokens):
+        with st.container(border=True):
+            st.write_stream(tokens)  # 중간에 실패하면 예외가 나고 캐시/사용자 목록에는 저장하지 않음
+
+    def wait(future):
+        with st.spinner("다른 사용자가 같은 기사를 요약하는 중입니다..."):
+            return future.result()
+
+    summary, stream = stream_through_cache(get_summary_cache(), key, client, content, model, render=render, wait=wait)
+    if stream is None:
+        st.success(summary)
+        return summary
+    metrics.observe("openai_ttft", stream.ttft, mode="stream")
+    metrics.observe("openai_summary", stream.total, mode="stream")
+    st.caption(f"⏱ 첫 토큰 {stream.ttft:.2f}초 · 전체 {stream.total:.2f}초")
+    return summary
+
+# ✅ 요약 방식: GPT-4o(스트리밍/일괄 응답) 또는 TextRank(오프라인 추출 요약, 즉시/무료)
+# 요약 함수가 None이면 스트리밍으로 표시 (스트리밍/일괄 응답은 같은 모델이므로 캐시를 공유)
+SUMMARY_MODES = {
+    "GPT-4o (스트리밍)": (SUMMARY_MODEL, None),
+    "GPT-4o": (SUMMARY_MODEL, request_summary),
+    "TextRank (오프라인)": (textrank.TEXTRANK_MODEL, textrank.summarize),
+}
+
+# ✅ 사용자 요약 목록의 값 → 요약 문장 (새 형식은 공용 캐시 키, 이전 형식은 요약 문장 그대로)
+def resolve_summary(value):
+    if is_summary_key(value):
+        return get_summary_cache().peek(value)
+    return value
+
+# ✅ 피드 페이지 이동 (on_click 콜백이라 클릭 즉시 반영, 재실행 한 번으로 끝남)
+def change_feed_page(step):
+    st.session_state.feed_page = st.session_state.get("feed_page", 0) + step
+
+def show_page_navigation(page, page_count):
+    prev_col, info_col, next_col = st.columns([1, 2, 1])
+    prev_col.button("◀ 이전", key="feed_prev", on_click=change_feed_page, args=(-1,), disabled=page <= 0)
+    info_col.markdown(f"<div style='text-align:center'>{page + 1} / {page_count} 페이지</div>", unsafe_allow_html=True)
+    next_col.button("다음 ▶", key="feed_next", on_click=change_feed_page, args=(1,), disabled=page >= page_count - 1)
 
 # ✅ 로그인된 사용자 확인 및 메인 페이지 표시
 def show_main_page():
@@ -127,143 +243,172 @@ def show_main_page():
     #if st.sidebar.button("📰 뉴스 업데이트"):
     #    update_news()
 
-    # ✅ 사용자 파일 저장 디렉토리
-    USER_FILES_DIR = os.path.join("user_data", user_id)
-    os.makedirs(USER_FILES_DIR, exist_ok=True)
-
-    scrap_file = os.path.join(USER_FILES_DIR, "scrap.json")
-    summary_file = os.path.join(USER_FILES_DIR, "summary.json")
-
-    # ✅ 스크랩 및 요약 로드 (파일에서 항상 로드)
-    if "scrap_list" not in st.session_state:
-        if os.path.exists(scrap_file):
-            try:
-                with open(scrap_file, "r", encoding="utf-8") as f:
-                    st.session_state.scrap_list = json.load(f)
-            except json.JSONDecodeError:
-                st.error(f"⚠️ {scrap_file} 파일이 손상되었습니다. 스크랩 목록을 초기화합니다.")
-                st.session_state.scrap_list = []
-        else:
-            st.session_state.scrap_list = []
-
-    if "summary_map" not in st.session_state:
-        if os.path.exists(summary_file):
-            try:
-                with open(summary_file, "r", encoding="utf-8") as f:
-                    st.session_state.summary_map = json.load(f)
-            except json.JSONDecodeError:
-                st.error(f"⚠️ {summary_file} 파일이 손상되었습니다. 요약 목록을 초기화합니다.")
-                st.session_state.summary_map = {}
-        else:
-            st.session_state.summary_map = {}
-
-    scrap_list = st.session_state.scrap_list
-    summary_map = st.session_state.summary_map
-
-    # ✅ 뉴스 로딩 (세션 상태를 사용하여 한 번만 로드)
-    @st.cache_data
-    def load_articles(filename="news_articles.json"):
-        if os.path.exists(filename):
-            try:
-                with open(filename, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                st.error(f"⚠️ {filename} 파일이 손상되었습니다. 파일을 확인하거나 다시 생성해주세요.")
-                return []
-            except Exception as e:
-                st.error(f"⚠️ {filename} 파일을 읽는 동안 예외가 발생했습니다: {e}")
-                return []
-        else:
-            st.error(f"❌ 뉴스 파일 {filename}이 존재하지 않습니다.")
-            return []
-
-    if "articles" not in st.session_state:
-        st.session_state.articles = load_articles()
-    articles = st.session_state.articles
+    # ✅ 뉴스 색인 (모든 세션이 같은 읽기 전용 색인을 공유)
+    with metrics.timer("index_load"):
+        catalog = get_catalog()
+        catalog_version = catalog.version()
+        article_index = get_article_index(catalog_version)
+        similarity_index, similarity_rows = get_similarity_index(catalog_version)
+    st.session_state.catalog_version = catalog_version
+
+    # ✅ 스크랩 및 요약 목록 로드 (매 실행마다 저장소에서 읽어 다른 탭/프로세스의 변경도 반영)
+    user_store = get_user_store()
+    scrap_list = user_store.scraps(user_id)
+    summary_map = user_store.summaries(user_id)
+    # 그룹 대표 ID가 아닌 기사 ID로 저장된 항목(그룹으로 묶이기 전에 저장한 경우 등)은 대표 ID로 옮김
+    stale = {}
+    for saved_id in set(scrap_list) | set(summary_map):
+        position = article_index.positions.get(saved_id)
+        if position is not None and article_index.group_id(position) != saved_id:
+            stale[saved_id] = article_index.group_id(position)
+    if stale:
+        user_store.rekey(user_id, stale)
+        scrap_list = user_store.scraps(user_id)
+        summary_map = user_store.summaries(user_id)
+
+    with st.sidebar:
+        show_collector_status()  # 수집 진행 상황 + 새 카탈로그 자동 반영
+    has_articles = len(article_index) > 0
+    if not has_articles:
+        st.error("❌ 뉴스 데이터가 없습니다. 뉴스를 먼저 수집해주세요.")
 
     # ✅ 필터 설정
     st.sidebar.title("🔍 필터 설정")
-    if articles:
-        all_categories = list(set([a["category"] for a in articles]))
-        all_sources = list(set([a["source"] for a in articles]))
-        all_keywords = list(set([kw for a in articles for kw in a.get("keywords", [])]))
+    if has_articles:
+        all_categories = article_index.categories()
+        all_sources = article_index.sources()
+        all_keywords = article_index.all_keywords()
 
         selected_categories = st.sidebar.multiselect("카테고리 선택", all_categories)
         selected_sources = st.sidebar.multiselect("언론사 선택", all_sources)
         selected_keyword = st.sidebar.selectbox("키워드 선택", ["(선택 안 함)"] + all_keywords)
         search_text = st.sidebar.text_input("검색어 입력")
 
-        # ✅ 필터 적용
-        filtered_articles = [
-            a for a in articles if
-            (a["category"] in selected_categories if selected_categories else True)
-            and (a["source"] in selected_sources if selected_sources else True)
-            and (selected_keyword == "(선택 안 함)" or selected_keyword in a.get("keywords", []))
-            and (search_text.lower() in (a["title"] + a["content"]).lower())
-        ]
+        # 기간 선택 (기본값은 전체 기간, 날짜를 하나만 고른 동안은 그 날짜부터)
+        first_day, last_day = date.fromisoformat(article_index.days[0]), date.fromisoformat(article_index.days[-1])
+        selected_dates = st.sidebar.date_input(
+            "기간 선택", value=(first_day, last_day), min_value=first_day, max_value=last_day
+        )
+        date_from = selected_dates[0].isoformat() if selected_dates else None
+        date_to = selected_dates[1].isoformat() if len(selected_dates) > 1 else None
+        summary_mode = st.sidebar.radio("요약 방식", list(SUMMARY_MODES))
+
+        # ✅ 필터 적용 (역색인으로 후보를 줄인 뒤 최신순, 검색어가 있으면 TF-IDF 유사도 순으로 정렬)
+        with metrics.timer("filter"):
+            filtered_positions = article_index.filter(
+                categories=selected_categories,
+                sources=selected_sources,
+                keyword=None if selected_keyword == "(선택 안 함)" else selected_keyword,
+                date_from=date_from,
+                date_to=date_to,
+            )
+            if search_text:
+                scores = similarity_index.scores(search_text, similarity_rows[filtered_positions])
+                filtered_positions = article_index.rank(filtered_positions, search_text, scores)
+            # 여러 언론사에 실린 같은 기사는 하나만 표시
+            filtered_positions = article_index.collapse(filtered_positions)
+
+        # 필터가 바뀌면 첫 페이지로 (스크랩/요약 클릭으로 인한 재실행에서는 현재 페이지 유지)
+        filter_key = (tuple(selected_categories), tuple(selected_sources), selected_keyword, search_text, date_from, date_to)
+        if st.session_state.get("feed_filter_key") != filter_key:
+            st.session_state.feed_filter_key = filter_key
+            st.session_state.feed_page = 0
     else:
-        filtered_articles = []
+        filtered_positions = []
+        summary_mode = next(iter(SUMMARY_MODES))
+
+    # ✅ 현재 페이지의 기사만 화면에 그림
+    page_count = max(1, math.ceil(len(filtered_positions) / PAGE_SIZE))
+    page = min(max(st.session_state.get("feed_page", 0), 0), page_count - 1)
+    st.session_state.feed_page = page
+    page_articles = article_index.articles(filtered_positions[page * PAGE_SIZE:(page + 1) * PAGE_SIZE])
+
+    # ✅ 현재 페이지 기사들의 관련 기사 (페이지 전체를 행렬 곱 한 번으로 계산, 같은 기사 그룹은 제외)
+    with metrics.timer("related"):
+        related_map = get_related(catalog_version, tuple(a["id"] for a in page_articles))
 
     # ✅ UI
+    render_started = time.perf_counter()
     st.title("📢 AI 뉴스 요약 & 스크랩 (사용자별 저장)")
-    if not filtered_articles:
+    if not page_articles:
         st.warning("⚠️ 필터 조건에 맞는 뉴스가 없습니다.")
     else:
-        for article in filtered_articles:
+        st.caption(f"총 {len(filtered_positions)}건 중 {page * PAGE_SIZE + 1}~{page * PAGE_SIZE + len(page_articles)}번째 뉴스")
+        for article in page_articles:
             st.markdown("---")
             st.subheader(f"📰 {article['title']}")
             st.caption(f"{article['date']} | {article['source']} | 📂 {article['category']}")
 
             if article.get("keywords"):
                 st.markdown("**🔑 키워드:** " + ", ".join(article["keywords"]))
-
-            article_id = article["id"]
+            if article["also_in"]:
+                st.caption("🔁 같은 기사: " + ", ".join(article["also_in"]))
+            related_positions = article_index.collapse([
+                article_index.positions[related_id] for related_id, _ in related_map.get(article["id"], [])
+                if related_id in article_index.positions
+                and article_index.group_id(article_index.positions[related_id]) != article["group_id"]
+            ])[:RELATED_COUNT]
+            if related_positions:
+                with st.expander("🔗 관련 기사"):
+                    for related in article_index.articles(related_positions):
+                        st.write(f"- {related['title']} ({related['date']} | {related['source']})")
+
+            # 같은 기사 그룹은 요약/스크랩을 대표 기사 ID로 공유
+            article_id = article["group_id"]
 
             # ✅ 사용자 요약
-            if article_id in summary_map:
-                st.success(summary_map[article_id])
+            summary = resolve_summary(summary_map[article_id]) if article_id in summary_map else None
+            if summary:
+                st.success(summary)
             else:
                 if st.button(f"요약 보기", key=f"{article_id}_summary"):
+                    summary_started = time.perf_counter()
+                    metrics.count("summary_requests", mode=summary_mode)
                     try:
-                        response = client.chat.completions.create(
-                            model="gpt-4o",
-                            messages=[
-                                {
-                                    "role": "user",
-                                    "content": f"다음 뉴스 기사를 3문장으로 요약해줘:\n\n{article['content']}",
-                                }
-                            ]
-                        )
-                        summary = response.choices[0].message.content.strip()
-                        summary_map[article_id] = summary
-                        with open(summary_file, "w", encoding="utf-8") as f:
-                            json.dump(summary_map, f, ensure_ascii=False, indent=2)
-                        st.success(summary)
+                        # 같은 본문/프롬프트/모델의 요약은 공용 캐시에서 재사용 (동시 요청은 API 1회로 합침)
+                        content = catalog.get_content(article["group_rowid"])
+                        model, summarize = SUMMARY_MODES[summary_mode]
+                        key = summary_key(content, model=model)
+                        if summarize is None:
+                            stream_summary(content, key, model)
+                        else:
+                            summary = get_summary_cache().get_or_create(key, lambda: summarize(content), model=model)
+                            st.success(summary)
+                        user_store.set_summary(user_id, article_id, key)  # 사용자 목록에는 캐시 키만 저장
+                        summary_map[article_id] = key
                     except Exception as e:
+                        metrics.count("summary_errors", mode=summary_mode)
                         st.error(f"❌ 요약 생성 중 오류 발생: {e}")
+                    # 요약 처리 시간은 화면 그리기 시간에서 제외
+                    summary_elapsed = time.perf_counter() - summary_started
+                    render_started += summary_elapsed
+                    metrics.observe("summary", summary_elapsed, mode=summary_mode)
 
             # ✅ 사용자 스크랩
             if article_id in scrap_list:
                 st.info("✔ 이미 스크랩한 뉴스입니다.")
                 if st.button("❌ 스크랩 취소", key=f"unscrap_{article_id}"):  # 스크랩 취소 버튼
+                    user_store.remove_scrap(user_id, article_id)
                     scrap_list.remove(article_id)
-                    with open(scrap_file, "w", encoding="utf-8") as f:
-                        json.dump(scrap_list, f, ensure_ascii=False)
                     st.success("스크랩이 취소되었습니다.")
                     st.rerun()  # 페이지 새로고침
             else:
                 if st.button("🤍 스크랩", key=f"{article_id}_scrap"):
+                    user_store.add_scrap(user_id, article_id)
                     scrap_list.append(article_id)
-                    with open(scrap_file, "w", encoding="utf-8") as f:
-                        json.dump(scrap_list, f, ensure_ascii=False)
                     st.success("뉴스를 스크랩했습니다.")
 
+        st.markdown("---")
+        show_page_navigation(page, page_count)
+    metrics.observe("render", time.perf_counter() - render_started)
+
     # ✅ 사이드바에 스크랩된 뉴스 표시
+    export_started = time.perf_counter()
     st.sidebar.title("📌 스크랩된 뉴스")
+    scrapped_articles = article_index.lookup(scrap_list)
     if scrap_list:
-        for article in articles:
-            if article["id"] in scrap_list:
-                st.sidebar.write(f"✅ {article['title']} ({article['date']} | {article['source']})")
+        for article in scrapped_articles:
+            st.sidebar.write(f"✅ {article['title']} ({article['date']} | {article['source']})")
     else:
         st.sidebar.write("스크랩된 뉴스가 없습니다.")
 
@@ -272,8 +417,7 @@ def show_main_page():
     if scrap_list:
         scrap_info = [
             {"title": a["title"], "date": a["date"], "source": a["source"]}
-            for a in articles
-            if a["id"] in scrap_list
+            for a in scrapped_articles
         ]
         scrap_df = pd.DataFrame(scrap_info)  # pandas DataFrame으로 변환
         scrap_csv = scrap_df.to_csv(index=False)
@@ -290,10 +434,9 @@ def show_main_page():
             {
                 "title": a["title"],
                 "date": a["date"],
-                "summary": summary_map.get(a["id"], "요약 없음"),
+                "summary": resolve_summary(summary_map.get(a["id"]) or summary_map.get(a["group_id"])) or "요약 없음",
             }
-            for a in articles
-            if a["id"] in summary_map
+            for a in article_index.lookup(summary_map.keys())
         ]
         summary_df = pd.DataFrame(summary_info)  # pandas DataFrame으로 변환
         summary_csv = summary_df.to_csv(index=False)
@@ -303,17 +446,30 @@ def show_main_page():
             file_name=f"summary_info_{user_id}.csv",  # 파일명에 user_id 사용
             mime="text/csv",
         )
+    metrics.observe("sidebar_export", time.perf_counter() - export_started)
+
+# ✅ 계측 결과 내보내기 (마지막으로 내보낸 뒤 APP_METRICS_INTERVAL초가 지났을 때만)
+def export_app_metrics():
+    try:
+        if os.path.exists(APP_METRICS_PROM) and time.time() - os.path.getmtime(APP_METRICS_PROM) < APP_METRICS_INTERVAL:
+            return
+        metrics.write_prometheus(APP_METRICS_PROM)
+        metrics.write_jsonl(APP_METRICS_JSONL, run="app", pid=os.getpid())
+    except OSError:
+        pass  # 계측 실패가 화면 표시를 막지 않도록 무시
 
 
-# ✅ 앱 실행
+# ✅ 앱 실행 (SUMMARIZEBOT_PROFILE 환경 변수가 있으면 실행마다 cProfile 결과 저장)
 def run_app():
     if "logged_in" not in st.session_state:
         st.session_state.logged_in = False  # 초기 로그인 상태를 False로 설정
 
-    if not st.session_state.logged_in:
-        show_auth_form()  # 로그인/회원 가입 폼 표시
-    else:
-        show_main_page()  # 메인 페이지 표시
+    with profiled("app"), metrics.timer("app_run"):
+        if not st.session_state.logged_in:
+            show_auth_form()  # 로그인/회원 가입 폼 표시
+        else:
+            show_main_page()  # 메인 페이지 표시
+    export_app_metrics()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# ✅ scripts 폴더의 모듈은 서로를 같은 폴더 기준으로 import하므로 테스트에서도 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
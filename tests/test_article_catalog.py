@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+import article_catalog
+from article_catalog import ArticleCatalog
+from article_index import ArticleIndex
+from article_store import day_start
+
+ARTICLES = [
+    {"id": "a1", "title": "반도체 수출 증가", "content": "인공지능 서버용 메모리 수요로 수출이 늘었다.", "source": "연합뉴스",
+     "category": "경제", "date": "2025-05-10", "keywords": ["반도체", "수출"]},
+    {"id": "a2", "title": "기준금리 동결", "content": "한국은행이 기준금리를 동결했다.", "source": "한겨레",
+     "category": "경제", "date": "2025-05-11", "keywords": ["금리"]},
+    {"id": "a3", "title": "국회 본회의", "content": "인공지능 기본법이 본회의를 통과했다.", "source": "연합뉴스",
+     "category": "정치", "date": "2025-05-12", "keywords": ["국회", "인공지능"]},
+    {"id": "a4", "title": "100% 달성", "content": "목표치 100%를 달성했다.", "source": "경향신문",
+     "category": "사회", "date": "2025-05-12", "keywords": []},
+]
+
+QUERIES = [
+    {},
+    {"categories": ["경제"]},
+    {"categories": ["경제"], "sources": ["연합뉴스"]},
+    {"keyword": "인공지능"},
+    {"search": "인공지능"},        # 3글자 이상: FTS
+    {"search": "금리"},            # 2글자: LIKE
+    {"search": "0%"},              # LIKE 특수 문자는 그대로 검색
+    {"date_from": "2025-05-11", "date_to": "2025-05-11"},
+    {"date_from": "2025-05-11", "categories": ["경제", "정치"], "search": "본회"},
+]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = ArticleCatalog(str(tmp_path / "news_catalog.db"))
+    catalog.upsert_articles([dict(a, published_ts=day_start(a["date"]) + 3600) for a in ARTICLES])
+    yield catalog
+    catalog.close()
+
+
+def ids(articles):
+    return [a["id"] for a in articles]
+
+
+def test_indexed_queries(catalog):
+    assert ids(catalog.query()) == ["a4", "a3", "a2", "a1"]
+    assert ids(catalog.query(categories=["경제"], sources=["연합뉴스"])) == ["a1"]
+    assert ids(catalog.query(keyword="인공지능")) == ["a3"]
+    assert ids(catalog.query(search="인공지능")) == ["a3", "a1"]
+    assert ids(catalog.query(search="금리")) == ["a2"]
+    assert ids(catalog.query(search="0%")) == ["a4"]
+    assert ids(catalog.query(date_from="2025-05-11", date_to="2025-05-11")) == ["a2"]
+    assert ids(catalog.query(limit=2, offset=1)) == ["a3", "a2"]
+    assert catalog.count(categories=["경제"]) == 2
+    assert catalog.categories() == ["경제", "사회", "정치"]
+    assert catalog.sources() == ["경향신문", "연합뉴스", "한겨레"]
+    assert catalog.keywords() == ["국회", "금리", "반도체", "수출", "인공지능"]
+
+
+# ✅ 기사를 갱신하면 FTS/키워드 색인도 같이 바뀌고, 삭제하면 색인에서도 빠짐
+def test_upsert_and_remove_keep_indexes_in_sync(catalog):
+    catalog.upsert_articles([dict(ARTICLES[0], title="반도체 감산", content="감산 소식", keywords=["감산"],
+                                  published_ts=day_start("2025-05-10"))])
+    assert ids(catalog.query(search="인공지능")) == ["a3"]
+    assert ids(catalog.query(keyword="감산")) == ["a1"] and catalog.query(keyword="반도체") == []
+
+    catalog.remove_articles(["a3"])
+    assert catalog.query(search="인공지능") == [] and catalog.query(keyword="국회") == []
+
+
+# ✅ 앱의 공유 메모리 색인은 카탈로그를 읽어 만들므로 같은 조건에 같은 결과(최신순)를 냄
+def test_memory_index_matches_catalog_queries(catalog):
+    index = ArticleIndex.from_catalog(catalog)
+    for q in QUERIES:
+        assert [index.ids[p] for p in index.filter(**q)] == ids(catalog.query(**q)), q
+
+
+# ✅ 전체 읽기는 묶음 단위로 이어 읽어도 최신순 전체를 한 번씩 돌려주고(게시 시각이 같은 기사 포함),
+# 넘겨받는 동안에는 잠금을 잡고 있지 않아 다른 세션의 조회가 막히지 않음
+def test_iter_articles_pages_without_holding_the_lock(catalog, monkeypatch):
+    catalog.upsert_articles([
+        dict(ARTICLES[3], id=f"tie{i}", published_ts=day_start("2025-05-12") + 3600) for i in range(3)
+    ])
+    monkeypatch.setattr(article_catalog, "ITER_BATCH", 2)
+    expected = ids(catalog.query())
+
+    seen = []
+    for article in catalog.iter_articles():
+        seen.append(article["id"])
+        versions = []
+        reader = threading.Thread(target=lambda: versions.append(catalog.version()))
+        reader.start()
+        reader.join(timeout=1)
+        assert versions, "iter_articles holds the catalog lock"
+    assert seen == expected and len(seen) == len(ARTICLES) + 3
+
+
+# ✅ 질의용 색인 테이블 없이 만들어진 카탈로그를 열면 기존 기사로 색인을 다시 채움
+def test_reopening_rebuilds_missing_query_indexes(catalog):
+    with catalog.conn:
+        catalog.conn.executescript(
+            "DROP TRIGGER articles_ai; DROP TRIGGER articles_ad; DROP TRIGGER articles_au;"
+            "DROP TABLE articles_fts; DROP TABLE article_keywords;"
+        )
+    catalog.close()
+
+    reopened = ArticleCatalog(catalog.path)
+    assert ids(reopened.query(search="인공지능")) == ["a3", "a1"]
+    assert ids(reopened.query(keyword="수출")) == ["a1"]
+    reopened.close()
@@ -0,0 +1,79 @@
+import os
+import json
+
+from article_store import ArticleStore, MIGRATED_MARKER, day_start
+from article_catalog import ArticleCatalog
+from user_store import UserStore
+
+
+def make_article(article_id, day, canonical_id=None):
+    return {
+        "id": article_id, "title": f"제목 {article_id}", "content": "본문", "source": "연합뉴스", "category": "사회",
+        "date": day, "published_ts": day_start(day) + 3600, "keywords": [], "canonical_id": canonical_id or article_id,
+    }
+
+
+def write_legacy_snapshot(path, articles):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(articles, f, ensure_ascii=False)
+
+
+# ✅ 이전 버전 저장소는 한 번만 옮김 (보존 기간 정리로 날짜 파일이 모두 지워져도 다시 옮기지 않음)
+def test_legacy_store_is_migrated_once(tmp_path):
+    snapshot = str(tmp_path / "news_articles.json")
+    write_legacy_snapshot(snapshot, [make_article("old", "2021-03-02")])
+    partition_dir = str(tmp_path / "news_partitions")
+
+    store = ArticleStore(partition_dir=partition_dir, legacy_snapshot=snapshot)
+    assert store.known_ids() == {"old"}
+    assert os.path.exists(os.path.join(partition_dir, MIGRATED_MARKER))
+
+    store.drop_before(day_start("2025-05-01"))
+    assert store.partitions() == []
+    assert ArticleStore(partition_dir=partition_dir, legacy_snapshot=snapshot).partitions() == []
+
+
+# ✅ 보존 기간 정리: 스크랩/요약된 기사는 남기고 나머지만 삭제
+def test_drop_before_keeps_referenced_articles(tmp_path):
+    store = ArticleStore(partition_dir=str(tmp_path / "news_partitions"), legacy_snapshot=str(tmp_path / "none.json"))
+    store.append([
+        make_article("pinned", "2021-03-02"), make_article("stale", "2021-03-02"),
+        make_article("only-pinned", "2022-07-01"), make_article("gone", "2023-01-05"),
+        make_article("fresh", "2025-05-12"),
+    ])
+    pinned_day = store._path("2022-07-01")
+    mtime = os.stat(pinned_day).st_mtime_ns
+
+    dropped = store.drop_before(day_start("2025-05-01"), keep={"pinned", "only-pinned"})
+
+    assert dropped == ["2021-03-02", "2023-01-05"]
+    assert store.partitions() == ["2021-03-02", "2022-07-01", "2025-05-12"]
+    assert [a["id"] for a in store.load()] == ["pinned", "only-pinned", "fresh"]
+    assert os.stat(pinned_day).st_mtime_ns == mtime  # 남길 기사만 있는 날짜 파일은 다시 쓰지 않음
+    assert store.known_ids() == {"pinned", "only-pinned", "fresh"}
+    # 목록 파일도 같은 내용으로 저장됨
+    assert ArticleStore(partition_dir=store.partition_dir).known_ids() == {"pinned", "only-pinned", "fresh"}
+
+
+# ✅ 카탈로그: 사용자 데이터가 가리키는 기사와 같은 그룹 기사는 보존 기간이 지나도 남김
+def test_catalog_retention_keeps_user_referenced_groups(tmp_path):
+    users = UserStore(str(tmp_path / "user_data.db"), legacy_users_file=str(tmp_path / "users.json"))
+    users.add_scrap("u1", "group-a")                 # 그룹 대표 ID로 저장된 스크랩 (대표 기사는 이미 없음)
+    users.set_summary("u2", "legacy-1", "요약 문장")   # 이전 버전 기사의 요약
+    referenced = users.referenced_ids()
+    users.close()
+    assert referenced == {"group-a", "legacy-1"}
+
+    catalog = ArticleCatalog(str(tmp_path / "news_catalog.db"))
+    catalog.upsert_articles([
+        make_article("member-1", "2021-03-02", canonical_id="group-a"),
+        make_article("legacy-1", "2021-05-03"),
+        make_article("legacy-2", "2021-05-03"),
+        make_article("fresh", "2025-05-12"),
+    ])
+    keep = catalog.group_members(referenced)
+    assert keep == {"member-1", "legacy-1"}
+
+    assert catalog.remove_before(day_start("2025-05-01"), keep) == ["legacy-2"]
+    assert sorted(a["id"] for a in catalog.query()) == ["fresh", "legacy-1", "member-1"]
+    catalog.close()
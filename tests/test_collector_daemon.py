@@ -0,0 +1,57 @@
+import os
+import time
+import threading
+import subprocess
+import sys
+
+from collector_daemon import CollectorLock, is_running, read_status, write_status
+
+
+def test_lock_is_exclusive_across_processes(tmp_path):
+    lock_path = str(tmp_path / "collector.lock")
+    holder = subprocess.Popen([
+        sys.executable, "-c",
+        "import sys, time; sys.path.insert(0, sys.argv[1]); from collector_daemon import CollectorLock; "
+        "lock = CollectorLock(sys.argv[2]); assert lock.acquire(); print('held', flush=True); time.sleep(0.5)",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"), lock_path,
+    ], stdout=subprocess.PIPE, text=True)
+    try:
+        assert holder.stdout.readline().strip() == "held"
+        lock = CollectorLock(lock_path)
+        assert not lock.acquire()
+        # 잠금을 잡은 프로세스가 끝나면 기다리던 쪽이 이어서 잡음
+        assert lock.acquire(wait=5)
+        lock.release()
+    finally:
+        holder.wait()
+
+
+# ✅ 잠깐 잠금을 잡았다 놓는 쪽이 있어도 수집기는 짧게 다시 시도해 잠금을 얻음
+def test_acquire_retries_briefly(tmp_path):
+    lock_path = str(tmp_path / "collector.lock")
+    other = CollectorLock(lock_path)
+    assert other.acquire()
+    threading.Timer(0.3, other.release).start()
+
+    lock = CollectorLock(lock_path)
+    started = time.monotonic()
+    assert lock.acquire(wait=2)
+    assert time.monotonic() - started < 1.0
+    lock.release()
+
+
+def test_is_running_checks_the_recorded_pid(tmp_path):
+    status_path = str(tmp_path / "collector_status.json")
+    assert not is_running(read_status(status_path))
+
+    write_status({"state": "running", "pid": os.getpid()}, status_path)
+    assert is_running(read_status(status_path))
+
+    # 강제 종료된 수집기가 남긴 running 상태는 실행 중으로 보지 않음
+    finished = subprocess.Popen([sys.executable, "-c", "pass"])
+    finished.wait()
+    write_status({"state": "running", "pid": finished.pid}, status_path)
+    assert not is_running(read_status(status_path))
+
+    write_status({"state": "idle", "pid": None}, status_path)
+    assert not is_running(read_status(status_path))
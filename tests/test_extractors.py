@@ -0,0 +1,70 @@
+import os
+
+import lxml.html
+import pytest
+
+from extractors import SITE_SELECTORS, extract_from_html, extract_from_feed, html_to_text
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "extractors")
+MIN_BODY_LENGTH = 200  # 저장된 기사 페이지의 본문은 모두 이보다 김
+
+# ✅ 픽스처 출처
+# - 한겨레/연합뉴스/동아일보: news_articles.json에 수집돼 있던 실제 기사 본문(2025-05-12)을 그대로 쓰고,
+#   그 수집 결과에 섞여 들어왔던 페이지 요소(음성 듣기, 광고 표시, 사진 설명, 기자 구독 버튼, 저작권 문구)를 함께 넣음
+# - 경향신문/한국일보/중앙일보: 수집된 기사가 없어 직접 작성한 페이지
+# - 사이트 개편으로 선택자를 고칠 때는 실제 기사 페이지를 받아 광고/추적 스크립트만 잘라내고 이 파일들을 바꿀 것
+
+# ✅ 사이트별 기사 페이지의 제목 (페이지 머리의 로고/메뉴가 아니라 기사 제목을 골라야 함)
+TITLES = {
+    "www.hani.co.kr": "권영국 “노동자와 함께 기득권 정치 혁신”",
+    "www.yna.co.kr": "[날씨] 전국 낮기온 25도 안팎 '초여름' 더위…일교차 커",
+    "www.donga.com": "‘후보 부인’ 김혜경-설난영, 선거운동 첫날 손잡았다",
+    "www.khan.co.kr": "전통시장 주차장 무료 개방 시간 늘린다",
+    "www.hankookilbo.com": "하천 산책로 야간 조명 정비…어두운 구간 없앤다",
+    "www.joongang.co.kr": "초등학교 방과후 돌봄 대기 줄인다…교실 20곳 추가",
+}
+
+# 본문에 섞이면 안 되는 페이지 요소 (광고 스크립트, 사진 설명, 저작권 문구, 관련 기사, 음성 듣기/구독 버튼)
+BOILERPLATE = [
+    "googletag", "loadAd", "Ad.", "자료사진", "중앙포토", "민주노동당 제공", "oneshot@donga.com", "저작권", "Copyright", "관련",
+    "광고", "기사를 읽어드립니다", "audio element", "구독중", "이미지 확대", "크게보기", "제보는",
+]
+
+
+def load_fixture(host):
+    with open(os.path.join(FIXTURE_DIR, host + ".html"), encoding="utf-8") as f:
+        html = f.read()
+    # 저장된 페이지의 canonical 주소로 추출 (수집할 때처럼 기사 페이지 호스트 기준)
+    return lxml.html.document_fromstring(html).xpath("//link[@rel='canonical']/@href")[0], html
+
+
+def test_every_site_has_a_fixture():
+    hosts = {name[:-5] for name in os.listdir(FIXTURE_DIR) if name.endswith(".html")}
+    assert hosts == set(SITE_SELECTORS)
+
+
+@pytest.mark.parametrize("host", sorted(SITE_SELECTORS))
+def test_site_selectors_extract_the_article(host):
+    url, html = load_fixture(host)
+    assert url.split("/")[2] == host  # 피드 호스트가 아니라 기사 페이지 호스트
+
+    title, content, name, elapsed = extract_from_html(url, html)
+
+    assert name == "selectors"
+    assert title == TITLES[host]
+    assert len(content) >= MIN_BODY_LENGTH
+    assert not [text for text in BOILERPLATE if text in content]
+    # 같은 문단이 두 번 들어가지 않음 (바깥 요소와 안쪽 문단이 함께 선택되는 경우)
+    lines = content.split("\n")
+    assert len(lines) == len(set(lines))
+
+
+# ✅ 피드에 전체 본문이 있으면 페이지 없이 추출, 요약문뿐이면 None (페이지를 받아야 함)
+def test_feed_extractor_uses_embedded_content_only_when_long_enough():
+    _, html = load_fixture("www.hankookilbo.com")
+    body = "".join(lxml.html.tostring(p, encoding="unicode") for p in lxml.html.fromstring(html).cssselect("p.editor-p"))
+    entry = {"title": TITLES["www.hankookilbo.com"], "link": "https://www.hankookilbo.com/", "content": [{"value": body}]}
+
+    title, content, name = extract_from_feed(entry)
+    assert name == "embedded" and title == entry["title"] and content == html_to_text(body)
+    assert extract_from_feed({"title": "제목", "summary": "요약", "content": [{"value": "<p>짧은 요약</p>"}]}) is None
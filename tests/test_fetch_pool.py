@@ -0,0 +1,123 @@
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+import requests
+
+from fetch_pool import HostLimitedPool, DeadlineExceeded, host_of
+
+
+# ✅ 응답마다 delay초 걸리는 로컬 가짜 언론사 서버 (포트가 다르면 다른 호스트로 취급됨)
+class SlowHost:
+    def __init__(self, delay):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        host = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with host._lock:
+                    host.active += 1
+                    host.max_active = max(host.max_active, host.active)
+                time.sleep(host.delay)
+                with host._lock:
+                    host.active -= 1
+                body = self.path.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def fetch(url):
+    return requests.get(url, timeout=5).text
+
+
+# 호스트들의 기사 URL을 번갈아 섞은 목록 (입력 순서가 호스트 순서와 다르도록)
+def interleaved_urls(counts):
+    return [
+        f"{host.base_url}/article/{i}"
+        for i in range(max(counts.values())) for host, count in counts.items() if i < count
+    ]
+
+
+# ✅ 전체 시간은 요청 시간의 합이 아니라 가장 느린 호스트의 시간을 따라감
+def test_elapsed_follows_the_slowest_host():
+    with SlowHost(0.6) as slow, SlowHost(0.1) as fast_a, SlowHost(0.1) as fast_b:
+        urls = interleaved_urls({slow: 2, fast_a: 4, fast_b: 4})
+        sequential = sum(0.6 if url.startswith(slow.base_url) else 0.1 for url in urls)
+
+        started = time.monotonic()
+        results = HostLimitedPool(max_workers=8, per_host=2).map(fetch, urls, url_of=lambda url: url)
+        elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.6
+    assert elapsed < 0.6 + 0.4 < sequential
+    assert [error for _, error in results] == [None] * len(urls)
+    # 결과는 끝난 순서가 아니라 입력 순서대로
+    assert [result for result, _ in results] == [urlsplit(url).path for url in urls]
+    assert max(host.max_active for host in (slow, fast_a, fast_b)) <= 2
+
+
+# ✅ 호스트별 동시 요청 수 제한 (한 호스트에 몰린 작업도 per_host개씩만 실행)
+def test_per_host_limit():
+    with SlowHost(0.1) as host:
+        urls = [f"{host.base_url}/article/{i}" for i in range(6)]
+        results = HostLimitedPool(max_workers=8, per_host=2).map(fetch, urls, url_of=lambda url: url)
+    assert host.max_active == 2
+    assert [result for result, _ in results] == [f"/article/{i}" for i in range(6)]
+
+
+# ✅ 마감 시간이 지나면 느린 호스트의 작업(실행 중 + 대기 중)은 DeadlineExceeded로 표시되고 빠른 호스트 결과는 유지
+def test_deadline_marks_unfinished_jobs():
+    with SlowHost(1.0) as slow, SlowHost(0.05) as fast:
+        urls = interleaved_urls({slow: 3, fast: 3})
+        progress = []
+        pool = HostLimitedPool(max_workers=8, per_host=2, deadline=time.monotonic() + 0.4)
+
+        started = time.monotonic()
+        results = pool.map(fetch, urls, url_of=lambda url: url, on_done=lambda done, total: progress.append(done))
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.4 + 0.3  # 느린 작업이 끝나기를 기다리지 않음
+    for url, (result, error) in zip(urls, results):
+        if host_of(url) == host_of(slow.base_url):
+            assert result is None and isinstance(error, DeadlineExceeded)
+            assert str(error) == url
+        else:
+            assert error is None and result == urlsplit(url).path
+    assert progress == [1, 2, 3]
+
+
+# ✅ 작업 중 발생한 예외는 해당 위치에 (None, 예외)로 반환되고 다른 작업에는 영향 없음
+def test_errors_are_returned_in_place():
+    def job(url):
+        if url.endswith("/1"):
+            raise ValueError(url)
+        return url
+
+    urls = [f"http://example.com/{i}" for i in range(3)]
+    results = HostLimitedPool(max_workers=2, per_host=2).map(job, urls, url_of=lambda url: url)
+    assert results[0] == (urls[0], None) and results[2] == (urls[2], None)
+    assert results[1][0] is None and isinstance(results[1][1], ValueError)
+
+
+def test_empty_input():
+    assert HostLimitedPool().map(fetch, [], url_of=lambda url: url) == []
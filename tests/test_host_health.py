@@ -0,0 +1,74 @@
+import os
+import importlib
+
+import pytest
+
+from fetch_cache import FetchCache
+from host_health import HostHealth, CircuitOpen
+
+URL = "https://www.yna.co.kr/view/1"
+HOST = "www.yna.co.kr"
+
+
+# news_collect는 가져올 때 현재 폴더의 scripts/에 캐시와 로그를 만들므로 임시 폴더에서 가져옴
+@pytest.fixture
+def news_collect(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("scripts")
+    module = importlib.import_module("news_collect")
+    monkeypatch.setattr(module, "fetch_cache", FetchCache(cache_dir=str(tmp_path / "fetch_cache")))
+    monkeypatch.setattr(module, "host_health", HostHealth(path=str(tmp_path / "host_health.json"), threshold=1, cooldown=0))
+    return module
+
+
+# ✅ 쿨다운이 지난 뒤에는 프로브 하나만 보내고, 그동안의 요청은 건너뛴 것으로 셈
+def test_half_open_allows_a_single_probe(tmp_path):
+    health = HostHealth(path=str(tmp_path / "host_health.json"), threshold=2, cooldown=0)
+    health.record_failure(HOST, 0.5)
+    assert health.allow(HOST)
+    health.record_failure(HOST, 0.5)
+    assert health.open_circuits() == [HOST]
+
+    assert health.allow(HOST)          # 프로브
+    assert not health.allow(HOST)      # 프로브 결과가 나오기 전까지는 건너뜀
+    assert health.total_saved_seconds() == pytest.approx(0.5)
+    health.record_success(HOST, 0.1)
+    assert health.open_circuits() == [] and health.allow(HOST)
+
+    health.reset_stats()
+    assert health.total_saved_seconds() == 0
+
+
+# ✅ 프로브 요청이 성공/실패 기록 없이 예외로 끝나도 호스트가 half-open 상태로 남지 않음
+def test_probe_that_dies_without_recording_is_released(news_collect, monkeypatch):
+    health = news_collect.host_health
+    health.record_failure(HOST, 0.5)
+    assert health.open_circuits() == [HOST]
+
+    def broken_get(*args, **kwargs):
+        raise UnicodeError("잘못된 주소")  # requests.RequestException이 아닌 예외
+
+    monkeypatch.setattr(news_collect.requests, "get", broken_get)
+    with pytest.raises(UnicodeError):
+        news_collect.fetch_page(URL)
+
+    # 다음 요청이 다시 프로브로 나가고, 성공하면 서킷이 닫힘
+    class Response:
+        encoding = "utf-8"
+        text = "<html></html>"
+
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(news_collect.requests, "get", lambda *args, **kwargs: Response())
+    assert news_collect.fetch_page(URL) == "<html></html>"
+    assert health.open_circuits() == []
+
+
+def test_open_circuit_skips_the_request(news_collect, monkeypatch):
+    news_collect.host_health.cooldown = 60
+    news_collect.host_health.record_failure(HOST, 0.5)
+    monkeypatch.setattr(news_collect.requests, "get", lambda *args, **kwargs: pytest.fail("요청하면 안 됨"))
+    with pytest.raises(CircuitOpen):
+        news_collect.fetch_page(URL)
+    assert news_collect.host_health.skipped[HOST] == 1
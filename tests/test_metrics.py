@@ -0,0 +1,33 @@
+from fetch_cache import FetchCache
+from metrics import Metrics
+
+
+def counter_values(metrics):
+    _, counters = metrics.snapshot()
+    return {c["name"]: c["value"] for c in counters}
+
+
+# ✅ 캐시 적중/미적중은 FetchCache 통계 하나만 세고, 계측 결과는 그 값을 그대로 읽음
+def test_fetch_cache_counters_are_read_not_recounted(tmp_path):
+    cache = FetchCache(cache_dir=str(tmp_path / "fetch_cache"))
+    metrics = Metrics()
+    metrics.add_source("fetch_cache", lambda: cache.stats)
+    metrics.count("page_errors", host="www.yna.co.kr")
+
+    cache.put_page("https://www.yna.co.kr/view/1", "<html></html>")
+    assert cache.get_page("https://www.yna.co.kr/view/1") == "<html></html>"
+    assert cache.get_page("https://www.yna.co.kr/view/1") == "<html></html>"
+    assert cache.get_page("https://www.yna.co.kr/view/2") is None
+
+    values = counter_values(metrics)
+    assert values["fetch_cache_page_hits"] == cache.stats["page_hits"] == 2
+    assert values["fetch_cache_page_misses"] == 1
+    assert values["page_errors"] == 1
+    assert "summarizebot_fetch_cache_page_hits_total 2" in metrics.prometheus_text()
+    assert "fetch_cache_page_hits=2" in metrics.summary_table()
+
+    # 실행마다 둘 다 초기화하면 다음 실행은 0부터 (등록한 출처는 유지)
+    metrics.reset()
+    cache.reset_stats()
+    values = counter_values(metrics)
+    assert values["fetch_cache_page_hits"] == 0 and "page_errors" not in values
@@ -0,0 +1,186 @@
+import json
+import time
+import asyncio
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import openai
+import pytest
+
+from article_catalog import ArticleCatalog
+from summary_cache import SummaryCache, summary_key
+from presummarize import presummarize, run_presummarize, load_pending, Budget
+
+USAGE = {"prompt_tokens": 80, "completion_tokens": 20, "total_tokens": 100}
+
+
+# ✅ 응답 지연과 429(Retry-After)를 흉내 내는 로컬 OpenAI 호환 서버 (chat.completions, 스트리밍 아님)
+# - rate_limited: 처음 이 수만큼의 요청에 429 응답
+# - failing: 본문에 이 문자열이 들어 있는 요청은 항상 500 응답
+class FakeOpenAIServer:
+    def __init__(self, latency=0.0, rate_limited=0, retry_after=0.05, failing=None):
+        self.latency = latency
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
+        self.failing = failing
+        self.requests = 0
+        self.throttled = 0
+        self.arrivals = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                prompt = body["messages"][0]["content"]
+                with server._lock:
+                    server.requests += 1
+                    server.arrivals.append(time.monotonic())
+                    throttle = server.throttled < server.rate_limited
+                    if throttle:
+                        server.throttled += 1
+                if throttle:
+                    self._reply(429, {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}})
+                    return
+                if server.failing and server.failing in prompt:
+                    self._reply(500, {"error": {"message": "Internal error", "type": "server_error"}})
+                    return
+                time.sleep(server.latency)
+                self._reply(200, {
+                    "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": body["model"],
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": f"요약 {len(prompt)} "}}],
+                    "usage": USAGE,
+                })
+
+            def _reply(self, status, payload):
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    if status != 200:
+                        self.send_header("Retry-After", str(server.retry_after))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # 중단된 실행이 끊은 연결
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_articles(count):
+    return [
+        {"id": f"article-{i}", "title": f"제목 {i}", "content": f"기사 본문 {i} " * 20, "source": "연합뉴스",
+         "category": "사회", "date": "2025-05-12", "published_ts": 1747008000.0 + i, "keywords": []}
+        for i in range(count)
+    ]
+
+
+def run(server, articles, cache, checkpoint_file, timeout=None, **options):
+    async def main():
+        client = openai.AsyncOpenAI(base_url=server.base_url, api_key="test", max_retries=0)
+        try:
+            job = presummarize(articles, cache, client, checkpoint_file=checkpoint_file, **options)
+            return await (asyncio.wait_for(job, timeout) if timeout else job)
+        finally:
+            await client.close()
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SummaryCache(path=str(tmp_path / "summary_cache.db"))
+    yield cache
+    cache.close()
+
+
+# ✅ 429를 받으면 Retry-After만큼 기다렸다가 다시 요청해 모두 요약
+def test_retries_after_rate_limit(cache, tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    articles = make_articles(4)
+    with FakeOpenAIServer(latency=0.05, rate_limited=3, retry_after=0.3) as server:
+        started = time.monotonic()
+        stats = run(server, articles, cache, checkpoint, concurrency=2, requests_per_minute=6000)
+        elapsed = time.monotonic() - started
+
+    assert stats["summarized"] == 4 and stats["failed"] == 0 and stats["pending"] == 0
+    assert server.throttled == 3 and server.requests == 4 + 3
+    assert elapsed >= 0.3  # Retry-After를 지킴
+    assert all(cache.peek(summary_key(a["content"])) for a in articles)
+    assert load_pending(checkpoint) == []
+    assert stats["tokens"] == 4 * USAGE["total_tokens"]
+
+
+# ✅ 분당 요청 수 제한: 동시 작업 수와 관계없이 요청 간격이 유지됨
+def test_rate_limiter_spaces_requests(cache, tmp_path):
+    with FakeOpenAIServer() as server:
+        run(server, make_articles(5), cache, str(tmp_path / "checkpoint.json"), concurrency=5, requests_per_minute=600)
+    gaps = [b - a for a, b in zip(server.arrivals, server.arrivals[1:])]
+    assert len(gaps) == 4 and min(gaps) >= 0.08
+
+
+# ✅ 재시도를 다 써도 실패한 기사는 체크포인트에 남음
+def test_failed_article_stays_pending(cache, tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    articles = make_articles(3)
+    with FakeOpenAIServer(retry_after=0, failing="기사 본문 1 ") as server:
+        stats = run(server, articles, cache, checkpoint, requests_per_minute=6000)
+    assert stats["summarized"] == 2 and stats["failed"] == 1
+    assert load_pending(checkpoint) == ["article-1"]
+
+
+# ✅ 예산을 다 쓰면 멈추고, 다음 실행은 체크포인트에 남은 기사만 카탈로그에서 읽어 이어서 요약
+def test_stops_at_budget_and_resumes_from_checkpoint(tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    cache_file = str(tmp_path / "summary_cache.db")
+    articles = make_articles(5)
+    catalog = ArticleCatalog(str(tmp_path / "catalog.db"))
+    catalog.upsert_articles(articles)
+
+    with FakeOpenAIServer(latency=0.02) as server:
+        cache = SummaryCache(cache_file)
+        budget = Budget(max_tokens=250)
+        stats = run(server, articles, cache, checkpoint, concurrency=1, requests_per_minute=6000, budget=budget)
+        cache.close()
+        assert stats["summarized"] == 3 and stats["skipped_budget"] == 2
+        assert budget.exhausted() and server.requests == 3
+        assert load_pending(checkpoint) == ["article-3", "article-4"]
+
+        resumed = run_presummarize(
+            [], catalog, api_key="test", base_url=server.base_url, cache_file=cache_file,
+            checkpoint_file=checkpoint, requests_per_minute=6000,
+        )
+    catalog.close()
+
+    assert resumed["summarized"] == 2 and resumed["pending"] == 0
+    assert server.requests == 5  # 이미 요약한 기사는 다시 요청하지 않음
+    assert load_pending(checkpoint) == []
+    cache = SummaryCache(cache_file)
+    assert all(cache.peek(summary_key(a["content"])) for a in articles)
+    cache.close()
+
+
+# ✅ 실행이 중간에 끊겨도(Ctrl-C/프로세스 종료) 끝나지 않은 기사가 체크포인트에 남음
+def test_interrupted_run_leaves_unfinished_articles_in_checkpoint(cache, tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    articles = make_articles(4)
+    with FakeOpenAIServer(latency=0.3) as server:
+        with pytest.raises((asyncio.TimeoutError, TimeoutError)):
+            run(server, articles, cache, checkpoint, timeout=0.45, concurrency=1, requests_per_minute=6000)
+
+    assert load_pending(checkpoint) == ["article-1", "article-2", "article-3"]
+    assert cache.peek(summary_key(articles[0]["content"])) is not None
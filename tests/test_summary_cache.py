@@ -0,0 +1,136 @@
+import time
+import threading
+
+import pytest
+
+from summary_cache import SummaryCache, summary_key
+
+
+# 호출 횟수를 세는 가짜 요약 생성기 (delay초 걸리고, fail이면 예외)
+class CountingGenerator:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, text="요약"):
+        def generate():
+            with self._lock:
+                self.calls += 1
+            time.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("API 오류")
+            return text
+        return generate
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SummaryCache(path=str(tmp_path / "summary_cache.db"), max_entries=3)
+    yield cache
+    cache.close()
+
+
+def test_second_call_is_a_hit(cache):
+    generator = CountingGenerator()
+    key = summary_key("기사 본문")
+
+    assert cache.get_or_create(key, generator("첫 요약")) == "첫 요약"
+    assert cache.get_or_create(key, generator("다른 요약")) == "첫 요약"
+    assert generator.calls == 1
+    assert cache.stats == {"hits": 1, "misses": 1, "coalesced": 0, "evicted": 0}
+    assert cache.hit_rate() == 0.5
+
+
+# ✅ 최대 개수를 넘으면 가장 오래 사용하지 않은 요약부터 삭제 (조회하면 최근 사용으로 갱신)
+def test_least_recently_used_entry_is_evicted(cache):
+    generator = CountingGenerator()
+    keys = [summary_key(f"기사 {i}") for i in range(4)]
+    for key in keys[:3]:
+        cache.get_or_create(key, generator(key))
+        time.sleep(0.01)
+    cache.get_or_create(keys[0], generator())  # 첫 기사를 다시 조회 → 가장 오래된 것은 keys[1]
+    time.sleep(0.01)
+
+    cache.get_or_create(keys[3], generator(keys[3]))
+
+    assert cache.peek(keys[1]) is None
+    assert [cache.peek(key) for key in (keys[0], keys[2], keys[3])] == [keys[0], keys[2], keys[3]]
+    assert cache.stats["evicted"] == 1
+    assert generator.calls == 4
+
+
+# ✅ 같은 키를 동시에 요청하면 생성기는 한 번만 호출되고 모두 같은 결과를 받음
+def test_concurrent_callers_generate_once(cache):
+    generator = CountingGenerator(delay=0.2)
+    key = summary_key("기사 본문")
+    callers = 8
+    barrier = threading.Barrier(callers)
+    results = []
+
+    def request():
+        barrier.wait()
+        results.append(cache.get_or_create(key, generator("공유 요약")))
+
+    threads = [threading.Thread(target=request) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert generator.calls == 1
+    assert results == ["공유 요약"] * callers
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] + cache.stats["coalesced"] == callers - 1
+
+
+# ✅ 생성이 실패하면 기다리던 요청도 같은 예외를 받고, 아무것도 저장되지 않으며 다음 요청이 다시 생성
+def test_failed_generation_is_shared_and_not_cached(cache):
+    failing = CountingGenerator(delay=0.2, fail=True)
+    key = summary_key("기사 본문")
+    callers = 4
+    barrier = threading.Barrier(callers)
+    errors = []
+
+    def request():
+        barrier.wait()
+        try:
+            cache.get_or_create(key, failing())
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=request) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert failing.calls == 1
+    assert len(errors) == callers and len({id(e) for e in errors}) == 1
+    assert cache.peek(key) is None and not cache._inflight
+
+    generator = CountingGenerator()
+    assert cache.get_or_create(key, generator("다시 생성")) == "다시 생성"
+    assert generator.calls == 1
+
+
+# ✅ claim/finish를 직접 쓰는 경우 (스트리밍 요약): 생성 담당만 finish를 호출하고 나머지는 Future를 기다림
+def test_claim_and_finish(cache):
+    key = summary_key("기사 본문")
+    summary, leader_future, leader = cache.claim(key)
+    assert summary is None and leader
+
+    summary, waiter_future, follower = cache.claim(key)
+    assert summary is None and not follower and waiter_future is leader_future
+
+    cache.finish(key, leader_future, error=ValueError("잘린 응답"))
+    with pytest.raises(ValueError):
+        waiter_future.result(timeout=1)
+    assert cache.peek(key) is None and not cache._inflight
+
+    summary, future, leader = cache.claim(key)
+    assert leader
+    cache.finish(key, future, "완성된 요약")
+    assert future.result(timeout=1) == "완성된 요약"
+    assert cache.claim(key) == ("완성된 요약", None, False)
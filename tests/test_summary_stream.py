@@ -0,0 +1,144 @@
+import json
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+from openai import OpenAI
+
+from summary_cache import SummaryCache, summary_key
+from summary_stream import SummaryStream, IncompleteSummary, stream_through_cache
+
+PARTS = ["첫째 문장입니다. ", "둘째 문장입니다. ", "셋째 문장입니다."]
+
+
+# ✅ OpenAI chat.completions 스트리밍(SSE) 형식으로 응답하는 로컬 가짜 서버
+class FakeStreamingServer:
+    def __init__(self, parts=PARTS, finish_reason="stop", chunk_delay=0.0):
+        self.parts = parts
+        self.finish_reason = finish_reason
+        self.chunk_delay = chunk_delay
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with server._lock:
+                    server.requests += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                for part in server.parts:
+                    self._send({"content": part}, None)
+                    time.sleep(server.chunk_delay)
+                self._send({}, server.finish_reason)
+                self.wfile.write(b"data: [DONE]\n\n")
+
+            def _send(self, delta, finish_reason):
+                chunk = {
+                    "id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0, "model": "gpt-4o",
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.client = OpenAI(
+            base_url=f"http://127.0.0.1:{self.httpd.server_address[1]}/v1", api_key="test", max_retries=0
+        )
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SummaryCache(path=str(tmp_path / "summary_cache.db"))
+    yield cache
+    cache.close()
+
+
+def test_stream_yields_tokens_and_logs_latency(tmp_path):
+    log_file = str(tmp_path / "latency.jsonl")
+    with FakeStreamingServer() as server:
+        stream = SummaryStream(server.client, "기사 본문", log_file=log_file)
+        assert list(stream.tokens()) == PARTS
+    assert stream.status == "completed"
+    assert stream.text == "".join(PARTS).strip()
+    assert stream.ttft is not None and stream.ttft <= stream.total
+    with open(log_file, encoding="utf-8") as f:
+        entry = json.loads(f.read())
+    assert entry["status"] == "completed" and entry["chars"] == len(stream.text)
+
+
+def test_truncated_stream_is_not_cached(cache, tmp_path):
+    key = summary_key("기사 본문")
+    with FakeStreamingServer(finish_reason="length") as server:
+        with pytest.raises(IncompleteSummary):
+            stream_through_cache(cache, key, server.client, "기사 본문", log_file=str(tmp_path / "latency.jsonl"))
+    assert cache.peek(key) is None
+    assert not cache._inflight  # 실패한 키는 다음 요청이 다시 생성할 수 있도록 풀림
+
+
+# ✅ 같은 기사를 동시에 요청하면 스트리밍(API 호출)은 한 번만, 나머지는 저장된 결과를 받음
+def test_concurrent_requests_share_one_stream(cache, tmp_path):
+    key = summary_key("기사 본문")
+    users = 5
+    barrier = threading.Barrier(users)
+    results = [None] * users
+
+    with FakeStreamingServer(chunk_delay=0.1) as server:
+        def request(i):
+            barrier.wait()
+            results[i] = stream_through_cache(
+                cache, key, server.client, "기사 본문", log_file=str(tmp_path / "latency.jsonl")
+            )[0]
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+    assert server.requests == 1
+    assert results == ["".join(PARTS).strip()] * users
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] + cache.stats["coalesced"] == users - 1
+    assert cache.peek(key) == results[0]
+
+
+# ✅ 먼저 요청한 쪽의 스트리밍이 미완성으로 끝나면 기다리던 요청도 같은 오류를 받고 키는 풀림
+def test_waiters_receive_the_leader_failure(cache, tmp_path):
+    key = summary_key("기사 본문")
+    users = 3
+    barrier = threading.Barrier(users)
+    errors = []
+
+    with FakeStreamingServer(finish_reason="length", chunk_delay=0.1) as server:
+        def request():
+            barrier.wait()
+            try:
+                stream_through_cache(cache, key, server.client, "기사 본문", log_file=str(tmp_path / "latency.jsonl"))
+            except IncompleteSummary as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=request) for _ in range(users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+    assert server.requests == 1
+    assert len(errors) == users
+    assert not cache._inflight
+    assert cache.peek(key) is None
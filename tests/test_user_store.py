@@ -0,0 +1,98 @@
+import os
+import json
+import multiprocessing
+
+from user_store import UserStore
+
+WORKERS = 6
+WRITES = 30
+
+
+def open_store(path):
+    return UserStore(path=path, legacy_users_file=os.path.join(os.path.dirname(path), "users.json"))
+
+
+# 프로세스마다 같은 사용자명으로 동시 가입 + 자기 계정에 스크랩/요약 추가·삭제를 반복
+def writer(path, worker, barrier, results):
+    store = open_store(path)
+    barrier.wait()
+    won_signup = store.create_user("shared-user", "hash") is not None
+    user_id = store.create_user(f"user-{worker}", "hash")
+    for i in range(WRITES):
+        store.add_scrap(user_id, f"article-{i}")
+        store.set_summary(user_id, f"article-{i}", f"key-{worker}-{i}")
+        if i % 3 == 0:
+            store.remove_scrap(user_id, f"article-{i}")
+    store.close()
+    results.put((worker, user_id, won_signup))
+
+
+def opener(path, barrier, results):
+    barrier.wait()
+    store = open_store(path)
+    results.put(store.migrated)
+    store.close()
+
+
+def run_processes(target, args_of):
+    ctx = multiprocessing.get_context()
+    barrier = ctx.Barrier(WORKERS)
+    results = ctx.Queue()
+    processes = [ctx.Process(target=target, args=args_of(i) + (barrier, results)) for i in range(WORKERS)]
+    for process in processes:
+        process.start()
+    collected = [results.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+    return collected
+
+
+# ✅ 여러 프로세스가 동시에 써도 유실되는 변경이 없고, 같은 사용자명 가입은 하나만 성공
+def test_concurrent_writers_lose_nothing(tmp_path):
+    path = str(tmp_path / "user_data.db")
+    open_store(path).close()
+
+    results = run_processes(writer, lambda worker: (path, worker))
+
+    store = open_store(path)
+    expected_scraps = [f"article-{i}" for i in range(WRITES) if i % 3 != 0]
+    lost_writes = 0
+    for worker, user_id, _ in results:
+        scraps = store.scraps(user_id)
+        summaries = store.summaries(user_id)
+        lost_writes += len(set(expected_scraps) - set(scraps)) + (WRITES - len(summaries))
+        assert sorted(scraps) == sorted(expected_scraps)
+        assert summaries == {f"article-{i}": f"key-{worker}-{i}" for i in range(WRITES)}
+    assert lost_writes == 0
+    assert sum(won for _, _, won in results) == 1
+    assert store.get_user("shared-user") is not None
+    store.close()
+
+
+# ✅ 기존 JSON 파일은 동시에 연 여러 프로세스 중 하나만 가져오고, 이후 변경을 다시 덮어쓰지 않음
+def test_legacy_json_is_migrated_once(tmp_path):
+    path = str(tmp_path / "user_data.db")
+    with open(tmp_path / "users.json", "w", encoding="utf-8") as f:
+        json.dump({"alice": {"password": "hash", "user_id": "uid-alice"}}, f)
+    os.makedirs(tmp_path / "uid-alice")
+    with open(tmp_path / "uid-alice" / "scrap.json", "w", encoding="utf-8") as f:
+        json.dump(["a1", "a2"], f)
+    with open(tmp_path / "uid-alice" / "summary.json", "w", encoding="utf-8") as f:
+        json.dump({"a1": "요약 키"}, f, ensure_ascii=False)
+
+    migrated = run_processes(opener, lambda worker: (path,))
+    assert sorted(migrated) == [False] * (WORKERS - 1) + [True]
+
+    store = open_store(path)
+    assert not store.migrated
+    assert store.get_user("alice")["user_id"] == "uid-alice"
+    assert store.scraps("uid-alice") == ["a1", "a2"]
+    assert store.summaries("uid-alice") == {"a1": "요약 키"}
+    store.remove_scrap("uid-alice", "a1")
+    store.close()
+
+    # 다시 열어도 JSON 파일의 스크랩이 되살아나지 않음
+    store = open_store(path)
+    assert store.scraps("uid-alice") == ["a2"]
+    store.close()